@@ -11,7 +11,15 @@ import logging
 
 from src.campaign_generator import CampaignGenerator
 from src.content_optimizer import ContentOptimizer
-from src.external_apis import PicaClient, TavusClient, LingoClient
+from src.external_apis import (
+    PicaClient,
+    TavusClient,
+    LingoClient,
+    close_shared_transport,
+    health_all,
+    init_all,
+    to_data_url,
+)
 from src.psychology_engine import PsychologyEngine
 from src.config import Config
 
@@ -132,9 +140,7 @@ async def startup_event():
         await psychology_engine.initialize()
         
         # Initialize external API clients
-        await pica_client.initialize()
-        await tavus_client.initialize()
-        await lingo_client.initialize()
+        await init_all(pica_client, tavus_client, lingo_client)
         
         logger.info("Campaign Maker service started successfully")
     except Exception as e:
@@ -152,6 +158,7 @@ async def shutdown_event():
         await pica_client.close()
         await tavus_client.close()
         await lingo_client.close()
+        await close_shared_transport()
         
         logger.info("Campaign Maker service stopped")
     except Exception as e:
@@ -165,11 +172,7 @@ async def health_check():
         "service": "campaign-maker",
         "timestamp": datetime.utcnow(),
         "openai_connected": await campaign_generator.health_check(),
-        "external_apis": {
-            "pica": await pica_client.health_check(),
-            "tavus": await tavus_client.health_check(),
-            "lingo": await lingo_client.health_check()
-        }
+        "external_apis": await health_all(pica_client, tavus_client, lingo_client)
     }
 
 @app.post("/generate-campaign", response_model=CampaignResponse)
@@ -364,7 +367,7 @@ async def _generate_creative_assets(
                 assets.append({
                     "type": "image",
                     "variant_id": variant.variant_id,
-                    "url": image_asset["url"],
+                    "url": to_data_url(image_asset),
                     "dimensions": image_asset["dimensions"],
                     "format": "png"
                 })
@@ -380,7 +383,7 @@ async def _generate_creative_assets(
             
             assets.append({
                 "type": "email_header",
-                "url": header_image["url"],
+                "url": to_data_url(header_image),
                 "dimensions": header_image["dimensions"],
                 "format": "png"
             })
@@ -436,6 +439,12 @@ async def _generate_creative_assets_standalone(
                 else:
                     continue
                 
+                # Placeholders carry raw PNG bytes; encode them for the JSON response
+                if "png_bytes" in asset:
+                    url = to_data_url(asset)
+                    asset = {key: value for key, value in asset.items() if key != "png_bytes"}
+                    asset["url"] = url
+                
                 assets.append(asset)
         
         return assets
@@ -1,17 +1,225 @@
 import asyncio
+import hashlib
 import json
 import logging
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Union
 import httpx
+import orjson
+import redis.asyncio as redis
 from datetime import datetime
 import base64
-from io import BytesIO
-from PIL import Image
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Gateway errors that are worth retrying before falling back to placeholders
+_RETRYABLE_STATUS_CODES = {502, 503, 504}
+
+# Per-attempt timeout for retried calls; keeps total wall-clock bounded across attempts
+_RETRY_ATTEMPT_TIMEOUT = httpx.Timeout(30.0, read=10.0)
+
+# Connection pool shared by the Pica, Tavus and Lingo clients (sockets, TLS sessions, DNS);
+# it makes no retries of its own, as retried calls already go through the @retry policy
+_TRANSPORT: Optional[httpx.AsyncHTTPTransport] = None
+
+def _shared_transport() -> httpx.AsyncHTTPTransport:
+    global _TRANSPORT
+    if _TRANSPORT is None:
+        _TRANSPORT = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=300, max_keepalive_connections=150)
+        )
+    return _TRANSPORT
+
+async def close_shared_transport():
+    """Close the shared connection pool once at service shutdown"""
+    global _TRANSPORT
+    if _TRANSPORT is not None:
+        await _TRANSPORT.aclose()
+        _TRANSPORT = None
+
+async def init_all(pica: "PicaClient", tavus: "TavusClient", lingo: "LingoClient"):
+    """Initialize the external API clients concurrently"""
+    await asyncio.gather(pica.initialize(), tavus.initialize(), lingo.initialize())
+
+async def health_all(
+    pica: "PicaClient",
+    tavus: "TavusClient",
+    lingo: "LingoClient"
+) -> Dict[str, bool]:
+    """Run the external API health checks concurrently"""
+    pica_ok, tavus_ok, lingo_ok = await asyncio.gather(
+        pica.health_check(), tavus.health_check(), lingo.health_check()
+    )
+    return {"pica": pica_ok, "tavus": tavus_ok, "lingo": lingo_ok}
+
+def _is_retryable_response(response: httpx.Response) -> bool:
+    return response.status_code in _RETRYABLE_STATUS_CODES
+
+def _last_attempt_outcome(retry_state):
+    # Hand the final response (or exception) back to the caller once attempts are exhausted
+    return retry_state.outcome.result()
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=0.5, max=8),
+    retry=(
+        retry_if_exception_type((httpx.TransportError, httpx.ReadTimeout))
+        | retry_if_result(_is_retryable_response)
+    ),
+    retry_error_callback=_last_attempt_outcome,
+)
+async def _request_with_retry(
+    client: httpx.AsyncClient,
+    method: str,
+    path: str,
+    **kwargs
+) -> httpx.Response:
+    """
+    Issue a request, retrying transient network errors and 502/503/504 responses
+    with exponential backoff and jitter
+    """
+    kwargs.setdefault("timeout", _RETRY_ATTEMPT_TIMEOUT)
+    return await client.request(method, path, **kwargs)
+
+# Prebuilt #f0f0f0 placeholder PNGs (1-bit palette) for the sizes the campaign flow requests
+_PLACEHOLDER_PNG_1200x630 = base64.b64decode("iVBORw0KGgoAAAANSUhEUgAABLAAAAJ2AQMAAAB1jukfAAAAA1BMVEXw8PC7v12rAAAAc0lEQVR42u3BAQ0AAADCoPdPbQ43oAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAXg1zqQAB6RqMPAAAAABJRU5ErkJggg==")
+_PLACEHOLDER_PNG_600x200 = base64.b64decode("iVBORw0KGgoAAAANSUhEUgAAAlgAAADIAQMAAAAOUQ31AAAAA1BMVEXw8PC7v12rAAAAJUlEQVR42u3BAQEAAACCIP+vbkhAAQAAAAAAAAAAAAAAAADAjwE7YAABSaiFzAAAAABJRU5ErkJggg==")
+_PLACEHOLDER_PNG_640x360 = base64.b64decode("iVBORw0KGgoAAAANSUhEUgAAAoAAAAFoAQMAAAD9/NgSAAAAA1BMVEXw8PC7v12rAAAAMklEQVR42u3BAQ0AAADCoPdP7ewBFAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA3cegAATDOVLsAAAAASUVORK5CYII=")
+
+_STATIC_PLACEHOLDERS = {
+    (1200, 630): _PLACEHOLDER_PNG_1200x630,
+    (600, 200): _PLACEHOLDER_PNG_600x200,
+    (640, 360): _PLACEHOLDER_PNG_640x360,
+}
+
+async def _post_json(
+    client: httpx.AsyncClient,
+    path: str,
+    obj: Union[Dict[str, Any], bytes]
+) -> httpx.Response:
+    """
+    POST a JSON body serialized with orjson (or already-encoded bytes), with
+    transient-failure retries
+    """
+    return await _request_with_retry(
+        client,
+        "POST",
+        path,
+        content=obj if isinstance(obj, bytes) else orjson.dumps(obj),
+        headers={"Content-Type": "application/json"}
+    )
+
+def _json_template(constants: Dict[str, Any]) -> bytes:
+    """Pre-serialize constant request fields as an unterminated JSON object"""
+    return orjson.dumps(constants)[:-1]
+
+def _render_json(template: bytes, dynamic: Dict[str, Any]) -> bytes:
+    """Splice per-call fields onto a pre-serialized template"""
+    if not dynamic:
+        return template + b"}"
+    return template + b"," + orjson.dumps(dynamic)[1:]
+
+# Constant portions of request bodies, serialized once at import
+_SOCIAL_ELEMENTS_TEMPLATE = _json_template({
+    "theme": "partnership_collaboration",
+    "color_scheme": "professional_blue_purple"
+})
+_EMAIL_HEADER_ELEMENTS_TEMPLATE = _json_template({
+    "style": "email_header",
+    "branding": "professional"
+})
+_RESIZE_TEMPLATE = _json_template({
+    "format": "png",
+    "quality": 90
+})
+_VIDEO_PLACEHOLDER_TEMPLATE = _json_template({
+    "template": "partnership_announcement",
+    "voice": "professional_male",
+    "background": "corporate_office"
+})
+_VIDEO_PERSONALIZATION_TEMPLATE = _json_template({
+    "tone": "professional",
+    "duration": "60-90 seconds"
+})
+
+def _json_body(response: httpx.Response) -> Any:
+    """Decode a response body with orjson"""
+    return orjson.loads(response.content)
+
+# Above this many pixels the placeholder fill is spread across cores when numba is available
+_PARALLEL_FILL_MIN_PIXELS = 4_000_000
+
+@lru_cache(maxsize=1)
+def _parallel_fill_kernel():
+    """
+    Compile the multi-core fill kernel on first use; None when numba is not installed
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    
+    @numba.njit(parallel=True, cache=True)
+    def _fill(arr, value):
+        for i in numba.prange(arr.shape[0]):
+            arr[i, :, :] = value
+    
+    return _fill
+
+@lru_cache(maxsize=64)
+def _placeholder_png(width: int, height: int) -> bytes:
+    """
+    Render a solid placeholder PNG; output depends only on size
+    """
+    static_png = _STATIC_PLACEHOLDERS.get((width, height))
+    if static_png:
+        return static_png
+    
+    # Pillow is only needed for uncommon sizes, so keep it off the import path
+    from io import BytesIO
+    import numpy as np
+    from PIL import Image
+    
+    # A single memset-style fill beats PIL's per-pixel color initialisation
+    arr = np.empty((height, width, 3), dtype=np.uint8)
+    fill_kernel = _parallel_fill_kernel() if width * height > _PARALLEL_FILL_MIN_PIXELS else None
+    if fill_kernel is not None:
+        fill_kernel(arr, 240)
+    else:
+        arr.fill(240)
+    img = Image.fromarray(arr, 'RGB')
+    
+    # Solid fills gain nothing from heavy DEFLATE, so use the cheapest PNG settings.
+    # Installing pillow-simd in place of pillow speeds this encode up further.
+    buffer = BytesIO()
+    img.save(buffer, format='PNG', compress_level=1, optimize=False)
+    
+    return buffer.getvalue()
+
+@lru_cache(maxsize=64)
+def _png_data_url(png_bytes: bytes) -> str:
+    return f"data:image/png;base64,{base64.b64encode(png_bytes).decode()}"
+
+def to_data_url(image: Dict[str, Any]) -> str:
+    """
+    URL for an image asset, base64-encoding raw placeholder bytes only when needed
+    """
+    if image.get("url"):
+        return image["url"]
+    return _png_data_url(image["png_bytes"])
+
 class PicaClient:
     """
     Client for Pica API - AI-powered image generation and resizing
@@ -22,18 +230,27 @@ class PicaClient:
         self.client: Optional[httpx.AsyncClient] = None
         self.base_url = config.pica_base_url
         self.api_key = config.pica_api_key
+        
+        # In-flight resize requests keyed by (image_url, width, height, optimization)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        
+        # Fleet-wide cache of generated images
+        self._redis: Optional[redis.Redis] = None
+        self._cache_ttl_seconds = 86400
     
     async def initialize(self):
         """Initialize Pica client"""
         try:
             self.client = httpx.AsyncClient(
                 base_url=self.base_url,
+                transport=_shared_transport(),
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json"
                 },
                 timeout=30.0
             )
+            self._redis = redis.from_url(self.config.redis_url)
             
             logger.info("Pica client initialized successfully")
             
@@ -45,8 +262,11 @@ class PicaClient:
     async def close(self):
         """Close Pica client"""
         try:
-            if self.client:
-                await self.client.aclose()
+            # The transport is shared, so only drop this client's handle to it
+            self.client = None
+            if self._redis:
+                await self._redis.close()
+                self._redis = None
             logger.info("Pica client closed")
         except Exception as e:
             logger.error(f"Error closing Pica client: {e}")
@@ -70,7 +290,8 @@ class PicaClient:
         company_a: str,
         company_b: str,
         style: str = "modern_partnership",
-        dimensions: Dict[str, int] = None
+        dimensions: Dict[str, int] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Generate social media image for partnership announcement
@@ -79,29 +300,39 @@ class PicaClient:
             if not self.client:
                 return self._generate_placeholder_image(dimensions or {"width": 1200, "height": 630})
             
-            request_data = {
+            size = dimensions or {"width": 1200, "height": 630}
+            cache_key = self._image_cache_key(
+                "social", headline, company_a, company_b, style, f"{size.get('width')}x{size.get('height')}"
+            )
+            if use_cache:
+                cached = await self._get_cached_image(cache_key)
+                if cached is not None:
+                    return cached
+            
+            request_data = orjson.dumps({
                 "prompt": f"Professional partnership announcement between {company_a} and {company_b}. {headline}",
                 "style": style,
                 "dimensions": dimensions or {"width": 1200, "height": 630},
-                "elements": {
+                "elements": orjson.Fragment(_render_json(_SOCIAL_ELEMENTS_TEMPLATE, {
                     "headline": headline,
-                    "company_logos": [company_a, company_b],
-                    "theme": "partnership_collaboration",
-                    "color_scheme": "professional_blue_purple"
-                }
-            }
+                    "company_logos": [company_a, company_b]
+                }))
+            })
             
-            response = await self.client.post("/generate/social", json=request_data)
+            response = await _post_json(self.client, "/generate/social", request_data)
             
             if response.status_code == 200:
-                result = response.json()
-                return {
+                result = _json_body(response)
+                image = {
                     "url": result.get("image_url"),
                     "dimensions": dimensions or {"width": 1200, "height": 630},
                     "format": "png",
                     "style": style,
                     "generation_id": result.get("id")
                 }
+                if use_cache:
+                    await self._cache_image(cache_key, image)
+                return image
             else:
                 logger.warning(f"Pica social image generation failed: {response.status_code}")
                 return self._generate_placeholder_image(dimensions or {"width": 1200, "height": 630})
@@ -115,7 +346,8 @@ class PicaClient:
         company_a: str,
         company_b: str,
         theme: str = "partnership_announcement",
-        dimensions: Dict[str, int] = None
+        dimensions: Dict[str, int] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Generate email header image
@@ -124,27 +356,37 @@ class PicaClient:
             if not self.client:
                 return self._generate_placeholder_image(dimensions or {"width": 600, "height": 200})
             
-            request_data = {
+            size = dimensions or {"width": 600, "height": 200}
+            cache_key = self._image_cache_key(
+                "email", company_a, company_b, theme, f"{size.get('width')}x{size.get('height')}"
+            )
+            if use_cache:
+                cached = await self._get_cached_image(cache_key)
+                if cached is not None:
+                    return cached
+            
+            request_data = orjson.dumps({
                 "prompt": f"Email header for partnership between {company_a} and {company_b}",
                 "theme": theme,
                 "dimensions": dimensions or {"width": 600, "height": 200},
-                "elements": {
-                    "companies": [company_a, company_b],
-                    "style": "email_header",
-                    "branding": "professional"
-                }
-            }
+                "elements": orjson.Fragment(_render_json(_EMAIL_HEADER_ELEMENTS_TEMPLATE, {
+                    "companies": [company_a, company_b]
+                }))
+            })
             
-            response = await self.client.post("/generate/email-header", json=request_data)
+            response = await _post_json(self.client, "/generate/email-header", request_data)
             
             if response.status_code == 200:
-                result = response.json()
-                return {
+                result = _json_body(response)
+                image = {
                     "url": result.get("image_url"),
                     "dimensions": dimensions or {"width": 600, "height": 200},
                     "format": "png",
                     "theme": theme
                 }
+                if use_cache:
+                    await self._cache_image(cache_key, image)
+                return image
             else:
                 return self._generate_placeholder_image(dimensions or {"width": 600, "height": 200})
                 
@@ -165,31 +407,78 @@ class PicaClient:
             if not self.client:
                 return [self._generate_placeholder_image(dim) for dim in target_dimensions]
             
-            request_data = {
-                "source_url": image_url,
-                "target_dimensions": target_dimensions,
-                "optimization": optimization,
-                "format": "png",
-                "quality": 90
+            # Collapse duplicate sizes so the server only renders each once
+            unique_dimensions = {
+                (dim.get("width"), dim.get("height")): dim for dim in target_dimensions
             }
             
-            response = await self.client.post("/resize", json=request_data)
+            # Join resizes already in flight for the same asset and size
+            loop = asyncio.get_running_loop()
+            pending: Dict[tuple, asyncio.Future] = {}
+            owned: Dict[tuple, asyncio.Future] = {}
             
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("resized_images", [])
-            else:
-                return [self._generate_placeholder_image(dim) for dim in target_dimensions]
+            for size in unique_dimensions:
+                key = (image_url, *size, optimization)
+                future = self._inflight.get(key)
+                if future is None:
+                    future = loop.create_future()
+                    self._inflight[key] = future
+                    owned[size] = future
+                pending[size] = future
+            
+            try:
+                if owned:
+                    resized_images = await self._request_resize(
+                        image_url,
+                        [unique_dimensions[size] for size in owned],
+                        optimization
+                    )
+                    for future, image in zip(owned.values(), resized_images):
+                        future.set_result(image)
+            finally:
+                for size, future in owned.items():
+                    if not future.done():
+                        future.set_result(self._generate_placeholder_image(unique_dimensions[size]))
+                    self._inflight.pop((image_url, *size, optimization), None)
+            
+            results = {size: await future for size, future in pending.items()}
+            
+            # Expand back to the caller's original ordering, duplicates included
+            return [results[(dim.get("width"), dim.get("height"))] for dim in target_dimensions]
                 
         except Exception as e:
             logger.error(f"Image resizing failed: {e}")
             return [self._generate_placeholder_image(dim) for dim in target_dimensions]
     
+    async def _request_resize(
+        self,
+        image_url: str,
+        target_dimensions: List[Dict[str, int]],
+        optimization: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Issue a single resize call for a batch of distinct dimensions
+        """
+        request_data = _render_json(_RESIZE_TEMPLATE, {
+            "source_url": image_url,
+            "target_dimensions": target_dimensions,
+            "optimization": optimization
+        })
+        
+        response = await _post_json(self.client, "/resize", request_data)
+        
+        if response.status_code == 200:
+            result = _json_body(response)
+            return result.get("resized_images", [])
+        else:
+            return [self._generate_placeholder_image(dim) for dim in target_dimensions]
+    
     async def generate_image(
         self,
         brief: Dict[str, Any],
         dimensions: Dict[str, int],
-        style: str = "professional"
+        style: str = "professional",
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Generate image from content brief
@@ -198,6 +487,17 @@ class PicaClient:
             if not self.client:
                 return self._generate_placeholder_image(dimensions)
             
+            cache_key = self._image_cache_key(
+                "generic",
+                orjson.dumps(brief, option=orjson.OPT_SORT_KEYS).decode(),
+                style,
+                f"{dimensions.get('width')}x{dimensions.get('height')}"
+            )
+            if use_cache:
+                cached = await self._get_cached_image(cache_key)
+                if cached is not None:
+                    return cached
+            
             request_data = {
                 "prompt": brief.get("description", "Professional business image"),
                 "style": style,
@@ -205,17 +505,20 @@ class PicaClient:
                 "elements": brief.get("elements", {})
             }
             
-            response = await self.client.post("/generate", json=request_data)
+            response = await _post_json(self.client, "/generate", request_data)
             
             if response.status_code == 200:
-                result = response.json()
-                return {
+                result = _json_body(response)
+                image = {
                     "type": "image",
                     "url": result.get("image_url"),
                     "dimensions": dimensions,
                     "format": "png",
                     "style": style
                 }
+                if use_cache:
+                    await self._cache_image(cache_key, image)
+                return image
             else:
                 return self._generate_placeholder_image(dimensions)
                 
@@ -223,6 +526,39 @@ class PicaClient:
             logger.error(f"Image generation failed: {e}")
             return self._generate_placeholder_image(dimensions)
     
+    def _image_cache_key(self, kind: str, *parts: Any) -> str:
+        """
+        Build the Redis key for a generated image from its generation inputs
+        """
+        digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+        return f"pica:{kind}:{digest}"
+    
+    async def _get_cached_image(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a previously generated image; cache errors are treated as misses
+        """
+        if not self._redis:
+            return None
+        
+        try:
+            cached = await self._redis.get(cache_key)
+            return orjson.loads(cached) if cached else None
+        except Exception as e:
+            logger.warning(f"Pica cache read failed: {e}")
+            return None
+    
+    async def _cache_image(self, cache_key: str, image: Dict[str, Any]):
+        """
+        Store a generated image so other workers can reuse it
+        """
+        if not self._redis:
+            return
+        
+        try:
+            await self._redis.setex(cache_key, self._cache_ttl_seconds, orjson.dumps(image))
+        except Exception as e:
+            logger.warning(f"Pica cache write failed: {e}")
+    
     def _generate_placeholder_image(self, dimensions: Dict[str, int]) -> Dict[str, Any]:
         """
         Generate placeholder image when Pica is unavailable
@@ -231,16 +567,8 @@ class PicaClient:
             width = dimensions.get("width", 600)
             height = dimensions.get("height", 400)
             
-            # Create simple placeholder image
-            img = Image.new('RGB', (width, height), color='#f0f0f0')
-            
-            # Convert to base64 data URL
-            buffer = BytesIO()
-            img.save(buffer, format='PNG')
-            img_data = base64.b64encode(buffer.getvalue()).decode()
-            
             return {
-                "url": f"data:image/png;base64,{img_data}",
+                "png_bytes": _placeholder_png(int(width), int(height)),
                 "dimensions": dimensions,
                 "format": "png",
                 "placeholder": True
@@ -271,6 +599,7 @@ class TavusClient:
         try:
             self.client = httpx.AsyncClient(
                 base_url=self.base_url,
+                transport=_shared_transport(),
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json"
@@ -287,8 +616,8 @@ class TavusClient:
     async def close(self):
         """Close Tavus client"""
         try:
-            if self.client:
-                await self.client.aclose()
+            # The transport is shared, so only drop this client's handle to it
+            self.client = None
             logger.info("Tavus client closed")
         except Exception as e:
             logger.error(f"Error closing Tavus client: {e}")
@@ -320,24 +649,19 @@ class TavusClient:
             if not self.client:
                 return self._generate_video_placeholder(script)
             
-            request_data = {
+            request_data = _render_json(_VIDEO_PLACEHOLDER_TEMPLATE, {
                 "script": script,
                 "style": style,
-                "personalization": {
+                "personalization": orjson.Fragment(_render_json(_VIDEO_PERSONALIZATION_TEMPLATE, {
                     "company_a": company_a,
-                    "company_b": company_b,
-                    "tone": "professional",
-                    "duration": "60-90 seconds"
-                },
-                "template": "partnership_announcement",
-                "voice": "professional_male",
-                "background": "corporate_office"
-            }
+                    "company_b": company_b
+                }))
+            })
             
-            response = await self.client.post("/videos/create-placeholder", json=request_data)
+            response = await _post_json(self.client, "/videos/create-placeholder", request_data)
             
             if response.status_code == 200:
-                result = response.json()
+                result = _json_body(response)
                 return {
                     "placeholder_url": result.get("placeholder_url"),
                     "video_id": result.get("video_id"),
@@ -375,10 +699,14 @@ class TavusClient:
                 "quality": "hd"
             }
             
-            response = await self.client.post("/videos/generate", json=request_data)
+            response = await self.client.post(
+                "/videos/generate",
+                content=orjson.dumps(request_data),
+                headers={"Content-Type": "application/json"}
+            )
             
             if response.status_code == 200:
-                result = response.json()
+                result = _json_body(response)
                 return {
                     "video_url": result.get("video_url"),
                     "video_id": result.get("video_id"),
@@ -405,7 +733,7 @@ class TavusClient:
             response = await self.client.get(f"/videos/{video_id}/status")
             
             if response.status_code == 200:
-                return response.json()
+                return _json_body(response)
             else:
                 return {"status": "error", "message": "Failed to get status"}
                 
@@ -427,6 +755,56 @@ class TavusClient:
             "note": "Tavus integration required for actual video generation"
         }
 
+# Batch localization is split into chunks of this many requests, sent with bounded concurrency
+_LOCALIZATION_CHUNK_SIZE = 30
+_LOCALIZATION_MAX_CONCURRENCY = 8
+
+# Read-only fallback data used when Lingo is unavailable, built once at import
+_MOCK_LANGUAGE_PREFIXES = MappingProxyType({
+    "es": "[ES]",
+    "fr": "[FR]",
+    "de": "[DE]",
+    "it": "[IT]",
+    "pt": "[PT]",
+    "ja": "[JA]",
+    "ko": "[KO]",
+    "zh": "[ZH]"
+})
+
+_MOCK_INSIGHTS = MappingProxyType({
+    "es": MappingProxyType({
+        "communication_style": "Warm and personal",
+        "business_etiquette": "Relationship-focused",
+        "color_preferences": ("red", "yellow", "orange"),
+        "avoid": ("overly direct language",)
+    }),
+    "fr": MappingProxyType({
+        "communication_style": "Formal and elegant",
+        "business_etiquette": "Protocol-conscious",
+        "color_preferences": ("blue", "white", "red"),
+        "avoid": ("casual tone in business context",)
+    }),
+    "de": MappingProxyType({
+        "communication_style": "Direct and precise",
+        "business_etiquette": "Efficiency-focused",
+        "color_preferences": ("blue", "gray", "black"),
+        "avoid": ("excessive enthusiasm",)
+    }),
+    "ja": MappingProxyType({
+        "communication_style": "Respectful and indirect",
+        "business_etiquette": "Hierarchy-conscious",
+        "color_preferences": ("blue", "white", "red"),
+        "avoid": ("aggressive sales language",)
+    })
+})
+
+_MOCK_DEFAULT_INSIGHT = MappingProxyType({
+    "communication_style": "Professional",
+    "business_etiquette": "Standard business practices",
+    "color_preferences": ("blue", "gray"),
+    "avoid": ("cultural assumptions",)
+})
+
 class LingoClient:
     """
     Client for Lingo API - Internationalization and localization
@@ -437,12 +815,20 @@ class LingoClient:
         self.client: Optional[httpx.AsyncClient] = None
         self.base_url = config.lingo_base_url
         self.api_key = config.lingo_api_key
+        
+        # In-process LRU caches for repeated translations and cultural profiles
+        self._trans_cache: OrderedDict = OrderedDict()
+        self._trans_cache_capacity = 2048
+        self._insights_cache: OrderedDict = OrderedDict()
+        self._insights_cache_capacity = 64
+        self._cache_lock = asyncio.Lock()
     
     async def initialize(self):
         """Initialize Lingo client"""
         try:
             self.client = httpx.AsyncClient(
                 base_url=self.base_url,
+                transport=_shared_transport(),
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json"
@@ -459,8 +845,8 @@ class LingoClient:
     async def close(self):
         """Close Lingo client"""
         try:
-            if self.client:
-                await self.client.aclose()
+            # The transport is shared, so only drop this client's handle to it
+            self.client = None
             logger.info("Lingo client closed")
         except Exception as e:
             logger.error(f"Error closing Lingo client: {e}")
@@ -511,29 +897,70 @@ class LingoClient:
                         }
                     })
             
-            request_data = {
-                "requests": localization_requests,
-                "options": {
-                    "preserve_formatting": True,
-                    "maintain_tone": True,
-                    "cultural_adaptation": cultural_adaptations,
-                    "quality_level": "professional"
-                }
+            options = {
+                "preserve_formatting": True,
+                "maintain_tone": True,
+                "cultural_adaptation": cultural_adaptations,
+                "quality_level": "professional"
             }
             
-            response = await self.client.post("/localize/batch", json=request_data)
+            # Smaller batches serialize faster and a failure only costs its own chunk
+            semaphore = asyncio.Semaphore(_LOCALIZATION_MAX_CONCURRENCY)
+            chunk_results = await asyncio.gather(*[
+                self._localize_chunk(localization_requests[i:i + _LOCALIZATION_CHUNK_SIZE], options, semaphore)
+                for i in range(0, len(localization_requests), _LOCALIZATION_CHUNK_SIZE)
+            ])
             
-            if response.status_code == 200:
-                result = response.json()
-                return self._organize_localizations(result.get("localizations", []))
-            else:
-                logger.warning(f"Lingo localization failed: {response.status_code}")
-                return self._generate_mock_localizations(copy_variants, target_languages)
+            localizations = []
+            any_failed = False
+            for chunk_localizations in chunk_results:
+                if chunk_localizations is None:
+                    any_failed = True
+                else:
+                    localizations.extend(chunk_localizations)
+            
+            organized = self._organize_localizations(localizations)
+            
+            if any_failed:
+                # Fill whatever the failed chunks were meant to cover with mock entries
+                mock = self._generate_mock_localizations(copy_variants, target_languages)
+                for language, variants in mock.items():
+                    for variant_id, localization in variants.items():
+                        organized.setdefault(language, {}).setdefault(variant_id, localization)
+            
+            return organized
                 
         except Exception as e:
             logger.error(f"Content localization failed: {e}")
             return self._generate_mock_localizations(copy_variants, target_languages)
     
+    async def _localize_chunk(
+        self,
+        requests: List[Dict[str, Any]],
+        options: Dict[str, Any],
+        semaphore: asyncio.Semaphore
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Localize one chunk of the batch; returns None if the chunk failed
+        """
+        async with semaphore:
+            try:
+                response = await _post_json(
+                    self.client,
+                    "/localize/batch",
+                    {"requests": requests, "options": options}
+                )
+            except Exception as e:
+                logger.error(f"Lingo localization chunk failed: {e}")
+                return None
+        
+        if response.status_code == 200:
+            result = _json_body(response)
+            return result.get("localizations", [])
+        
+        logger.warning(f"Lingo localization chunk failed: {response.status_code}")
+        return None
+    
     async def translate_text(
         self,
         text: str,
@@ -548,6 +975,16 @@ class LingoClient:
             if not self.client:
                 return {"translated_text": f"[{target_language.upper()}] {text}", "confidence": 0.5}
             
+            cache_key = (
+                text,
+                source_language,
+                target_language,
+                json.dumps(context or {}, sort_keys=True, default=str)
+            )
+            cached = self._cache_lookup(self._trans_cache, cache_key)
+            if cached is not None:
+                return cached
+            
             request_data = {
                 "text": text,
                 "source_language": source_language,
@@ -559,16 +996,20 @@ class LingoClient:
                 }
             }
             
-            response = await self.client.post("/translate", json=request_data)
+            response = await _post_json(self.client, "/translate", request_data)
             
             if response.status_code == 200:
-                result = response.json()
-                return {
+                result = _json_body(response)
+                translation = {
                     "translated_text": result.get("translated_text"),
                     "confidence": result.get("confidence", 0.8),
                     "alternatives": result.get("alternatives", []),
                     "cultural_notes": result.get("cultural_notes", [])
                 }
+                await self._cache_store(
+                    self._trans_cache, cache_key, translation, self._trans_cache_capacity
+                )
+                return dict(translation)
             else:
                 return {"translated_text": f"[{target_language.upper()}] {text}", "confidence": 0.5}
                 
@@ -588,10 +1029,19 @@ class LingoClient:
             if not self.client:
                 return self._get_mock_cultural_insights(target_language)
             
+            cache_key = (target_language, content_type)
+            cached = self._cache_lookup(self._insights_cache, cache_key)
+            if cached is not None:
+                return cached
+            
             response = await self.client.get(f"/cultural-insights/{target_language}")
             
             if response.status_code == 200:
-                return response.json()
+                insights = _json_body(response)
+                await self._cache_store(
+                    self._insights_cache, cache_key, insights, self._insights_cache_capacity
+                )
+                return dict(insights)
             else:
                 return self._get_mock_cultural_insights(target_language)
                 
@@ -599,6 +1049,34 @@ class LingoClient:
             logger.error(f"Cultural insights failed: {e}")
             return self._get_mock_cultural_insights(target_language)
     
+    def _cache_lookup(self, cache: OrderedDict, key: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of a cached entry and mark it as recently used
+        """
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        
+        cache.move_to_end(key)
+        return dict(cached)
+    
+    async def _cache_store(
+        self,
+        cache: OrderedDict,
+        key: tuple,
+        value: Dict[str, Any],
+        capacity: int
+    ):
+        """
+        Insert an entry and evict the least recently used ones over capacity
+        """
+        async with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            
+            while len(cache) > capacity:
+                cache.popitem(last=False)
+    
     def _organize_localizations(self, localizations: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Organize localizations by language and variant
@@ -630,69 +1108,44 @@ class LingoClient:
         """
         Generate mock localizations when Lingo is unavailable
         """
-        mock_localizations = {}
+        # Resolve per-language prefixes and per-variant fields once, outside the cross product
+        prefixes = [
+            (language, (_MOCK_LANGUAGE_PREFIXES.get(language) or f"[{language.upper()}]") + " ")
+            for language in target_languages
+        ]
+        variant_fields = [
+            (
+                variant.get("variant_id", "unknown"),
+                variant.get("headline", ""),
+                variant.get("body_text", ""),
+                variant.get("cta", "")
+            )
+            for variant in copy_variants
+        ]
         
-        language_prefixes = {
-            "es": "[ES]",
-            "fr": "[FR]",
-            "de": "[DE]",
-            "it": "[IT]",
-            "pt": "[PT]",
-            "ja": "[JA]",
-            "ko": "[KO]",
-            "zh": "[ZH]"
-        }
+        mock_localizations = {}
         
-        for language in target_languages:
-            prefix = language_prefixes.get(language, f"[{language.upper()}]")
-            mock_localizations[language] = {}
+        for language, prefix in prefixes:
+            language_localizations = mock_localizations[language] = {}
+            note = f"Mock localization for {language}"
             
-            for variant in copy_variants:
-                variant_id = variant.get("variant_id", "unknown")
-                mock_localizations[language][variant_id] = {
-                    "headline": f"{prefix} {variant.get('headline', '')}",
-                    "body_text": f"{prefix} {variant.get('body_text', '')}",
-                    "cta": f"{prefix} {variant.get('cta', '')}",
+            for variant_id, headline, body_text, cta in variant_fields:
+                language_localizations[variant_id] = {
+                    "headline": prefix + headline,
+                    "body_text": prefix + body_text,
+                    "cta": prefix + cta,
                     "confidence": 0.5,
-                    "cultural_notes": [f"Mock localization for {language}"]
+                    "cultural_notes": [note]
                 }
         
         return mock_localizations
     
     def _get_mock_cultural_insights(self, target_language: str) -> Dict[str, Any]:
         """
-        Get mock cultural insights
-        """
-        mock_insights = {
-            "es": {
-                "communication_style": "Warm and personal",
-                "business_etiquette": "Relationship-focused",
-                "color_preferences": ["red", "yellow", "orange"],
-                "avoid": ["overly direct language"]
-            },
-            "fr": {
-                "communication_style": "Formal and elegant",
-                "business_etiquette": "Protocol-conscious",
-                "color_preferences": ["blue", "white", "red"],
-                "avoid": ["casual tone in business context"]
-            },
-            "de": {
-                "communication_style": "Direct and precise",
-                "business_etiquette": "Efficiency-focused",
-                "color_preferences": ["blue", "gray", "black"],
-                "avoid": ["excessive enthusiasm"]
-            },
-            "ja": {
-                "communication_style": "Respectful and indirect",
-                "business_etiquette": "Hierarchy-conscious",
-                "color_preferences": ["blue", "white", "red"],
-                "avoid": ["aggressive sales language"]
-            }
-        }
-        
-        return mock_insights.get(target_language, {
-            "communication_style": "Professional",
-            "business_etiquette": "Standard business practices",
-            "color_preferences": ["blue", "gray"],
-            "avoid": ["cultural assumptions"]
-        })
\ No newline at end of file
+        Get mock cultural insights, as a plain dict of lists like the API returns
+        """
+        insights = _MOCK_INSIGHTS.get(target_language, _MOCK_DEFAULT_INSIGHT)
+        return {
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in insights.items()
+        }
\ No newline at end of file
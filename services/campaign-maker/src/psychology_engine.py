@@ -1,7 +1,15 @@
 import asyncio
+import bisect
+import copy
 import json
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache, reduce
+from operator import or_
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 from datetime import datetime
 
@@ -9,6 +17,592 @@ from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Psychological triggers mapped to the persuasion principle they exercise
+_TRIGGER_TO_PRINCIPLE = MappingProxyType({
+    "scarcity": "scarcity",
+    "social_proof": "consensus",
+    "authority": "authority",
+    "reciprocity": "reciprocity",
+    "commitment": "consistency",
+    "liking": "liking"
+})
+
+# Keywords signalling each target emotion in campaign copy
+_EMOTIONAL_KEYWORDS = MappingProxyType({
+    "curiosity": ["discover", "explore", "learn", "find out"],
+    "interest": ["exciting", "innovative", "breakthrough", "opportunity"],
+    "trust": ["reliable", "proven", "trusted", "secure"],
+    "confidence": ["guaranteed", "certain", "assured", "confident"],
+    "excitement": ["amazing", "incredible", "revolutionary", "game-changing"],
+    "commitment": ["dedicated", "committed", "pledge", "promise"],
+    "urgency": ["now", "limited", "hurry", "deadline"],
+    "determination": ["achieve", "succeed", "accomplish", "win"]
+})
+
+# Customer journey stages: the channels carrying each stage and the emotions it should evoke
+_EMOTIONAL_STAGES = MappingProxyType({
+    "awareness": {"channels": ("social",), "emotions": ("curiosity", "interest")},
+    "consideration": {"channels": ("email", "content"), "emotions": ("trust", "confidence")},
+    "decision": {"channels": ("video", "personal"), "emotions": ("excitement", "commitment")},
+    "action": {"channels": ("all",), "emotions": ("urgency", "determination")}
+})
+
+# Optimal share of variants using each trigger; unlisted triggers use the default
+_OPTIMAL_TRIGGER_RATES = MappingProxyType({
+    "scarcity": 0.3,
+    "social_proof": 0.5,
+    "authority": 0.4,
+    "reciprocity": 0.2,
+    "commitment": 0.3,
+    "liking": 0.4
+})
+_DEFAULT_OPTIMAL_RATE = 0.3
+
+# Behavioral predictions: each row scores one behavior as a weighted sum of the
+# traits below (plus bias), then buckets it against (lower, upper) thresholds.
+# Decision speed falls as conscientiousness and neuroticism rise (more deliberate,
+# more anxious); risk tolerance rises with openness and falls with neuroticism.
+_BEHAVIOR_TRAITS = ("extraversion", "conscientiousness", "neuroticism", "agreeableness", "openness")
+_BEHAVIOR_NAMES = (
+    "engagement_likelihood",
+    "decision_speed",
+    "information_seeking",
+    "social_sharing",
+    "risk_tolerance"
+)
+_BEHAVIOR_WEIGHTS = np.array([
+    [0.6, 0.0, 0.0, 0.0, 0.4],
+    [0.0, -0.5, -0.5, 0.0, 0.0],
+    [0.0, 0.4, 0.0, 0.0, 0.6],
+    [0.7, 0.0, 0.0, 0.3, 0.0],
+    [0.0, 0.0, -1.0, 0.0, 1.0]
+])
+_BEHAVIOR_BIAS = np.array([0.0, 1.0, 0.0, 0.0, 0.0])
+_BEHAVIOR_THRESHOLDS = np.array([
+    [0.4, 0.7],
+    [0.3, 0.6],
+    [0.3, 0.6],
+    [0.3, 0.6],
+    [-0.2, 0.2]
+])
+_BEHAVIOR_LABELS = (
+    ("low", "medium", "high"),
+    ("slow", "moderate", "fast"),
+    ("low", "medium", "high"),
+    ("low", "medium", "high"),
+    ("low", "medium", "high")
+)
+
+# Behavioral outcomes fired by a (prediction, level) pair, in output order
+_DOMINANT_BEHAVIOR_RULES = (
+    (("engagement_likelihood", "high"), "high_engagement"),
+    (("decision_speed", "fast"), "quick_decision"),
+    (("information_seeking", "high"), "research_oriented"),
+    (("social_sharing", "high"), "social_amplifier")
+)
+_BEHAVIOR_STRATEGY_RULES = (
+    (("engagement_likelihood", "low"), "Use stronger hooks and interactive elements to boost engagement"),
+    (("decision_speed", "slow"), "Provide comprehensive information and reduce perceived risk"),
+    (("information_seeking", "high"), "Include detailed resources and supporting documentation"),
+    (("social_sharing", "high"), "Add social sharing incentives and shareable content formats"),
+    (("risk_tolerance", "low"), "Emphasize security, guarantees, and risk mitigation")
+)
+
+# High-impact triggers recommended first when missing from a campaign
+_PRIORITY_TRIGGERS = ("social_proof", "authority", "scarcity")
+
+# Cognitive load: per-metric normalisers for (headline, body, trigger count) and their weights
+_LOAD_SCALES = np.array([100.0, 500.0, 5.0])
+_LOAD_WEIGHTS = np.array([0.3, 0.5, 0.2])
+
+# Cognitive load recommendations per band; a score above a threshold moves up one band
+_LOAD_THRESHOLDS = (0.4, 0.7)
+_LOAD_RECS = (
+    ("Cognitive load is optimal",),
+    (
+        "Consider A/B testing simpler variants",
+        "Optimize information hierarchy"
+    ),
+    (
+        "Simplify headlines and messaging",
+        "Reduce number of psychological triggers per variant",
+        "Break complex information into digestible chunks"
+    )
+)
+
+@dataclass(frozen=True, slots=True)
+class MessagingPreferences:
+    """How to message an audience high in a given trait"""
+    tone: str
+    content_style: str
+    triggers: Tuple[str, ...]
+    avoid: Tuple[str, ...]
+
+@dataclass(frozen=True, slots=True)
+class BigFiveProfile:
+    """Reference profile for one Big Five personality trait"""
+    characteristics: Tuple[str, ...]
+    messaging_preferences: MessagingPreferences
+    decision_factors: Tuple[str, ...]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass(frozen=True, slots=True)
+class TriggerInfo:
+    """A psychological trigger and where it applies"""
+    description: str
+    applications: Tuple[str, ...]
+    phrases: Tuple[str, ...]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass(frozen=True, slots=True)
+class PersuasionPrinciple:
+    """One of Cialdini's persuasion principles"""
+    principle: str
+    application: str
+    examples: Tuple[str, ...]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+# Big Five personality trait profiles
+_BIG_FIVE_PROFILES = MappingProxyType({
+    "openness": BigFiveProfile(
+        characteristics=(
+            "Creative and imaginative",
+            "Open to new experiences",
+            "Intellectually curious",
+            "Appreciates art and beauty",
+            "Values independence"
+        ),
+        messaging_preferences=MessagingPreferences(
+            tone="innovative, creative, forward-thinking",
+            content_style="visually appealing, novel concepts",
+            triggers=("novelty", "creativity", "innovation", "exploration"),
+            avoid=("routine", "conventional", "restrictive")
+        ),
+        decision_factors=(
+            "Uniqueness of opportunity",
+            "Innovation potential",
+            "Creative possibilities",
+            "Learning opportunities"
+        )
+    ),
+    "conscientiousness": BigFiveProfile(
+        characteristics=(
+            "Organized and disciplined",
+            "Goal-oriented",
+            "Reliable and responsible",
+            "Plans ahead",
+            "Values achievement"
+        ),
+        messaging_preferences=MessagingPreferences(
+            tone="professional, structured, results-focused",
+            content_style="detailed, organized, step-by-step",
+            triggers=("efficiency", "results", "planning", "reliability"),
+            avoid=("chaos", "uncertainty", "impulsiveness")
+        ),
+        decision_factors=(
+            "Clear ROI and metrics",
+            "Structured implementation plan",
+            "Risk mitigation strategies",
+            "Long-term benefits"
+        )
+    ),
+    "extraversion": BigFiveProfile(
+        characteristics=(
+            "Outgoing and social",
+            "Energetic and assertive",
+            "Enjoys interaction",
+            "Optimistic",
+            "Seeks stimulation"
+        ),
+        messaging_preferences=MessagingPreferences(
+            tone="energetic, social, enthusiastic",
+            content_style="interactive, social proof, testimonials",
+            triggers=("social_proof", "networking", "collaboration", "excitement"),
+            avoid=("isolation", "solitary", "quiet")
+        ),
+        decision_factors=(
+            "Social benefits",
+            "Networking opportunities",
+            "Team collaboration",
+            "Public recognition"
+        )
+    ),
+    "agreeableness": BigFiveProfile(
+        characteristics=(
+            "Cooperative and trusting",
+            "Empathetic",
+            "Values harmony",
+            "Helpful and supportive",
+            "Avoids conflict"
+        ),
+        messaging_preferences=MessagingPreferences(
+            tone="collaborative, supportive, harmonious",
+            content_style="cooperative benefits, mutual gains",
+            triggers=("cooperation", "mutual_benefit", "trust", "harmony"),
+            avoid=("conflict", "competition", "aggression")
+        ),
+        decision_factors=(
+            "Mutual benefits",
+            "Positive relationships",
+            "Collaborative approach",
+            "Ethical considerations"
+        )
+    ),
+    "neuroticism": BigFiveProfile(
+        characteristics=(
+            "Emotionally sensitive",
+            "Prone to anxiety",
+            "Seeks security",
+            "Cautious",
+            "Values stability"
+        ),
+        messaging_preferences=MessagingPreferences(
+            tone="reassuring, supportive, stable",
+            content_style="risk mitigation, guarantees, support",
+            triggers=("security", "reassurance", "risk_reduction", "support"),
+            avoid=("uncertainty", "risk", "pressure")
+        ),
+        decision_factors=(
+            "Risk mitigation",
+            "Security and stability",
+            "Support and guidance",
+            "Proven track record"
+        )
+    )
+})
+
+# Psychological triggers and their applications
+_PSYCHOLOGICAL_TRIGGERS = MappingProxyType({
+    "scarcity": TriggerInfo(
+        description="Limited availability creates urgency",
+        applications=(
+            "Limited-time partnership opportunities",
+            "Exclusive access to resources",
+            "First-mover advantages"
+        ),
+        phrases=(
+            "Limited time offer",
+            "Exclusive opportunity",
+            "Only available to select partners",
+            "First 100 companies only"
+        )
+    ),
+    "social_proof": TriggerInfo(
+        description="Others' actions influence behavior",
+        applications=(
+            "Success stories from similar companies",
+            "Industry leader endorsements",
+            "Partnership statistics"
+        ),
+        phrases=(
+            "Join 500+ successful partnerships",
+            "Trusted by industry leaders",
+            "95% of partners report growth",
+            "Featured in TechCrunch"
+        )
+    ),
+    "authority": TriggerInfo(
+        description="Expertise and credibility influence decisions",
+        applications=(
+            "Industry expert endorsements",
+            "Awards and recognition",
+            "Thought leadership content"
+        ),
+        phrases=(
+            "Industry-leading expertise",
+            "Award-winning platform",
+            "Recognized by Gartner",
+            "Trusted by Fortune 500"
+        )
+    ),
+    "reciprocity": TriggerInfo(
+        description="People feel obligated to return favors",
+        applications=(
+            "Free resources and tools",
+            "Valuable insights sharing",
+            "No-cost partnership assessment"
+        ),
+        phrases=(
+            "Complimentary partnership audit",
+            "Free strategic consultation",
+            "Exclusive industry report",
+            "No-obligation assessment"
+        )
+    ),
+    "commitment": TriggerInfo(
+        description="People align actions with commitments",
+        applications=(
+            "Partnership goal setting",
+            "Public commitment ceremonies",
+            "Milestone celebrations"
+        ),
+        phrases=(
+            "Commit to mutual growth",
+            "Partnership pledge",
+            "Shared success goals",
+            "Joint mission statement"
+        )
+    ),
+    "liking": TriggerInfo(
+        description="People prefer to work with those they like",
+        applications=(
+            "Shared values and culture",
+            "Similar company backgrounds",
+            "Personal connection building"
+        ),
+        phrases=(
+            "Shared vision and values",
+            "Cultural alignment",
+            "Like-minded partners",
+            "Common goals and aspirations"
+        )
+    )
+})
+
+# Cialdini's principles of persuasion
+_PERSUASION_PRINCIPLES = MappingProxyType({
+    "consistency": PersuasionPrinciple(
+        principle="People align actions with previous commitments",
+        application="Reference past decisions and commitments",
+        examples=(
+            "Building on your previous innovation initiatives",
+            "Consistent with your growth strategy",
+            "Aligns with your stated objectives"
+        )
+    ),
+    "consensus": PersuasionPrinciple(
+        principle="People follow what others like them do",
+        application="Show similar companies' success",
+        examples=(
+            "Companies like yours have seen 40% growth",
+            "Similar-stage startups report success",
+            "Industry peers are adopting this approach"
+        )
+    ),
+    "contrast": PersuasionPrinciple(
+        principle="Perception is relative to comparison points",
+        application="Compare to alternatives or status quo",
+        examples=(
+            "Unlike traditional partnerships",
+            "Compared to going it alone",
+            "While competitors struggle"
+        )
+    )
+})
+
+
+def _init_derived():
+    """
+    Build lookup tables derived from the reference data above, once per process
+    """
+    # Give every known trigger (campaign and trait vocabularies) one bit so a
+    # variant's trigger set is a single integer
+    vocabulary = list(_PSYCHOLOGICAL_TRIGGERS)
+    for profile in _BIG_FIVE_PROFILES.values():
+        vocabulary.extend(profile.messaging_preferences.triggers)
+    trigger_bit = MappingProxyType({name: 1 << i for i, name in enumerate(dict.fromkeys(vocabulary))})
+    # Trait profiles are fixed, so resolve each trait's preferred triggers to bit
+    # positions up front; alignment then just sums per-bit variant counts
+    trait_bits = MappingProxyType({
+        trait: tuple(
+            trigger_bit[t].bit_length() - 1
+            for t in dict.fromkeys(profile.messaging_preferences.triggers)
+        )
+        for trait, profile in _BIG_FIVE_PROFILES.items()
+    })
+    # Persuasion principle exercised by each trigger bit (None for trait-only triggers)
+    principle_by_bit = tuple(_TRIGGER_TO_PRINCIPLE.get(name) for name in trigger_bit)
+    
+    # One alternation over every emotion keyword so each text is scanned once;
+    # the per-emotion sets then score that text's keyword bag
+    emotion_sets = MappingProxyType({
+        emotion: frozenset(keywords) for emotion, keywords in _EMOTIONAL_KEYWORDS.items()
+    })
+    all_keywords = [keyword for keywords in _EMOTIONAL_KEYWORDS.values() for keyword in keywords]
+    emotion_re = re.compile(r'\b(' + '|'.join(map(re.escape, all_keywords)) + r')\b')
+    
+    return trigger_bit, trait_bits, principle_by_bit, emotion_sets, emotion_re
+
+_TRIGGER_BIT, _TRAIT_TRIGGER_BITS, _PRINCIPLE_BY_BIT, _EMOTION_SETS, _EMOTION_RE = _init_derived()
+
+def _init_behavior_tables():
+    """
+    Give each (prediction, level) condition one bit and tabulate the dominant
+    behaviors and strategies for every combination of conditions
+    """
+    conditions = dict.fromkeys(
+        condition for condition, _ in _DOMINANT_BEHAVIOR_RULES + _BEHAVIOR_STRATEGY_RULES
+    )
+    condition_bit = MappingProxyType({condition: 1 << i for i, condition in enumerate(conditions)})
+    
+    def table(rules):
+        return tuple(
+            tuple(outcome for condition, outcome in rules if mask & condition_bit[condition])
+            for mask in range(1 << len(condition_bit))
+        )
+    
+    return condition_bit, table(_DOMINANT_BEHAVIOR_RULES), table(_BEHAVIOR_STRATEGY_RULES)
+
+_CONDITION_BIT, _DOMINANT_TABLE, _STRATEGY_TABLE = _init_behavior_tables()
+
+# Every journey emotion once, with its keyword set and size, and a
+# (stages x emotions) 0/1 matrix of the emotions each stage targets
+_JOURNEY_EMOTIONS = tuple(dict.fromkeys(
+    emotion for info in _EMOTIONAL_STAGES.values() for emotion in info["emotions"]
+))
+_JOURNEY_EMOTION_SETS = tuple(_EMOTION_SETS[emotion] for emotion in _JOURNEY_EMOTIONS)
+_JOURNEY_KEYWORD_TOTALS = np.array([len(keywords) for keywords in _JOURNEY_EMOTION_SETS], dtype=np.float64)
+_STAGE_EMOTION_MASK = np.array([
+    [emotion in info["emotions"] for emotion in _JOURNEY_EMOTIONS]
+    for info in _EMOTIONAL_STAGES.values()
+], dtype=np.float64)
+
+def _trigger_mask(triggers: List[str]) -> int:
+    """Encode a trigger list as a bitmask over the known trigger vocabulary"""
+    return reduce(or_, (_TRIGGER_BIT.get(trigger, 0) for trigger in triggers), 0)
+
+@lru_cache(maxsize=4096)
+def _emotion_keywords(headline: str, body_text: str) -> frozenset:
+    """
+    Distinct emotion keywords in a variant's copy; cached because A/B variants
+    and re-analysed campaigns repeat the same copy
+    """
+    return frozenset(_EMOTION_RE.findall((headline + ' ' + body_text).lower()))
+
+def _iter_bits(mask: int):
+    """Yield the positions of the set bits in mask, lowest first"""
+    while mask:
+        yield (mask & -mask).bit_length() - 1
+        mask &= mask - 1
+
+def _mean(xs) -> float:
+    """Mean of a short Python sequence without a numpy round-trip"""
+    return sum(xs) / len(xs) if xs else 0.0
+
+@lru_cache(maxsize=1)
+def _entropy_kernel():
+    """
+    Compile the Shannon entropy loop on first use; None when numba is not installed
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    
+    @numba.njit(cache=True, fastmath=True)
+    def _entropy(p):
+        s = 0.0
+        for i in range(p.shape[0]):
+            x = p[i]
+            if x > 0.0:
+                s -= x * np.log2(x)
+        return s
+    
+    return _entropy
+
+def _entropy(distribution: np.ndarray) -> float:
+    """Shannon entropy (bits) of a probability vector"""
+    kernel = _entropy_kernel()
+    if kernel is not None:
+        return kernel(distribution)
+    
+    nonzero = distribution[distribution > 0]
+    return float(-(nonzero * np.log2(nonzero)).sum())
+
+@lru_cache(maxsize=1)
+def _prediction_kernel():
+    """
+    Compile the behavioral scoring loop on first use; None when numba is not installed
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    
+    # No fastmath: reassociating the sums could move a score across a band threshold
+    @numba.njit(cache=True)
+    def _buckets(traits, weights, bias, thresholds):
+        buckets = np.zeros(weights.shape[0], dtype=np.int8)
+        for i in range(weights.shape[0]):
+            score = 0.0
+            for j in range(traits.shape[0]):
+                score += weights[i, j] * traits[j]
+            score += bias[i]
+            for k in range(thresholds.shape[1]):
+                if score > thresholds[i, k]:
+                    buckets[i] += 1
+        return buckets
+    
+    return _buckets
+
+def _prediction_buckets(traits: np.ndarray) -> List[int]:
+    """Band index (low/medium/high) of each behavioral score for a trait vector"""
+    kernel = _prediction_kernel()
+    if kernel is not None:
+        return kernel(traits, _BEHAVIOR_WEIGHTS, _BEHAVIOR_BIAS, _BEHAVIOR_THRESHOLDS).tolist()
+    
+    scores = _BEHAVIOR_WEIGHTS @ traits + _BEHAVIOR_BIAS
+    return (scores[:, None] > _BEHAVIOR_THRESHOLDS).sum(axis=1).tolist()
+
+@lru_cache(maxsize=1024)
+def _segment_insights_impl(audience_segment: str) -> Dict[str, Any]:
+    """
+    Build insights for a segment name; cached because the result depends only on
+    the name, so the shared result must never be handed out or mutated
+    """
+    # This would typically query a database or ML model
+    # For now, return mock insights based on segment name
+    
+    return {
+        "segment_name": audience_segment,
+        "psychological_profile": {
+            "dominant_traits": ["conscientiousness", "openness"],
+            "decision_factors": ["ROI", "innovation_potential", "risk_mitigation"],
+            "preferred_communication": "data-driven, professional, detailed"
+        },
+        "behavioral_patterns": {
+            "information_seeking": "high",
+            "decision_speed": "moderate",
+            "social_influence": "medium",
+            "risk_tolerance": "low-medium"
+        },
+        "optimization_recommendations": [
+            "Use data and metrics to support claims",
+            "Provide detailed implementation plans",
+            "Include risk mitigation strategies",
+            "Highlight innovation aspects"
+        ]
+    }
+
+@dataclass
+class ChannelStats:
+    """
+    Length metrics for one channel's variants, stored as contiguous arrays
+    """
+    # int32, shape (3, n_variants): headline length, body length, trigger count
+    metrics: np.ndarray
+
+@dataclass
+class VariantStats:
+    """
+    Single-pass summary of campaign copy variants shared by all analyzers
+    """
+    total_variants: int = 0
+    channels: List[str] = field(default_factory=list)
+    # Number of variants using each trigger, indexed by trigger bit
+    bit_counts: List[int] = field(default_factory=lambda: [0] * len(_TRIGGER_BIT))
+    trigger_usage: Counter = field(default_factory=Counter)
+    principle_usage: Counter = field(default_factory=Counter)
+    channel_stats: Dict[str, ChannelStats] = field(default_factory=dict)
+    # Distinct emotion keywords found in each variant's copy, per channel
+    keyword_sets: Dict[str, List[frozenset]] = field(default_factory=dict)
+
 class PsychologyEngine:
     """
     Psychology engine for analyzing and optimizing campaign psychology
@@ -18,261 +612,17 @@ class PsychologyEngine:
         self.config = config
         
         # Psychological frameworks and models
-        self.big_five_profiles = self._initialize_big_five_profiles()
-        self.psychological_triggers = self._initialize_psychological_triggers()
-        self.persuasion_principles = self._initialize_persuasion_principles()
+        self.big_five_profiles = _BIG_FIVE_PROFILES
+        self.psychological_triggers = _PSYCHOLOGICAL_TRIGGERS
+        self.persuasion_principles = _PERSUASION_PRINCIPLES
     
     async def initialize(self):
         """Initialize psychology engine"""
-        try:
-            logger.info("Psychology engine initialized successfully")
-        except Exception as e:
-            logger.error(f"Psychology engine initialization failed: {e}")
-            raise
+        logger.info("Psychology engine initialized successfully")
     
     async def close(self):
         """Close psychology engine"""
-        try:
-            logger.info("Psychology engine closed")
-        except Exception as e:
-            logger.error(f"Error closing psychology engine: {e}")
-    
-    def _initialize_big_five_profiles(self) -> Dict[str, Dict[str, Any]]:
-        """
-        Initialize Big Five personality trait profiles
-        """
-        return {
-            "openness": {
-                "characteristics": [
-                    "Creative and imaginative",
-                    "Open to new experiences",
-                    "Intellectually curious",
-                    "Appreciates art and beauty",
-                    "Values independence"
-                ],
-                "messaging_preferences": {
-                    "tone": "innovative, creative, forward-thinking",
-                    "content_style": "visually appealing, novel concepts",
-                    "triggers": ["novelty", "creativity", "innovation", "exploration"],
-                    "avoid": ["routine", "conventional", "restrictive"]
-                },
-                "decision_factors": [
-                    "Uniqueness of opportunity",
-                    "Innovation potential",
-                    "Creative possibilities",
-                    "Learning opportunities"
-                ]
-            },
-            "conscientiousness": {
-                "characteristics": [
-                    "Organized and disciplined",
-                    "Goal-oriented",
-                    "Reliable and responsible",
-                    "Plans ahead",
-                    "Values achievement"
-                ],
-                "messaging_preferences": {
-                    "tone": "professional, structured, results-focused",
-                    "content_style": "detailed, organized, step-by-step",
-                    "triggers": ["efficiency", "results", "planning", "reliability"],
-                    "avoid": ["chaos", "uncertainty", "impulsiveness"]
-                },
-                "decision_factors": [
-                    "Clear ROI and metrics",
-                    "Structured implementation plan",
-                    "Risk mitigation strategies",
-                    "Long-term benefits"
-                ]
-            },
-            "extraversion": {
-                "characteristics": [
-                    "Outgoing and social",
-                    "Energetic and assertive",
-                    "Enjoys interaction",
-                    "Optimistic",
-                    "Seeks stimulation"
-                ],
-                "messaging_preferences": {
-                    "tone": "energetic, social, enthusiastic",
-                    "content_style": "interactive, social proof, testimonials",
-                    "triggers": ["social_proof", "networking", "collaboration", "excitement"],
-                    "avoid": ["isolation", "solitary", "quiet"]
-                },
-                "decision_factors": [
-                    "Social benefits",
-                    "Networking opportunities",
-                    "Team collaboration",
-                    "Public recognition"
-                ]
-            },
-            "agreeableness": {
-                "characteristics": [
-                    "Cooperative and trusting",
-                    "Empathetic",
-                    "Values harmony",
-                    "Helpful and supportive",
-                    "Avoids conflict"
-                ],
-                "messaging_preferences": {
-                    "tone": "collaborative, supportive, harmonious",
-                    "content_style": "cooperative benefits, mutual gains",
-                    "triggers": ["cooperation", "mutual_benefit", "trust", "harmony"],
-                    "avoid": ["conflict", "competition", "aggression"]
-                },
-                "decision_factors": [
-                    "Mutual benefits",
-                    "Positive relationships",
-                    "Collaborative approach",
-                    "Ethical considerations"
-                ]
-            },
-            "neuroticism": {
-                "characteristics": [
-                    "Emotionally sensitive",
-                    "Prone to anxiety",
-                    "Seeks security",
-                    "Cautious",
-                    "Values stability"
-                ],
-                "messaging_preferences": {
-                    "tone": "reassuring, supportive, stable",
-                    "content_style": "risk mitigation, guarantees, support",
-                    "triggers": ["security", "reassurance", "risk_reduction", "support"],
-                    "avoid": ["uncertainty", "risk", "pressure"]
-                },
-                "decision_factors": [
-                    "Risk mitigation",
-                    "Security and stability",
-                    "Support and guidance",
-                    "Proven track record"
-                ]
-            }
-        }
-    
-    def _initialize_psychological_triggers(self) -> Dict[str, Dict[str, Any]]:
-        """
-        Initialize psychological triggers and their applications
-        """
-        return {
-            "scarcity": {
-                "description": "Limited availability creates urgency",
-                "applications": [
-                    "Limited-time partnership opportunities",
-                    "Exclusive access to resources",
-                    "First-mover advantages"
-                ],
-                "phrases": [
-                    "Limited time offer",
-                    "Exclusive opportunity",
-                    "Only available to select partners",
-                    "First 100 companies only"
-                ]
-            },
-            "social_proof": {
-                "description": "Others' actions influence behavior",
-                "applications": [
-                    "Success stories from similar companies",
-                    "Industry leader endorsements",
-                    "Partnership statistics"
-                ],
-                "phrases": [
-                    "Join 500+ successful partnerships",
-                    "Trusted by industry leaders",
-                    "95% of partners report growth",
-                    "Featured in TechCrunch"
-                ]
-            },
-            "authority": {
-                "description": "Expertise and credibility influence decisions",
-                "applications": [
-                    "Industry expert endorsements",
-                    "Awards and recognition",
-                    "Thought leadership content"
-                ],
-                "phrases": [
-                    "Industry-leading expertise",
-                    "Award-winning platform",
-                    "Recognized by Gartner",
-                    "Trusted by Fortune 500"
-                ]
-            },
-            "reciprocity": {
-                "description": "People feel obligated to return favors",
-                "applications": [
-                    "Free resources and tools",
-                    "Valuable insights sharing",
-                    "No-cost partnership assessment"
-                ],
-                "phrases": [
-                    "Complimentary partnership audit",
-                    "Free strategic consultation",
-                    "Exclusive industry report",
-                    "No-obligation assessment"
-                ]
-            },
-            "commitment": {
-                "description": "People align actions with commitments",
-                "applications": [
-                    "Partnership goal setting",
-                    "Public commitment ceremonies",
-                    "Milestone celebrations"
-                ],
-                "phrases": [
-                    "Commit to mutual growth",
-                    "Partnership pledge",
-                    "Shared success goals",
-                    "Joint mission statement"
-                ]
-            },
-            "liking": {
-                "description": "People prefer to work with those they like",
-                "applications": [
-                    "Shared values and culture",
-                    "Similar company backgrounds",
-                    "Personal connection building"
-                ],
-                "phrases": [
-                    "Shared vision and values",
-                    "Cultural alignment",
-                    "Like-minded partners",
-                    "Common goals and aspirations"
-                ]
-            }
-        }
-    
-    def _initialize_persuasion_principles(self) -> Dict[str, Dict[str, Any]]:
-        """
-        Initialize Cialdini's principles of persuasion
-        """
-        return {
-            "consistency": {
-                "principle": "People align actions with previous commitments",
-                "application": "Reference past decisions and commitments",
-                "examples": [
-                    "Building on your previous innovation initiatives",
-                    "Consistent with your growth strategy",
-                    "Aligns with your stated objectives"
-                ]
-            },
-            "consensus": {
-                "principle": "People follow what others like them do",
-                "application": "Show similar companies' success",
-                "examples": [
-                    "Companies like yours have seen 40% growth",
-                    "Similar-stage startups report success",
-                    "Industry peers are adopting this approach"
-                ]
-            },
-            "contrast": {
-                "principle": "Perception is relative to comparison points",
-                "application": "Compare to alternatives or status quo",
-                "examples": [
-                    "Unlike traditional partnerships",
-                    "Compared to going it alone",
-                    "While competitors struggle"
-                ]
-            }
-        }
+        logger.info("Psychology engine closed")
     
     async def analyze_campaign_psychology(
         self,
@@ -284,23 +634,28 @@ class PsychologyEngine:
         Analyze psychological aspects of the campaign
         """
         try:
+            # Walk the content once; every analyzer reads from the same summary
+            stats = self._precompute_variant_stats(channel_content)
+            
+            # The analyzers are short GIL-bound passes over the summary, so they run
+            # inline; worker threads would only add a hop per analyzer
             analysis = {
                 "personality_alignment": self._analyze_personality_alignment(
-                    channel_content, audience_segment
+                    stats, audience_segment
                 ),
                 "psychological_triggers_analysis": self._analyze_psychological_triggers(
-                    campaign_brief, channel_content
+                    campaign_brief, stats
                 ),
                 "persuasion_principles_usage": self._analyze_persuasion_principles(
-                    campaign_brief, channel_content
+                    campaign_brief, stats
                 ),
-                "emotional_journey": self._map_emotional_journey(channel_content),
-                "cognitive_load_assessment": self._assess_cognitive_load(channel_content),
+                "emotional_journey": self._map_emotional_journey(stats),
+                "cognitive_load_assessment": self._assess_cognitive_load(stats),
                 "behavioral_predictions": self._predict_behavioral_responses(
                     campaign_brief, audience_segment
                 ),
                 "optimization_opportunities": self._identify_psychology_optimizations(
-                    campaign_brief, channel_content, audience_segment
+                    campaign_brief, stats, audience_segment
                 )
             }
             
@@ -310,9 +665,52 @@ class PsychologyEngine:
             logger.error(f"Campaign psychology analysis failed: {e}")
             return {}
     
+    def _precompute_variant_stats(self, channel_content: List[Dict[str, Any]]) -> VariantStats:
+        """
+        Collect trigger tallies, length metrics and emotion keywords in a single traversal
+        """
+        stats = VariantStats()
+        
+        for content in channel_content:
+            channel = content['channel']
+            variants = content.get('copy_variants', [])
+            stats.channels.append(channel)
+            channel_keywords = stats.keyword_sets.setdefault(channel, [])
+            
+            headline_lens = []
+            body_lens = []
+            trigger_counts = []
+            
+            for variant in variants:
+                headline = variant.get('headline', '')
+                body_text = variant.get('body_text', '')
+                triggers = variant.get('psychological_triggers', [])
+                
+                stats.total_variants += 1
+                stats.trigger_usage.update(triggers)
+                for bit in _iter_bits(_trigger_mask(triggers)):
+                    stats.bit_counts[bit] += 1
+                
+                headline_lens.append(len(headline))
+                body_lens.append(len(body_text))
+                trigger_counts.append(len(triggers))
+                channel_keywords.append(_emotion_keywords(headline, body_text))
+            
+            if variants:
+                stats.channel_stats[channel] = ChannelStats(
+                    metrics=np.array([headline_lens, body_lens, trigger_counts], dtype=np.int32)
+                )
+        
+        for bit, count in enumerate(stats.bit_counts):
+            principle = _PRINCIPLE_BY_BIT[bit]
+            if principle and count:
+                stats.principle_usage[principle] += count
+        
+        return stats
+    
     def _analyze_personality_alignment(
         self,
-        channel_content: List[Dict[str, Any]],
+        stats: VariantStats,
         audience_segment: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
@@ -321,20 +719,22 @@ class PsychologyEngine:
         big_five_traits = audience_segment.get('big_five_traits', {})
         alignment_scores = {}
         
+        if not stats.total_variants or not any(score > 0.6 for score in big_five_traits.values()):
+            return {
+                "trait_alignment_scores": alignment_scores,
+                "overall_alignment": 0.5,
+                "strongest_alignment": None,
+                "improvement_areas": []
+            }
+        
         for trait, score in big_five_traits.items():
             if score > 0.6:  # High trait score
-                trait_profile = self.big_five_profiles.get(trait, {})
-                preferred_triggers = trait_profile.get('messaging_preferences', {}).get('triggers', [])
+                preferred_triggers = self._preferred_triggers(trait)
+                preferred_bits = _TRAIT_TRIGGER_BITS.get(trait, ())
                 
                 # Count trigger usage across content
-                trigger_usage = 0
-                total_variants = 0
-                
-                for content in channel_content:
-                    for variant in content.get('copy_variants', []):
-                        total_variants += 1
-                        variant_triggers = variant.get('psychological_triggers', [])
-                        trigger_usage += len(set(variant_triggers) & set(preferred_triggers))
+                total_variants = stats.total_variants
+                trigger_usage = sum(stats.bit_counts[bit] for bit in preferred_bits)
                 
                 if total_variants > 0:
                     alignment_scores[trait] = {
@@ -346,7 +746,7 @@ class PsychologyEngine:
         
         return {
             "trait_alignment_scores": alignment_scores,
-            "overall_alignment": np.mean([scores["score"] for scores in alignment_scores.values()]) if alignment_scores else 0.5,
+            "overall_alignment": _mean([scores["score"] for scores in alignment_scores.values()]) if alignment_scores else 0.5,
             "strongest_alignment": max(alignment_scores.items(), key=lambda x: x[1]["score"])[0] if alignment_scores else None,
             "improvement_areas": [trait for trait, data in alignment_scores.items() if data["score"] < 0.7]
         }
@@ -354,35 +754,30 @@ class PsychologyEngine:
     def _analyze_psychological_triggers(
         self,
         campaign_brief: Dict[str, Any],
-        channel_content: List[Dict[str, Any]]
+        stats: VariantStats
     ) -> Dict[str, Any]:
         """
         Analyze usage of psychological triggers across the campaign
         """
-        trigger_usage = {}
-        total_variants = 0
-        
-        # Count trigger usage
-        for content in channel_content:
-            for variant in content.get('copy_variants', []):
-                total_variants += 1
-                for trigger in variant.get('psychological_triggers', []):
-                    trigger_usage[trigger] = trigger_usage.get(trigger, 0) + 1
+        trigger_usage = stats.trigger_usage
+        total_variants = stats.total_variants
         
         # Analyze trigger effectiveness
+        usage_rates, effectiveness = self._calculate_trigger_effectiveness(trigger_usage, total_variants)
+        
         trigger_analysis = {}
-        for trigger, count in trigger_usage.items():
-            trigger_info = self.psychological_triggers.get(trigger, {})
+        for (trigger, count), usage_rate, score in zip(trigger_usage.items(), usage_rates, effectiveness):
+            trigger_info = self.psychological_triggers.get(trigger)
             trigger_analysis[trigger] = {
                 "usage_count": count,
-                "usage_percentage": count / total_variants if total_variants > 0 else 0,
-                "description": trigger_info.get('description', ''),
-                "effectiveness_score": self._calculate_trigger_effectiveness(trigger, count, total_variants)
+                "usage_percentage": usage_rate,
+                "description": trigger_info.description if trigger_info else '',
+                "effectiveness_score": score
             }
         
         return {
             "trigger_usage": trigger_analysis,
-            "most_used_triggers": sorted(trigger_usage.items(), key=lambda x: x[1], reverse=True)[:5],
+            "most_used_triggers": trigger_usage.most_common(5),
             "trigger_diversity": len(trigger_usage),
             "recommended_additions": self._recommend_additional_triggers(trigger_usage),
             "balance_assessment": self._assess_trigger_balance(trigger_usage)
@@ -391,107 +786,101 @@ class PsychologyEngine:
     def _analyze_persuasion_principles(
         self,
         campaign_brief: Dict[str, Any],
-        channel_content: List[Dict[str, Any]]
+        stats: VariantStats
     ) -> Dict[str, Any]:
         """
         Analyze usage of Cialdini's persuasion principles
         """
-        principle_usage = {}
-        
-        # Map triggers to principles
-        trigger_to_principle = {
-            "scarcity": "scarcity",
-            "social_proof": "consensus",
-            "authority": "authority",
-            "reciprocity": "reciprocity",
-            "commitment": "consistency",
-            "liking": "liking"
-        }
-        
-        # Count principle usage
-        for content in channel_content:
-            for variant in content.get('copy_variants', []):
-                for trigger in variant.get('psychological_triggers', []):
-                    principle = trigger_to_principle.get(trigger)
-                    if principle:
-                        principle_usage[principle] = principle_usage.get(principle, 0) + 1
+        principle_usage = stats.principle_usage
         
         return {
-            "principle_usage": principle_usage,
+            "principle_usage": dict(principle_usage),
             "principles_covered": len(principle_usage),
             "missing_principles": [p for p in self.persuasion_principles.keys() if p not in principle_usage],
             "balance_score": self._calculate_principle_balance(principle_usage)
         }
     
-    def _map_emotional_journey(self, channel_content: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _map_emotional_journey(self, stats: VariantStats) -> Dict[str, Any]:
         """
         Map the emotional journey across different channels
         """
-        emotional_stages = {
-            "awareness": {"channels": ["social"], "emotions": ["curiosity", "interest"]},
-            "consideration": {"channels": ["email", "content"], "emotions": ["trust", "confidence"]},
-            "decision": {"channels": ["video", "personal"], "emotions": ["excitement", "commitment"]},
-            "action": {"channels": ["all"], "emotions": ["urgency", "determination"]}
-        }
+        stage_channels = [
+            [
+                channel for channel in stats.channels
+                if channel in info['channels'] or 'all' in info['channels']
+            ]
+            for info in _EMOTIONAL_STAGES.values()
+        ]
         
+        # Score every variant against every journey emotion once: (variants x emotions)
+        # hit ratios, pooled per stage by a (stages x variants) channel membership matrix
+        channels = list(dict.fromkeys(stats.channels))
+        keyword_sets = [found for channel in channels for found in stats.keyword_sets[channel]]
+        hits = np.fromiter(
+            (len(found & keywords) for found in keyword_sets for keywords in _JOURNEY_EMOTION_SETS),
+            dtype=np.float64,
+            count=len(keyword_sets) * len(_JOURNEY_EMOTION_SETS)
+        ).reshape(len(keyword_sets), len(_JOURNEY_EMOTION_SETS))
+        ratios = np.minimum(1.0, hits / _JOURNEY_KEYWORD_TOTALS)
+        
+        variant_channels = np.repeat(
+            np.arange(len(channels)),
+            [len(stats.keyword_sets[channel]) for channel in channels]
+        )
+        stage_variants = np.array(
+            [[channel in relevant for channel in channels] for relevant in stage_channels],
+            dtype=np.float64
+        ).reshape(len(stage_channels), len(channels))[:, variant_channels]
+        
+        totals = ((stage_variants @ ratios) * _STAGE_EMOTION_MASK).sum(axis=1)
+        counts = stage_variants.sum(axis=1) * _STAGE_EMOTION_MASK.sum(axis=1)
+        alignments = np.divide(totals, counts, out=np.full(len(totals), 0.5), where=counts > 0)
+        
+        covered = np.array([bool(relevant) for relevant in stage_channels])
         journey_analysis = {}
         
-        for stage, info in emotional_stages.items():
-            relevant_content = [
-                content for content in channel_content
-                if content['channel'] in info['channels'] or 'all' in info['channels']
-            ]
-            
-            if relevant_content:
-                # Analyze emotional tone in content
-                emotional_alignment = self._analyze_emotional_tone(relevant_content, info['emotions'])
+        for (stage, info), relevant_channels, alignment in zip(
+            _EMOTIONAL_STAGES.items(), stage_channels, alignments.tolist()
+        ):
+            if relevant_channels:
                 journey_analysis[stage] = {
-                    "target_emotions": info['emotions'],
-                    "content_alignment": emotional_alignment,
-                    "channel_coverage": [content['channel'] for content in relevant_content]
+                    "target_emotions": list(info['emotions']),
+                    "content_alignment": alignment,
+                    "channel_coverage": relevant_channels
                 }
         
         return {
             "emotional_stages": journey_analysis,
-            "journey_completeness": len(journey_analysis) / len(emotional_stages),
-            "emotional_consistency": self._assess_emotional_consistency(journey_analysis)
+            "journey_completeness": len(journey_analysis) / len(_EMOTIONAL_STAGES),
+            "emotional_consistency": self._assess_emotional_consistency(alignments[covered])
         }
     
-    def _assess_cognitive_load(self, channel_content: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _assess_cognitive_load(self, stats: VariantStats) -> Dict[str, Any]:
         """
         Assess cognitive load of campaign content
         """
         load_assessment = {}
         
-        for content in channel_content:
-            channel = content['channel']
-            variants = content.get('copy_variants', [])
+        for channel, channel_stats in stats.channel_stats.items():
+            # Analyze complexity metrics
+            metrics = channel_stats.metrics.mean(axis=1)
+            avg_headline_length, avg_body_length, avg_trigger_count = metrics
             
-            if variants:
-                # Analyze complexity metrics
-                avg_headline_length = np.mean([len(v.get('headline', '')) for v in variants])
-                avg_body_length = np.mean([len(v.get('body_text', '')) for v in variants])
-                avg_trigger_count = np.mean([len(v.get('psychological_triggers', [])) for v in variants])
-                
-                # Calculate cognitive load score (0-1, lower is better)
-                load_score = min(1.0, (
-                    (avg_headline_length / 100) * 0.3 +
-                    (avg_body_length / 500) * 0.5 +
-                    (avg_trigger_count / 5) * 0.2
-                ))
-                
-                load_assessment[channel] = {
-                    "cognitive_load_score": load_score,
-                    "complexity_level": "high" if load_score > 0.7 else "medium" if load_score > 0.4 else "low",
-                    "avg_headline_length": avg_headline_length,
-                    "avg_body_length": avg_body_length,
-                    "avg_trigger_count": avg_trigger_count,
-                    "recommendations": self._get_cognitive_load_recommendations(load_score)
-                }
+            # Calculate cognitive load score (0-1, lower is better)
+            load_score = min(1.0, ((metrics / _LOAD_SCALES) * _LOAD_WEIGHTS).sum())
+            
+            load_assessment[channel] = {
+                "cognitive_load_score": load_score,
+                "complexity_level": "high" if load_score > 0.7 else "medium" if load_score > 0.4 else "low",
+                "avg_headline_length": avg_headline_length,
+                "avg_body_length": avg_body_length,
+                "avg_trigger_count": avg_trigger_count,
+                "recommendations": self._get_cognitive_load_recommendations(load_score)
+            }
         
         return {
             "channel_assessments": load_assessment,
-            "overall_load": np.mean([assessment["cognitive_load_score"] for assessment in load_assessment.values()]) if load_assessment else 0.5,
+            "overall_load": _mean([assessment["cognitive_load_score"] for assessment in load_assessment.values()]) if load_assessment else 0.5,
             "optimization_priority": sorted(load_assessment.items(), key=lambda x: x[1]["cognitive_load_score"], reverse=True)
         }
     
@@ -505,24 +894,19 @@ class PsychologyEngine:
         """
         big_five_traits = audience_segment.get('big_five_traits', {})
         
-        predictions = {
-            "engagement_likelihood": self._predict_engagement(big_five_traits),
-            "decision_speed": self._predict_decision_speed(big_five_traits),
-            "information_seeking": self._predict_information_seeking(big_five_traits),
-            "social_sharing": self._predict_social_sharing(big_five_traits),
-            "risk_tolerance": self._predict_risk_tolerance(big_five_traits)
-        }
+        predictions = self._predict_all(big_five_traits)
+        mask = self._behavior_mask(predictions)
         
         return {
             "behavioral_predictions": predictions,
-            "dominant_behaviors": self._identify_dominant_behaviors(predictions),
-            "optimization_strategies": self._generate_behavior_optimization_strategies(predictions)
+            "dominant_behaviors": list(_DOMINANT_TABLE[mask]),
+            "optimization_strategies": list(_STRATEGY_TABLE[mask])
         }
     
     def _identify_psychology_optimizations(
         self,
         campaign_brief: Dict[str, Any],
-        channel_content: List[Dict[str, Any]],
+        stats: VariantStats,
         audience_segment: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
         """
@@ -534,23 +918,16 @@ class PsychologyEngine:
         big_five_traits = audience_segment.get('big_five_traits', {})
         for trait, score in big_five_traits.items():
             if score > 0.7:  # High trait score
-                trait_profile = self.big_five_profiles.get(trait, {})
                 optimizations.append({
                     "type": "personality_alignment",
                     "trait": trait,
                     "priority": "high",
                     "description": f"Enhance {trait} targeting across all channels",
-                    "specific_actions": trait_profile.get('messaging_preferences', {}).get('triggers', [])
+                    "specific_actions": self._preferred_triggers(trait)
                 })
         
         # Trigger diversity optimization
-        trigger_usage = {}
-        for content in channel_content:
-            for variant in content.get('copy_variants', []):
-                for trigger in variant.get('psychological_triggers', []):
-                    trigger_usage[trigger] = trigger_usage.get(trigger, 0) + 1
-        
-        if len(trigger_usage) < 4:
+        if len(stats.trigger_usage) < 4:
             optimizations.append({
                 "type": "trigger_diversity",
                 "priority": "medium",
@@ -577,31 +954,8 @@ class PsychologyEngine:
         Get psychological insights for a specific audience segment
         """
         try:
-            # This would typically query a database or ML model
-            # For now, return mock insights based on segment name
-            
-            insights = {
-                "segment_name": audience_segment,
-                "psychological_profile": {
-                    "dominant_traits": ["conscientiousness", "openness"],
-                    "decision_factors": ["ROI", "innovation_potential", "risk_mitigation"],
-                    "preferred_communication": "data-driven, professional, detailed"
-                },
-                "behavioral_patterns": {
-                    "information_seeking": "high",
-                    "decision_speed": "moderate",
-                    "social_influence": "medium",
-                    "risk_tolerance": "low-medium"
-                },
-                "optimization_recommendations": [
-                    "Use data and metrics to support claims",
-                    "Provide detailed implementation plans",
-                    "Include risk mitigation strategies",
-                    "Highlight innovation aspects"
-                ]
-            }
-            
-            return insights
+            # Callers get their own copy, so none can alter what later requests are served
+            return copy.deepcopy(_segment_insights_impl(audience_segment))
             
         except Exception as e:
             logger.error(f"Segment insights generation failed: {e}")
@@ -609,54 +963,52 @@ class PsychologyEngine:
     
     # Helper methods for analysis
     
+    def _preferred_triggers(self, trait: str) -> List[str]:
+        """Triggers the given trait responds to; empty for unknown traits"""
+        trait_profile = self.big_five_profiles.get(trait)
+        return list(trait_profile.messaging_preferences.triggers) if trait_profile else []
+    
     def _get_trait_recommendations(self, trait: str, alignment_score: float) -> List[str]:
         """Get recommendations for improving trait alignment"""
         if alignment_score < 0.5:
-            trait_profile = self.big_five_profiles.get(trait, {})
-            triggers = trait_profile.get('messaging_preferences', {}).get('triggers', [])
+            triggers = self._preferred_triggers(trait)
             return [f"Incorporate more {trigger} elements" for trigger in triggers[:3]]
         return ["Maintain current trait alignment"]
     
-    def _calculate_trigger_effectiveness(self, trigger: str, count: int, total: int) -> float:
-        """Calculate effectiveness score for a psychological trigger"""
-        usage_rate = count / total if total > 0 else 0
-        
-        # Optimal usage rates for different triggers
-        optimal_rates = {
-            "scarcity": 0.3,
-            "social_proof": 0.5,
-            "authority": 0.4,
-            "reciprocity": 0.2,
-            "commitment": 0.3,
-            "liking": 0.4
-        }
+    def _calculate_trigger_effectiveness(
+        self,
+        trigger_usage: Dict[str, int],
+        total: int
+    ) -> Tuple[List[float], List[float]]:
+        """Calculate usage rate and effectiveness score for every used trigger at once"""
+        count = len(trigger_usage)
+        counts = np.fromiter(trigger_usage.values(), dtype=np.float64, count=count)
+        optimal = np.fromiter(
+            (_OPTIMAL_TRIGGER_RATES.get(trigger, _DEFAULT_OPTIMAL_RATE) for trigger in trigger_usage),
+            dtype=np.float64,
+            count=count
+        )
         
-        optimal = optimal_rates.get(trigger, 0.3)
-        effectiveness = 1.0 - abs(usage_rate - optimal) / optimal
-        return max(0.0, effectiveness)
+        usage_rates = counts / total if total > 0 else np.zeros(count)
+        effectiveness = np.maximum(0.0, 1.0 - np.abs(usage_rates - optimal) / optimal)
+        return usage_rates.tolist(), effectiveness.tolist()
     
     def _recommend_additional_triggers(self, current_usage: Dict[str, int]) -> List[str]:
         """Recommend additional psychological triggers"""
-        all_triggers = set(self.psychological_triggers.keys())
-        used_triggers = set(current_usage.keys())
-        unused_triggers = all_triggers - used_triggers
-        
-        # Prioritize high-impact triggers
-        priority_triggers = ["social_proof", "authority", "scarcity"]
-        recommendations = [t for t in priority_triggers if t in unused_triggers]
-        
-        return recommendations[:3]
+        # Prioritize high-impact triggers; all of them are known triggers, so
+        # only the ones already in use need filtering out
+        return [t for t in _PRIORITY_TRIGGERS if t not in current_usage][:3]
     
     def _assess_trigger_balance(self, trigger_usage: Dict[str, int]) -> Dict[str, Any]:
         """Assess balance of psychological triggers"""
         if not trigger_usage:
             return {"balance_score": 0.0, "assessment": "No triggers used"}
         
-        total_usage = sum(trigger_usage.values())
-        usage_distribution = [count / total_usage for count in trigger_usage.values()]
+        usage_distribution = np.fromiter(trigger_usage.values(), dtype=np.float64, count=len(trigger_usage))
+        usage_distribution /= usage_distribution.sum()
         
         # Calculate balance using entropy
-        entropy = -sum(p * np.log2(p) for p in usage_distribution if p > 0)
+        entropy = _entropy(usage_distribution)
         max_entropy = np.log2(len(trigger_usage))
         balance_score = entropy / max_entropy if max_entropy > 0 else 0
         
@@ -675,172 +1027,26 @@ class PsychologyEngine:
         
         return used_principles / total_principles
     
-    def _analyze_emotional_tone(self, content_list: List[Dict[str, Any]], target_emotions: List[str]) -> float:
-        """Analyze emotional tone alignment"""
-        # Simplified emotional analysis
-        # In production, this would use NLP sentiment analysis
-        
-        emotional_keywords = {
-            "curiosity": ["discover", "explore", "learn", "find out"],
-            "interest": ["exciting", "innovative", "breakthrough", "opportunity"],
-            "trust": ["reliable", "proven", "trusted", "secure"],
-            "confidence": ["guaranteed", "certain", "assured", "confident"],
-            "excitement": ["amazing", "incredible", "revolutionary", "game-changing"],
-            "commitment": ["dedicated", "committed", "pledge", "promise"],
-            "urgency": ["now", "limited", "hurry", "deadline"],
-            "determination": ["achieve", "succeed", "accomplish", "win"]
-        }
-        
-        alignment_scores = []
-        
-        for content in content_list:
-            for variant in content.get('copy_variants', []):
-                text = (variant.get('headline', '') + ' ' + variant.get('body_text', '')).lower()
-                
-                for emotion in target_emotions:
-                    keywords = emotional_keywords.get(emotion, [])
-                    keyword_count = sum(1 for keyword in keywords if keyword in text)
-                    alignment_scores.append(min(1.0, keyword_count / len(keywords)))
-        
-        return np.mean(alignment_scores) if alignment_scores else 0.5
-    
-    def _assess_emotional_consistency(self, journey_analysis: Dict[str, Any]) -> float:
-        """Assess emotional consistency across the journey"""
-        if not journey_analysis:
+    def _assess_emotional_consistency(self, stage_alignments: np.ndarray) -> float:
+        """Assess emotional consistency across the journey from its covered stages' alignments"""
+        if not stage_alignments.size:
             return 0.0
         
-        alignment_scores = [
-            stage_data.get('content_alignment', 0.5)
-            for stage_data in journey_analysis.values()
-        ]
-        
-        return np.mean(alignment_scores)
+        return float(stage_alignments.mean())
     
     def _get_cognitive_load_recommendations(self, load_score: float) -> List[str]:
         """Get recommendations for cognitive load optimization"""
-        if load_score > 0.7:
-            return [
-                "Simplify headlines and messaging",
-                "Reduce number of psychological triggers per variant",
-                "Break complex information into digestible chunks"
-            ]
-        elif load_score > 0.4:
-            return [
-                "Consider A/B testing simpler variants",
-                "Optimize information hierarchy"
-            ]
-        else:
-            return ["Cognitive load is optimal"]
-    
-    def _predict_engagement(self, big_five_traits: Dict[str, float]) -> str:
-        """Predict engagement likelihood based on personality traits"""
-        extraversion = big_five_traits.get('extraversion', 0.5)
-        openness = big_five_traits.get('openness', 0.5)
-        
-        engagement_score = (extraversion * 0.6) + (openness * 0.4)
-        
-        if engagement_score > 0.7:
-            return "high"
-        elif engagement_score > 0.4:
-            return "medium"
-        else:
-            return "low"
+        return list(_LOAD_RECS[bisect.bisect_left(_LOAD_THRESHOLDS, load_score)])
     
-    def _predict_decision_speed(self, big_five_traits: Dict[str, float]) -> str:
-        """Predict decision-making speed"""
-        conscientiousness = big_five_traits.get('conscientiousness', 0.5)
-        neuroticism = big_five_traits.get('neuroticism', 0.5)
+    def _predict_all(self, big_five_traits: Dict[str, float]) -> Dict[str, str]:
+        """Predict every behavioral tendency from personality traits in one scoring pass"""
+        traits = np.array([big_five_traits.get(trait, 0.5) for trait in _BEHAVIOR_TRAITS], dtype=np.float64)
         
-        # High conscientiousness = slower (more deliberate)
-        # High neuroticism = slower (more anxious)
-        speed_score = 1.0 - ((conscientiousness * 0.5) + (neuroticism * 0.5))
-        
-        if speed_score > 0.6:
-            return "fast"
-        elif speed_score > 0.3:
-            return "moderate"
-        else:
-            return "slow"
-    
-    def _predict_information_seeking(self, big_five_traits: Dict[str, float]) -> str:
-        """Predict information-seeking behavior"""
-        openness = big_five_traits.get('openness', 0.5)
-        conscientiousness = big_five_traits.get('conscientiousness', 0.5)
-        
-        seeking_score = (openness * 0.6) + (conscientiousness * 0.4)
-        
-        if seeking_score > 0.6:
-            return "high"
-        elif seeking_score > 0.3:
-            return "medium"
-        else:
-            return "low"
-    
-    def _predict_social_sharing(self, big_five_traits: Dict[str, float]) -> str:
-        """Predict social sharing likelihood"""
-        extraversion = big_five_traits.get('extraversion', 0.5)
-        agreeableness = big_five_traits.get('agreeableness', 0.5)
-        
-        sharing_score = (extraversion * 0.7) + (agreeableness * 0.3)
-        
-        if sharing_score > 0.6:
-            return "high"
-        elif sharing_score > 0.3:
-            return "medium"
-        else:
-            return "low"
-    
-    def _predict_risk_tolerance(self, big_five_traits: Dict[str, float]) -> str:
-        """Predict risk tolerance"""
-        openness = big_five_traits.get('openness', 0.5)
-        neuroticism = big_five_traits.get('neuroticism', 0.5)
-        
-        # High openness = higher risk tolerance
-        # High neuroticism = lower risk tolerance
-        tolerance_score = openness - neuroticism
-        
-        if tolerance_score > 0.2:
-            return "high"
-        elif tolerance_score > -0.2:
-            return "medium"
-        else:
-            return "low"
-    
-    def _identify_dominant_behaviors(self, predictions: Dict[str, str]) -> List[str]:
-        """Identify dominant behavioral patterns"""
-        dominant = []
-        
-        if predictions.get('engagement_likelihood') == 'high':
-            dominant.append('high_engagement')
-        
-        if predictions.get('decision_speed') == 'fast':
-            dominant.append('quick_decision')
-        
-        if predictions.get('information_seeking') == 'high':
-            dominant.append('research_oriented')
-        
-        if predictions.get('social_sharing') == 'high':
-            dominant.append('social_amplifier')
-        
-        return dominant
+        return {
+            name: labels[bucket]
+            for name, labels, bucket in zip(_BEHAVIOR_NAMES, _BEHAVIOR_LABELS, _prediction_buckets(traits))
+        }
     
-    def _generate_behavior_optimization_strategies(self, predictions: Dict[str, str]) -> List[str]:
-        """Generate optimization strategies based on behavioral predictions"""
-        strategies = []
-        
-        if predictions.get('engagement_likelihood') == 'low':
-            strategies.append("Use stronger hooks and interactive elements to boost engagement")
-        
-        if predictions.get('decision_speed') == 'slow':
-            strategies.append("Provide comprehensive information and reduce perceived risk")
-        
-        if predictions.get('information_seeking') == 'high':
-            strategies.append("Include detailed resources and supporting documentation")
-        
-        if predictions.get('social_sharing') == 'high':
-            strategies.append("Add social sharing incentives and shareable content formats")
-        
-        if predictions.get('risk_tolerance') == 'low':
-            strategies.append("Emphasize security, guarantees, and risk mitigation")
-        
-        return strategies
\ No newline at end of file
+    def _behavior_mask(self, predictions: Dict[str, str]) -> int:
+        """Encode the behavioral conditions met by predictions as a bitmask"""
+        return reduce(or_, (_CONDITION_BIT.get(item, 0) for item in predictions.items()), 0)
\ No newline at end of file
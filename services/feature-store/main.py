@@ -1,17 +1,15 @@
 import asyncio
 import logging
-import threading
-from concurrent.futures import ThreadPoolExecutor
 import uvicorn
 from fastapi import FastAPI
-import grpc
+from grpc import aio
 from grpc_reflection.v1alpha import reflection
 
-from src.rest_api import create_rest_app
+from src.rest_api import create_rest_app, init_sentry
 from src.grpc_server import FeatureStoreServicer, add_FeatureStoreServicer_to_server
 from src.feature_store_pb2 import DESCRIPTOR
 from src.pipeline import FeaturePipeline
-from src.config import Config
+from src.config import get_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -23,9 +21,11 @@ class FeatureStoreServer:
     """
     
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
+        init_sentry(self.config)
         self.pipeline = FeaturePipeline(self.config)
         self.grpc_server = None
+        self.grpc_task = None
         self.rest_app = None
         
     async def start_services(self):
@@ -34,9 +34,8 @@ class FeatureStoreServer:
             # Initialize pipeline
             await self.pipeline.initialize()
             
-            # Start gRPC server in background thread
-            grpc_thread = threading.Thread(target=self.start_grpc_server, daemon=True)
-            grpc_thread.start()
+            # Serve gRPC on this event loop alongside the REST API
+            self.grpc_task = asyncio.create_task(self.start_grpc_server())
             
             # Create REST app
             self.rest_app = create_rest_app(self.pipeline)
@@ -47,13 +46,17 @@ class FeatureStoreServer:
             logger.error(f"Failed to start services: {e}")
             raise
     
-    def start_grpc_server(self):
+    async def start_grpc_server(self):
         """Start gRPC server"""
         try:
-            self.grpc_server = grpc.server(ThreadPoolExecutor(max_workers=10))
+            self.grpc_server = aio.server()
             
             # Add servicer
-            servicer = FeatureStoreServicer(self.pipeline)
+            servicer = FeatureStoreServicer(
+                self.pipeline,
+                pack_culture_vectors=self.config.grpc_pack_culture_vectors,
+                response_cache_ttl=self.config.grpc_response_cache_ttl_seconds
+            )
             add_FeatureStoreServicer_to_server(servicer, self.grpc_server)
             
             # Enable reflection
@@ -66,12 +69,12 @@ class FeatureStoreServer:
             # Start server
             listen_addr = f'[::]:{self.config.grpc_port}'
             self.grpc_server.add_insecure_port(listen_addr)
-            self.grpc_server.start()
+            await self.grpc_server.start()
             
             logger.info(f"gRPC server started on port {self.config.grpc_port}")
             
             # Keep server running
-            self.grpc_server.wait_for_termination()
+            await self.grpc_server.wait_for_termination()
             
         except Exception as e:
             logger.error(f"gRPC server failed: {e}")
@@ -80,7 +83,7 @@ class FeatureStoreServer:
         """Stop all services"""
         try:
             if self.grpc_server:
-                self.grpc_server.stop(grace=5)
+                await self.grpc_server.stop(grace=5)
             
             await self.pipeline.close()
             
@@ -101,9 +104,15 @@ async def main():
             app=server.rest_app,
             host="0.0.0.0",
             port=server.config.rest_port,
-            log_level="info"
+            log_level="info",
+            access_log=False,
+            http="httptools",
+            backlog=server.config.rest_backlog,
+            timeout_keep_alive=server.config.rest_keep_alive_seconds
         )
         
+        # Both servers share this loop; gRPC was started as a task by start_services
+        # and is stopped below once uvicorn returns
         rest_server = uvicorn.Server(config)
         await rest_server.serve()
         
@@ -112,5 +121,15 @@ async def main():
     finally:
         await server.stop_services()
 
+def install_event_loop_policy():
+    """Run REST and gRPC on uvloop when available (uvicorn[standard] ships it outside Windows)"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 if __name__ == "__main__":
+    install_event_loop_policy()
     asyncio.run(main())
\ No newline at end of file
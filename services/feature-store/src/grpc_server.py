@@ -1,66 +1,84 @@
 import grpc
 from concurrent import futures
+import calendar
 import logging
-from typing import List
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from datetime import datetime
+import numpy as np
 
 from .feature_store_pb2_grpc import FeatureStoreServicer as BaseFeatureStoreServicer
 from .feature_store_pb2_grpc import add_FeatureStoreServicer_to_server
 from . import feature_store_pb2 as pb2
 from .pipeline import FeaturePipeline
-from .schema import CompanyFeatures, TractionMetrics
+from .schema import CULTURE_VECTOR_DIM, CompanyFeatures, validate_feature_columns
 
 logger = logging.getLogger(__name__)
 
+# Features per streamed GetHistoricalFeatures message
+_HISTORICAL_BATCH_SIZE = 256
+
+# Most distinct GetOnlineFeatures queries whose responses are kept
+_RESPONSE_CACHE_CAPACITY = 10_000
+
+@lru_cache(maxsize=1024)
+def _timestamp_fields(dt: datetime) -> Tuple[int, int]:
+    """
+    (seconds, nanos) of a protobuf Timestamp for dt, naive datetimes being UTC as in
+    Timestamp.FromDatetime; cached since features are stamped at shared ingestion times
+    """
+    return calendar.timegm(dt.utctimetuple()), dt.microsecond * 1000
+
+def _set_timestamp(timestamp, dt: datetime):
+    """Write dt into a Timestamp field of a message in place"""
+    timestamp.seconds, timestamp.nanos = _timestamp_fields(dt)
+
 class FeatureStoreServicer(BaseFeatureStoreServicer):
     """
     gRPC servicer for feature store
     """
     
-    def __init__(self, pipeline: FeaturePipeline):
+    def __init__(
+        self,
+        pipeline: FeaturePipeline,
+        pack_culture_vectors: bool = False,
+        response_cache_ttl: float = 0.0
+    ):
         self.pipeline = pipeline
+        self.pack_culture_vectors = pack_culture_vectors
+        
+        # Short-lived LRU of online responses for repeated polling queries (0 disables)
+        self.response_cache_ttl = response_cache_ttl
+        self._response_cache: OrderedDict = OrderedDict()
     
     async def GetOnlineFeatures(self, request, context):
         """Get features for online serving"""
         try:
+            cache_key = (tuple(request.company_ids), tuple(request.feature_names))
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return cached
+            
+            # Read before fetching, so a write landing meanwhile still invalidates it
+            write_version = self.pipeline.write_version
             features = await self.pipeline.get_online_features(
                 company_ids=list(request.company_ids),
                 feature_names=list(request.feature_names) if request.feature_names else None
             )
             
             # Convert to protobuf
-            pb_features = []
-            for feature in features:
-                pb_traction = pb2.TractionMetrics(
-                    funding_amount=feature.traction_metrics.funding_amount,
-                    employee_count=feature.traction_metrics.employee_count,
-                    growth_rate=feature.traction_metrics.growth_rate,
-                    market_sentiment=feature.traction_metrics.market_sentiment,
-                    revenue_growth=feature.traction_metrics.revenue_growth or 0.0,
-                    user_growth=feature.traction_metrics.user_growth or 0.0
-                )
-                
-                pb_feature = pb2.CompanyFeatures(
-                    company_id=feature.company_id,
-                    user_overlap_score=feature.user_overlap_score,
-                    traction_metrics=pb_traction,
-                    culture_vector=feature.culture_vector,
-                    match_outcome=feature.match_outcome or 0,
-                    timestamp=self._datetime_to_timestamp(feature.timestamp)
-                )
-                
-                pb_features.append(pb_feature)
-            
-            metadata = pb2.ResponseMetadata(
-                feature_count=len(features),
-                query_time=self._datetime_to_timestamp(datetime.utcnow()),
-                latency_ms=0.0  # Would measure actual latency
-            )
+            response = pb2.OnlineFeaturesResponse()
+            self._fill_pb_features(response.features, features)
             
-            return pb2.OnlineFeaturesResponse(
-                features=pb_features,
-                metadata=metadata
-            )
+            response.metadata.feature_count = len(features)
+            response.metadata.query_time.FromDatetime(datetime.utcnow())
+            response.metadata.latency_ms = 0.0  # Would measure actual latency
+            
+            self._cache_response(cache_key, write_version, response)
+            
+            return response
             
         except Exception as e:
             logger.error(f"GetOnlineFeatures failed: {e}")
@@ -69,97 +87,99 @@ class FeatureStoreServicer(BaseFeatureStoreServicer):
             return pb2.OnlineFeaturesResponse()
     
     async def GetHistoricalFeatures(self, request, context):
-        """Get historical features for training"""
+        """Stream historical features for training in batches"""
         try:
             # Convert timestamps
             start_time = self._timestamp_to_datetime(request.start_time)
             end_time = self._timestamp_to_datetime(request.end_time)
             
-            # Get features (simplified - would implement proper historical lookup)
-            features = await self.pipeline.get_online_features(
+            # Records are streamed from the store as they are read, time range filtered
+            # there, and sent one batch at a time; a storage failure raises, ending the
+            # stream with an error status
+            query_time = datetime.utcnow()
+            batch = []
+            sent = False
+            async for feature in self.pipeline.iter_historical(
                 company_ids=list(request.company_ids),
+                start_time=start_time,
+                end_time=end_time,
                 feature_names=list(request.feature_names) if request.feature_names else None
-            )
+            ):
+                batch.append(feature)
+                if len(batch) == _HISTORICAL_BATCH_SIZE:
+                    yield self._historical_response(batch, query_time)
+                    batch = []
+                    sent = True
             
-            # Filter by time range
-            filtered_features = [
-                f for f in features 
-                if start_time <= f.timestamp <= end_time
-            ]
-            
-            # Convert to protobuf
-            pb_features = []
-            for feature in filtered_features:
-                pb_traction = pb2.TractionMetrics(
-                    funding_amount=feature.traction_metrics.funding_amount,
-                    employee_count=feature.traction_metrics.employee_count,
-                    growth_rate=feature.traction_metrics.growth_rate,
-                    market_sentiment=feature.traction_metrics.market_sentiment,
-                    revenue_growth=feature.traction_metrics.revenue_growth or 0.0,
-                    user_growth=feature.traction_metrics.user_growth or 0.0
-                )
-                
-                pb_feature = pb2.CompanyFeatures(
-                    company_id=feature.company_id,
-                    user_overlap_score=feature.user_overlap_score,
-                    traction_metrics=pb_traction,
-                    culture_vector=feature.culture_vector,
-                    match_outcome=feature.match_outcome or 0,
-                    timestamp=self._datetime_to_timestamp(feature.timestamp)
-                )
-                
-                pb_features.append(pb_feature)
-            
-            metadata = pb2.ResponseMetadata(
-                feature_count=len(filtered_features),
-                query_time=self._datetime_to_timestamp(datetime.utcnow()),
-                latency_ms=0.0
-            )
-            
-            return pb2.HistoricalFeaturesResponse(
-                features=pb_features,
-                metadata=metadata
-            )
+            # An empty result still sends one message carrying the metadata
+            if batch or not sent:
+                yield self._historical_response(batch, query_time)
             
         except Exception as e:
             logger.error(f"GetHistoricalFeatures failed: {e}")
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Failed to get historical features: {str(e)}")
-            return pb2.HistoricalFeaturesResponse()
     
     async def WriteFeatures(self, request, context):
         """Write features to store"""
         try:
-            # Convert from protobuf
-            features = []
-            for pb_feature in request.features:
-                traction_metrics = TractionMetrics(
-                    funding_amount=pb_feature.traction_metrics.funding_amount,
-                    employee_count=pb_feature.traction_metrics.employee_count,
-                    growth_rate=pb_feature.traction_metrics.growth_rate,
-                    market_sentiment=pb_feature.traction_metrics.market_sentiment,
-                    revenue_growth=pb_feature.traction_metrics.revenue_growth,
-                    user_growth=pb_feature.traction_metrics.user_growth
-                )
-                
-                feature = CompanyFeatures(
-                    company_id=pb_feature.company_id,
-                    user_overlap_score=pb_feature.user_overlap_score,
-                    traction_metrics=traction_metrics,
-                    culture_vector=list(pb_feature.culture_vector),
-                    match_outcome=pb_feature.match_outcome,
-                    timestamp=self._timestamp_to_datetime(pb_feature.timestamp)
-                )
-                
-                features.append(feature)
+            # Convert from protobuf straight into columns, one pass over the request
+            pb_features = request.features
+            count = len(pb_features)
+            company_ids = []
+            timestamps = []
+            user_overlap_score = np.empty(count)
+            funding_amount = np.empty(count)
+            employee_count = np.empty(count, dtype=np.int64)
+            growth_rate = np.empty(count)
+            market_sentiment = np.empty(count)
+            revenue_growth = np.empty(count)
+            user_growth = np.empty(count)
+            match_outcome = np.empty(count, dtype=np.int64)
+            culture_vectors = np.empty((count, CULTURE_VECTOR_DIM), dtype=np.float32)
+            
+            for i, pb_feature in enumerate(pb_features):
+                traction = pb_feature.traction_metrics
+                company_ids.append(pb_feature.company_id)
+                timestamps.append(self._timestamp_to_datetime(pb_feature.timestamp))
+                user_overlap_score[i] = pb_feature.user_overlap_score
+                funding_amount[i] = traction.funding_amount
+                employee_count[i] = traction.employee_count
+                growth_rate[i] = traction.growth_rate
+                market_sentiment[i] = traction.market_sentiment
+                revenue_growth[i] = traction.revenue_growth
+                user_growth[i] = traction.user_growth
+                match_outcome[i] = pb_feature.match_outcome
+                culture_vector = self._read_culture_vector(pb_feature)
+                # Checked before assigning, as a shorter vector would be broadcast
+                if len(culture_vector) != CULTURE_VECTOR_DIM:
+                    raise ValueError(f"culture_vector must have exactly {CULTURE_VECTOR_DIM} dimensions")
+                culture_vectors[i] = culture_vector
+            
+            columns = {
+                'company_id': company_ids,
+                'user_overlap_score': user_overlap_score,
+                'funding_amount': funding_amount,
+                'employee_count': employee_count,
+                'growth_rate': growth_rate,
+                'market_sentiment': market_sentiment,
+                'revenue_growth': revenue_growth,
+                'user_growth': user_growth,
+                'culture_vector': culture_vectors,
+                'match_outcome': match_outcome,
+                'timestamp': timestamps
+            }
+            
+            # The constraints CompanyFeatures enforces on REST writes, checked per column
+            validate_feature_columns(columns)
             
             # Store features
-            await self.pipeline._store_features(features)
+            await self.pipeline._store_features_columnar(columns)
             
             return pb2.WriteFeaturesResponse(
                 success=True,
-                message=f"Successfully wrote {len(features)} features",
-                features_written=len(features)
+                message=f"Successfully wrote {count} features",
+                features_written=count
             )
             
         except Exception as e:
@@ -177,12 +197,14 @@ class FeatureStoreServicer(BaseFeatureStoreServicer):
         try:
             stats = await self.pipeline.get_feature_stats()
             
-            return pb2.FeatureStatsResponse(
+            response = pb2.FeatureStatsResponse(
                 total_companies=stats['total_companies'],
                 feature_count=stats['feature_count'],
-                last_updated=self._datetime_to_timestamp(stats['last_updated']),
                 storage_size_mb=stats['storage_size_mb']
             )
+            _set_timestamp(response.last_updated, stats['last_updated'])
+            
+            return response
             
         except Exception as e:
             logger.error(f"GetFeatureStats failed: {e}")
@@ -193,10 +215,10 @@ class FeatureStoreServicer(BaseFeatureStoreServicer):
     async def HealthCheck(self, request, context):
         """Health check"""
         try:
-            return pb2.HealthCheckResponse(
-                status="healthy",
-                timestamp=self._datetime_to_timestamp(datetime.utcnow())
-            )
+            response = pb2.HealthCheckResponse(status="healthy")
+            response.timestamp.FromDatetime(datetime.utcnow())
+            
+            return response
             
         except Exception as e:
             logger.error(f"HealthCheck failed: {e}")
@@ -204,12 +226,85 @@ class FeatureStoreServicer(BaseFeatureStoreServicer):
             context.set_details(f"Health check failed: {str(e)}")
             return pb2.HealthCheckResponse(status="unhealthy")
     
-    def _datetime_to_timestamp(self, dt: datetime):
-        """Convert datetime to protobuf timestamp"""
-        from google.protobuf.timestamp_pb2 import Timestamp
-        timestamp = Timestamp()
-        timestamp.FromDatetime(dt)
-        return timestamp
+    def _cached_response(self, key: tuple) -> Optional[pb2.OnlineFeaturesResponse]:
+        """
+        Return a cached response that has not expired and was built since the last
+        write to the store (through any API), and mark it as recently used
+        """
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, write_version, response = entry
+        if expires_at <= time.monotonic() or write_version != self.pipeline.write_version:
+            del self._response_cache[key]
+            return None
+        
+        self._response_cache.move_to_end(key)
+        return response
+    
+    def _cache_response(self, key: tuple, write_version: int, response: pb2.OnlineFeaturesResponse):
+        """
+        Insert a response read at the pipeline's write_version and evict the least
+        recently used ones over capacity
+        """
+        if self.response_cache_ttl <= 0:
+            return
+        
+        self._response_cache[key] = (
+            time.monotonic() + self.response_cache_ttl, write_version, response
+        )
+        self._response_cache.move_to_end(key)
+        
+        while len(self._response_cache) > _RESPONSE_CACHE_CAPACITY:
+            self._response_cache.popitem(last=False)
+    
+    def _fill_pb_features(self, pb_features, features: List[CompanyFeatures]):
+        """
+        Populate a repeated CompanyFeatures field in place, avoiding per-record
+        temporary messages and the copy made when nesting them
+        """
+        for feature in features:
+            pb_feature = pb_features.add()
+            pb_feature.company_id = feature.company_id
+            pb_feature.user_overlap_score = feature.user_overlap_score
+            pb_feature.match_outcome = feature.match_outcome or 0
+            if self.pack_culture_vectors:
+                pb_feature.culture_vector_packed = np.asarray(feature.culture_vector, dtype='<f2').tobytes()
+            else:
+                pb_feature.culture_vector.extend(feature.culture_vector)
+            _set_timestamp(pb_feature.timestamp, feature.timestamp)
+            
+            traction = feature.traction_metrics
+            pb_traction = pb_feature.traction_metrics
+            pb_traction.funding_amount = traction.funding_amount
+            pb_traction.employee_count = traction.employee_count
+            pb_traction.growth_rate = traction.growth_rate
+            pb_traction.market_sentiment = traction.market_sentiment
+            pb_traction.revenue_growth = traction.revenue_growth or 0.0
+            pb_traction.user_growth = traction.user_growth or 0.0
+    
+    def _historical_response(self, features: List[CompanyFeatures], query_time: datetime) -> pb2.HistoricalFeaturesResponse:
+        """One streamed GetHistoricalFeatures message for a batch of features"""
+        response = pb2.HistoricalFeaturesResponse()
+        self._fill_pb_features(response.features, features)
+        
+        response.metadata.feature_count = len(features)
+        response.metadata.query_time.FromDatetime(query_time)
+        response.metadata.latency_ms = 0.0
+        
+        return response
+    
+    def _read_culture_vector(self, pb_feature) -> np.ndarray:
+        """
+        Decode culture_vector, preferring the packed float16 form (a zero-copy view)
+        when a client sent it; repeated values are read straight into a float array,
+        as the container exposes no buffer
+        """
+        if pb_feature.culture_vector_packed:
+            return np.frombuffer(pb_feature.culture_vector_packed, dtype='<f2')
+        culture_vector = pb_feature.culture_vector
+        return np.fromiter(culture_vector, dtype=np.float64, count=len(culture_vector))
     
     def _timestamp_to_datetime(self, timestamp) -> datetime:
         """Convert protobuf timestamp to datetime"""
@@ -1,19 +1,30 @@
 import asyncio
+import bisect
 import logging
+from contextlib import nullcontext
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Set
 from datetime import datetime, timedelta
-import json
 import os
+import re
+import uuid
 from pathlib import Path
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
 import cudf
+import cupy
 import nvtabular as nvt
 from merlin.core.utils import Distributed
 from merlin.models.tf import Model
 from merlin.schema import Schema, Tags
 import redis.asyncio as redis
+import msgpack
+import orjson
+import zstandard
 from kafka import KafkaConsumer
 import asyncpg
 
@@ -22,6 +33,256 @@ from .schema import CompanyFeatures, TractionMetrics
 
 logger = logging.getLogger(__name__)
 
+# Column order of the stored feature table
+_FEATURE_COLUMNS = (
+    'company_id',
+    'user_overlap_score',
+    'funding_amount',
+    'employee_count',
+    'growth_rate',
+    'market_sentiment',
+    'revenue_growth',
+    'user_growth',
+    'culture_vector',
+    'match_outcome',
+    'timestamp'
+)
+
+# Culture categories and their signal keywords, each filling _CULTURE_DIMS_PER_CATEGORY
+# consecutive dimensions of the culture vector; vectors are computed and stored as
+# float32
+_CULTURE_KEYWORDS = {
+    'innovation': ['innovation', 'creative', 'breakthrough', 'cutting-edge'],
+    'collaboration': ['team', 'together', 'partnership', 'collaborate'],
+    'growth': ['growth', 'scale', 'expand', 'ambitious'],
+    'customer_focus': ['customer', 'user', 'client', 'satisfaction'],
+    'quality': ['quality', 'excellence', 'best', 'premium'],
+    'agility': ['agile', 'fast', 'quick', 'responsive'],
+    'transparency': ['transparent', 'open', 'honest', 'clear'],
+    'diversity': ['diverse', 'inclusive', 'equality', 'belonging']
+}
+_CULTURE_DIMS_PER_CATEGORY = 16
+_CULTURE_VECTOR_DIM = 128
+
+# Redis hash caching the latest features per company, and its TTL (refreshed on
+# every write)
+_FEATURE_CACHE_KEY = "features:latest"
+_FEATURE_CACHE_TTL_SECONDS = 3600
+
+# Cached feature payloads are msgpack compressed with zstd at this level
+_ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+_ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Serialized /features/company responses, one per company and feature view, only
+# ever written (for the default view) when features are stored
+_ONLINE_PAYLOAD_KEY = "feat:{company_id}:{feature_view}"
+_DEFAULT_FEATURE_VIEW = "default"
+
+# Redis set of every company with stored features, shared by all replicas; added to
+# on every write and never expired, so a company missing from it has no features
+_COMPANY_INDEX_KEY = "features:companies"
+_COMPANY_INDEX_CHUNK_SIZE = 10_000
+
+# Generator for the mock user overlap scores (PCG64, faster than the legacy global
+# RandomState)
+_RNG = np.random.default_rng()
+
+# Rows per parquet row group; files are sorted by company so small groups let
+# company filters skip most of a file
+_PARQUET_ROW_GROUP_ROWS = 10_000
+
+# Numeric columns the Merlin workflow normalizes
+_MERLIN_NORMALIZED_COLUMNS = (
+    'user_overlap_score',
+    'funding_amount',
+    'employee_count',
+    'growth_rate',
+    'market_sentiment'
+)
+
+# Event mention counters and the keywords that flag an event for each; kept as
+# separate patterns since one event may count towards several
+_MENTION_PATTERNS = {
+    'funding_mentions': re.compile('funding|raised|investment'),
+    'employee_mentions': re.compile('employee|hiring|team'),
+    'growth_mentions': re.compile('growth|expansion|scale')
+}
+
+# Pulse events of a time window, oldest first
+_PULSE_EVENTS_QUERY = """
+    SELECT 
+        company,
+        entities,
+        sentiment,
+        source,
+        timestamp,
+        content
+    FROM market_pulse_events 
+    WHERE timestamp BETWEEN $1 AND $2
+    ORDER BY timestamp
+"""
+
+# Pulse events read per chunk through the server-side cursor
+_EVENT_CHUNK_SIZE = 10_000
+
+# How per-company aggregates of event chunks are computed and combined
+_EVENT_AGGREGATIONS = {
+    'sentiment_sum': 'sum',
+    'sentiment_count': 'sum',
+    'funding_mentions': 'sum',
+    'employee_mentions': 'sum',
+    'growth_mentions': 'sum',
+    'content': ' '.join
+}
+
+def _column_values(values) -> List[Any]:
+    """Python values of a feature column, unboxing numpy arrays for JSON"""
+    return values.tolist() if isinstance(values, np.ndarray) else values
+
+def _features_to_columns(features: List[CompanyFeatures]) -> Dict[str, Any]:
+    """
+    Feature records as columns keyed by field name: numeric fields as numpy arrays
+    and culture vectors as one 2-D float32 array; nullable fields stay lists of values
+    """
+    count = len(features)
+    traction = [feature.traction_metrics for feature in features]
+    return {
+        'company_id': [feature.company_id for feature in features],
+        'user_overlap_score': np.fromiter((feature.user_overlap_score for feature in features), dtype=np.float64, count=count),
+        'funding_amount': np.fromiter((metrics.funding_amount for metrics in traction), dtype=np.float64, count=count),
+        'employee_count': np.fromiter((metrics.employee_count for metrics in traction), dtype=np.int64, count=count),
+        'growth_rate': np.fromiter((metrics.growth_rate for metrics in traction), dtype=np.float64, count=count),
+        'market_sentiment': np.fromiter((metrics.market_sentiment for metrics in traction), dtype=np.float64, count=count),
+        'revenue_growth': [metrics.revenue_growth for metrics in traction],
+        'user_growth': [metrics.user_growth for metrics in traction],
+        'culture_vector': np.array([feature.culture_vector for feature in features], dtype=np.float32),
+        'match_outcome': [feature.match_outcome for feature in features],
+        'timestamp': [feature.timestamp for feature in features]
+    }
+
+def _fixed_size_list_array(values: np.ndarray) -> pa.FixedSizeListArray:
+    """Arrow FixedSizeList(float32) column over the rows of a 2-D array"""
+    flat = np.ascontiguousarray(values, dtype=np.float32).reshape(-1)
+    return pa.FixedSizeListArray.from_arrays(pa.array(flat), values.shape[1])
+
+def _encode_cached_feature(feature: Dict[str, Any]) -> bytes:
+    """Redis payload of a feature in the CompanyFeatures JSON layout"""
+    return _ZSTD_COMPRESSOR.compress(msgpack.packb(feature, use_bin_type=True))
+
+def _online_payload(feature: Dict[str, Any]) -> bytes:
+    """
+    JSON body of the online response for a feature in the CompanyFeatures JSON
+    layout, so serving it needs no model reconstruction
+    """
+    traction_metrics = feature['traction_metrics']
+    return orjson.dumps({
+        'company_id': feature['company_id'],
+        'features': {
+            'user_overlap_score': feature['user_overlap_score'],
+            'funding_amount': traction_metrics['funding_amount'],
+            'employee_count': traction_metrics['employee_count'],
+            'growth_rate': traction_metrics['growth_rate'],
+            'market_sentiment': traction_metrics['market_sentiment'],
+            'culture_vector': feature['culture_vector'],
+            'match_outcome': feature['match_outcome']
+        },
+        'timestamp': feature['timestamp'],
+        'ttl_seconds': _FEATURE_CACHE_TTL_SECONDS
+    })
+
+def _decode_cached_feature(payload: bytes) -> CompanyFeatures:
+    """Feature from a Redis payload, also accepting JSON cached by earlier versions"""
+    if not payload.startswith(_ZSTD_MAGIC):
+        return CompanyFeatures.model_validate_json(payload)
+    return CompanyFeatures(**msgpack.unpackb(_ZSTD_DECOMPRESSOR.decompress(payload), raw=False))
+
+def _json_text(value: Any) -> str:
+    """JSON text of a value, for the JSONB codec"""
+    return orjson.dumps(value).decode()
+
+async def _init_db_connection(conn: asyncpg.Connection):
+    """Decode JSONB columns (event entities and sentiment) as rows arrive from the pool"""
+    await conn.set_type_codec('jsonb', encoder=_json_text, decoder=orjson.loads, schema='pg_catalog')
+
+def _compound_sentiment(sentiment: Any) -> float:
+    """
+    Compound score of an event's sentiment, NaN when missing or zero (which does not
+    count towards the average); sentiment is decoded by the pool's JSONB codec but
+    still accepted as JSON text
+    """
+    if isinstance(sentiment, (str, bytes)):
+        sentiment = orjson.loads(sentiment)
+    compound = sentiment.get('compound') if isinstance(sentiment, dict) else None
+    return compound or np.nan
+
+def _aggregate_events(events: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Per-company aggregates of a chunk of pulse events, indexed by company in first-seen
+    order: sentiment sum and count (only non-zero compound scores count), numbers of
+    events with each kind of mention, and the lowercased content joined by spaces
+    """
+    events_df = pd.DataFrame(events)
+    content = events_df['content'].fillna('').str.lower()
+    
+    # Compound scores in one pass straight into a float array
+    compound = np.fromiter(
+        map(_compound_sentiment, events_df['sentiment']), dtype=np.float64, count=len(events_df)
+    )
+    scored = ~np.isnan(compound)
+    
+    return pd.DataFrame({
+        'company': events_df['company'],
+        'sentiment_sum': np.where(scored, compound, 0.0),
+        'sentiment_count': scored.astype(np.int64),
+        **{
+            mention: content.str.contains(pattern)
+            for mention, pattern in _MENTION_PATTERNS.items()
+        },
+        'content': content
+    }).groupby('company', sort=False).agg(_EVENT_AGGREGATIONS)
+
+def _merge_aggregates(partials: List[pd.DataFrame]) -> pd.DataFrame:
+    """Combine the aggregates of successive event chunks, keeping first-seen company order"""
+    if len(partials) == 1:
+        return partials[0]
+    return pd.concat(partials).groupby(level=0, sort=False).agg(_EVENT_AGGREGATIONS)
+
+def _culture_vector(content_lower: str) -> np.ndarray:
+    """Normalized float32 culture vector of a company's lowercased content"""
+    # Mock implementation - in reality, this would use NLP models
+    # to extract cultural indicators from company communications
+    
+    # Simple keyword-based culture vector (mock): each keyword is counted on its
+    # own, as str.count is a C-level scan and keywords may contain one another
+    counts = np.array([
+        sum(content_lower.count(keyword) for keyword in keywords)
+        for keywords in _CULTURE_KEYWORDS.values()
+    ], dtype=np.float32)
+    
+    # Each category fills consecutive dims; pad or truncate to exactly 128
+    vector = np.zeros(_CULTURE_VECTOR_DIM, dtype=np.float32)
+    category_dims = np.repeat(counts / np.float32(max(len(content_lower), 1)), _CULTURE_DIMS_PER_CATEGORY)[:_CULTURE_VECTOR_DIM]
+    vector[:len(category_dims)] = category_dims
+    
+    # Normalize vector
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    
+    return vector
+
+def _stored_company_ids(parquet_files: List[Path]) -> Set[str]:
+    """Every company with a stored feature record, decoding only company_id"""
+    company_ids = set()
+    for parquet_file in parquet_files:
+        try:
+            column = pq.read_table(parquet_file, columns=['company_id'])['company_id']
+            company_ids.update(pc.unique(column).to_pylist())
+        except Exception as e:
+            logger.error(f"Failed to read company ids from {parquet_file}: {e}")
+    return company_ids
+
 class FeaturePipeline:
     """
     NVIDIA Merlin-based feature pipeline for processing market pulse events
@@ -38,18 +299,46 @@ class FeaturePipeline:
         self.feature_store_path.mkdir(parents=True, exist_ok=True)
         self.model_path.mkdir(parents=True, exist_ok=True)
         
+        # Feature files in date order, listed once and kept current by writes so reads
+        # never scan the directory
+        self._parquet_files: List[Path] = sorted(self.feature_store_path.glob("features_*.parquet"))
+        
+        # Companies known to have stored features, checked before the shared company
+        # index; only ever a subset of it, as other replicas write too
+        self._known_company_ids: Set[str] = _stored_company_ids(self._parquet_files)
+        
+        # Bumped by every store, so caches of read results can tell they may be stale
+        self.write_version = 0
+        
         # Initialize Merlin components
         self.workflow: Optional[nvt.Workflow] = None
+        self.workflow_fitted = False
         self.schema: Optional[Schema] = None
         
+        # Long-lived Dask-CUDA cluster the Merlin workflow runs on (None runs it in-process)
+        self.dask_cluster = None
+        self.dask_client = None
+        
     async def initialize(self):
         """Initialize pipeline components"""
         try:
             # Initialize Redis
             self.redis_client = redis.from_url(self.config.redis_url)
+            await self._seed_company_index()
             
             # Initialize database pool
-            self.db_pool = await asyncpg.create_pool(self.config.database_url)
+            self.db_pool = await asyncpg.create_pool(
+                self.config.database_url,
+                min_size=self.config.db_pool_min_size,
+                max_size=self.config.db_pool_max_size,
+                max_inactive_connection_lifetime=self.config.db_pool_max_inactive_connection_lifetime,
+                command_timeout=self.config.db_command_timeout,
+                statement_cache_size=self.config.db_statement_cache_size,
+                init=_init_db_connection
+            )
+            
+            # Start the Dask-CUDA cluster once rather than per Merlin transform
+            self._start_dask_cluster()
             
             # Setup Merlin workflow
             await self._setup_merlin_workflow()
@@ -63,6 +352,12 @@ class FeaturePipeline:
             logger.error(f"Failed to initialize pipeline: {e}")
             raise
     
+    async def _seed_company_index(self):
+        """Add the companies of the local feature files to the shared company index"""
+        company_ids = list(self._known_company_ids)
+        for start in range(0, len(company_ids), _COMPANY_INDEX_CHUNK_SIZE):
+            await self.redis_client.sadd(_COMPANY_INDEX_KEY, *company_ids[start:start + _COMPANY_INDEX_CHUNK_SIZE])
+    
     async def close(self):
         """Close pipeline connections"""
         try:
@@ -72,11 +367,37 @@ class FeaturePipeline:
             if self.db_pool:
                 await self.db_pool.close()
             
+            if self.dask_client:
+                self.dask_client.close()
+                self.dask_cluster.close()
+            
             logger.info("Feature pipeline closed")
             
         except Exception as e:
             logger.error(f"Error closing pipeline: {e}")
     
+    def _start_dask_cluster(self):
+        """
+        Start a local Dask-CUDA cluster with one worker per GPU for Merlin transforms;
+        without dask_cuda or a GPU the workflow keeps running in-process
+        """
+        if not self.config.dask_cuda_enabled:
+            return
+        
+        try:
+            from dask_cuda import LocalCUDACluster
+            from distributed import Client
+            
+            self.dask_cluster = LocalCUDACluster()
+            self.dask_client = Client(self.dask_cluster)
+            
+            logger.info(f"Dask-CUDA cluster started: {self.dask_client.dashboard_link}")
+            
+        except Exception as e:
+            logger.error(f"Failed to start Dask-CUDA cluster, running Merlin in-process: {e}")
+            self.dask_cluster = None
+            self.dask_client = None
+    
     async def _setup_merlin_workflow(self):
         """Setup NVIDIA Merlin workflow for feature engineering"""
         try:
@@ -110,388 +431,459 @@ class FeaturePipeline:
             
             self.workflow = nvt.Workflow(workflow_ops)
             
+            # Reuse a workflow fitted by an earlier run, loaded once instead of per batch
+            workflow_path = self.model_path / "workflow"
+            if workflow_path.exists():
+                self.workflow = nvt.Workflow.load(str(workflow_path))
+                self.workflow_fitted = True
+            
             logger.info("Merlin workflow setup completed")
             
         except Exception as e:
             logger.error(f"Failed to setup Merlin workflow: {e}")
             raise
     
-    async def process_pulse_events(self, start_time: datetime, end_time: datetime) -> int:
+    async def process_pulse_events(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        precompute_online: bool = False
+    ) -> int:
         """
         Process pulse events and generate features
         """
         try:
             logger.info(f"Processing pulse events from {start_time} to {end_time}")
             
-            # Fetch pulse events from database
-            events = await self._fetch_pulse_events(start_time, end_time)
+            # Aggregate events chunk by chunk as they stream from the database, so the
+            # whole window is never held as rows
+            partials = [
+                _aggregate_events(events)
+                async for events in self._stream_pulse_events(start_time, end_time)
+            ]
             
-            if not events:
+            if not partials:
                 logger.info("No events to process")
                 return 0
             
-            # Transform events to features
-            features = await self._transform_events_to_features(events)
+            # Transform aggregates to features
+            features = await self._features_from_aggregates(_merge_aggregates(partials))
+            
+            # One columnar copy of the features feeds both Merlin and storage
+            if not features:
+                logger.info("No features to process")
+                return 0
+            columns = _features_to_columns(features)
             
             # Process with Merlin
-            processed_features = await self._process_with_merlin(features)
+            await self._process_with_merlin_columnar(columns)
             
             # Store features
-            await self._store_features(processed_features)
+            await self._store_features_columnar(columns, precompute_online)
             
-            logger.info(f"Processed {len(processed_features)} feature records")
-            return len(processed_features)
+            logger.info(f"Processed {len(features)} feature records")
+            return len(features)
             
         except Exception as e:
             logger.error(f"Failed to process pulse events: {e}")
             raise
     
-    async def _fetch_pulse_events(self, start_time: datetime, end_time: datetime) -> List[Dict[str, Any]]:
-        """Fetch pulse events from database"""
-        try:
-            async with self.db_pool.acquire() as conn:
-                rows = await conn.fetch("""
-                    SELECT 
-                        company,
-                        entities,
-                        sentiment,
-                        source,
-                        timestamp,
-                        content
-                    FROM market_pulse_events 
-                    WHERE timestamp BETWEEN $1 AND $2
-                    ORDER BY timestamp
-                """, start_time, end_time)
-                
-                return [dict(row) for row in rows]
+    async def _stream_pulse_events(self, start_time: datetime, end_time: datetime) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream pulse events from the database in chunks of _EVENT_CHUNK_SIZE through a
+        server-side cursor, so only one chunk of rows is in memory at a time
+        """
+        async with self.db_pool.acquire() as conn:
+            # Cursors only live inside a transaction
+            async with conn.transaction():
+                chunk = []
+                async for row in conn.cursor(_PULSE_EVENTS_QUERY, start_time, end_time, prefetch=_EVENT_CHUNK_SIZE):
+                    chunk.append(dict(row))
+                    if len(chunk) == _EVENT_CHUNK_SIZE:
+                        yield chunk
+                        chunk = []
                 
-        except Exception as e:
-            logger.error(f"Failed to fetch pulse events: {e}")
-            return []
+                if chunk:
+                    yield chunk
     
-    async def _transform_events_to_features(self, events: List[Dict[str, Any]]) -> List[CompanyFeatures]:
-        """Transform pulse events into feature format"""
+    async def _features_from_aggregates(self, company_aggregates: pd.DataFrame) -> List[CompanyFeatures]:
+        """Build one feature record per company from its event aggregates"""
         features = []
-        company_aggregates = {}
         
-        try:
-            # Aggregate events by company
-            for event in events:
-                company = event['company']
-                
-                if company not in company_aggregates:
-                    company_aggregates[company] = {
-                        'events': [],
-                        'sentiment_scores': [],
-                        'funding_mentions': 0,
-                        'employee_mentions': 0,
-                        'growth_mentions': 0
-                    }
-                
-                company_aggregates[company]['events'].append(event)
-                
-                # Extract sentiment
-                sentiment = event.get('sentiment', {})
-                if isinstance(sentiment, str):
-                    sentiment = json.loads(sentiment)
-                
-                if sentiment.get('compound'):
-                    company_aggregates[company]['sentiment_scores'].append(sentiment['compound'])
-                
-                # Count specific mentions
-                content = event.get('content', '').lower()
-                if any(word in content for word in ['funding', 'raised', 'investment']):
-                    company_aggregates[company]['funding_mentions'] += 1
-                
-                if any(word in content for word in ['employee', 'hiring', 'team']):
-                    company_aggregates[company]['employee_mentions'] += 1
-                
-                if any(word in content for word in ['growth', 'expansion', 'scale']):
-                    company_aggregates[company]['growth_mentions'] += 1
+        # Only non-zero compound scores count towards the mean sentiment
+        sentiment_counts = company_aggregates['sentiment_count'].to_numpy()
+        market_sentiments = np.divide(
+            company_aggregates['sentiment_sum'].to_numpy(),
+            sentiment_counts,
+            out=np.zeros(len(company_aggregates)),
+            where=sentiment_counts > 0
+        )
+        
+        # Company records and match outcomes (one query each), user overlap scores and
+        # culture vectors (mock implementations) are independent, so run them concurrently
+        company_ids = company_aggregates.index.tolist()
+        company_data_by_id, match_outcomes, user_overlap_scores, culture_vectors = await asyncio.gather(
+            self._get_company_data_bulk(company_ids),
+            self._get_match_outcomes(company_ids),
+            self._calculate_user_overlaps(company_ids),
+            self._generate_culture_vectors(company_aggregates['content'].tolist())
+        )
+        
+        # Features of one batch share its ingestion time
+        timestamp = datetime.utcnow()
+        
+        # Generate features for each company
+        for company_id, data, market_sentiment, culture_vector, user_overlap_score in zip(
+            company_ids, company_aggregates.itertuples(index=False), market_sentiments,
+            culture_vectors, user_overlap_scores
+        ):
+            # Get company data from database
+            company_data = company_data_by_id[company_id]
             
-            # Generate features for each company
-            for company_id, data in company_aggregates.items():
-                # Calculate user overlap score (mock implementation)
-                user_overlap_score = await self._calculate_user_overlap(company_id)
-                
-                # Calculate traction metrics
-                avg_sentiment = np.mean(data['sentiment_scores']) if data['sentiment_scores'] else 0.0
-                
-                # Get company data from database
-                company_data = await self._get_company_data(company_id)
-                
-                traction_metrics = TractionMetrics(
-                    funding_amount=company_data.get('funding_amount', 0.0),
-                    employee_count=company_data.get('employee_count', 0),
-                    growth_rate=company_data.get('growth_rate', 0.0),
-                    market_sentiment=avg_sentiment,
-                    revenue_growth=data['growth_mentions'] * 0.1,  # Mock calculation
-                    user_growth=data['employee_mentions'] * 0.05   # Mock calculation
-                )
-                
-                # Generate culture vector (mock implementation using event content)
-                culture_vector = await self._generate_culture_vector(data['events'])
-                
-                # Determine match outcome (for training data)
-                match_outcome = await self._get_match_outcome(company_id)
-                
-                feature = CompanyFeatures(
-                    company_id=company_id,
-                    user_overlap_score=user_overlap_score,
-                    traction_metrics=traction_metrics,
-                    culture_vector=culture_vector,
-                    match_outcome=match_outcome,
-                    timestamp=datetime.utcnow()
-                )
-                
-                features.append(feature)
+            traction_metrics = TractionMetrics(
+                funding_amount=company_data.get('funding_amount', 0.0),
+                employee_count=company_data.get('employee_count', 0),
+                growth_rate=company_data.get('growth_rate', 0.0),
+                market_sentiment=market_sentiment,
+                revenue_growth=data.growth_mentions * 0.1,  # Mock calculation
+                user_growth=data.employee_mentions * 0.05   # Mock calculation
+            )
             
-            return features
+            # Determine match outcome (for training data)
+            match_outcome = match_outcomes.get(company_id)
             
-        except Exception as e:
-            logger.error(f"Failed to transform events to features: {e}")
-            return []
+            feature = CompanyFeatures(
+                company_id=company_id,
+                user_overlap_score=user_overlap_score,
+                traction_metrics=traction_metrics,
+                culture_vector=culture_vector,
+                match_outcome=match_outcome,
+                timestamp=timestamp
+            )
+            
+            features.append(feature)
+        
+        return features
     
-    async def _calculate_user_overlap(self, company_id: str) -> float:
-        """Calculate user overlap score with other companies"""
+    async def _calculate_user_overlaps(self, company_ids: List[str]) -> List[float]:
+        """
+        Calculate user overlap scores for many companies with one MGET for cached
+        scores and one pipelined round-trip caching the ones that missed
+        """
         try:
-            # Mock implementation - in reality, this would analyze user bases
-            # Could use LinkedIn data, social media followers, etc.
-            
-            # Get from cache if available
-            cache_key = f"user_overlap:{company_id}"
-            cached_score = await self.redis_client.get(cache_key)
+            if not company_ids:
+                return []
             
-            if cached_score:
-                return float(cached_score)
+            cache_keys = [f"user_overlap:{company_id}" for company_id in company_ids]
+            cached_scores = await self.redis_client.mget(cache_keys)
             
-            # Calculate overlap (mock)
-            overlap_score = np.random.beta(2, 5)  # Skewed towards lower values
+            overlap_scores = [float(cached) if cached else None for cached in cached_scores]
+            missed = [i for i, score in enumerate(overlap_scores) if score is None]
             
-            # Cache for 24 hours
-            await self.redis_client.setex(cache_key, 86400, str(overlap_score))
+            if missed:
+                # Calculate overlap (mock), skewed towards lower values
+                new_scores = _RNG.beta(2, 5, size=len(missed))
+                
+                # Cache for 24 hours
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for i, score in zip(missed, new_scores.tolist()):
+                        overlap_scores[i] = score
+                        pipe.setex(cache_keys[i], 86400, str(score))
+                    await pipe.execute()
             
-            return overlap_score
+            return overlap_scores
             
         except Exception as e:
-            logger.error(f"Failed to calculate user overlap: {e}")
-            return 0.0
+            logger.error(f"Failed to calculate user overlaps: {e}")
+            return [0.0] * len(company_ids)
     
-    async def _get_company_data(self, company_id: str) -> Dict[str, Any]:
-        """Get company data from database"""
+    async def _get_company_data_bulk(self, company_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get company data for many companies in one query, matching each company to the
+        first company whose name contains it; companies not found get defaults
+        """
+        defaults = {'funding_amount': 0.0, 'employee_count': 10, 'growth_rate': 0.0}
+        company_data = {company_id: dict(defaults) for company_id in company_ids}
+        
         try:
-            async with self.db_pool.acquire() as conn:
-                row = await conn.fetchrow("""
+            if not company_ids:
+                return company_data
+            
+            rows = await self.db_pool.fetch("""
+                SELECT q.company_id, c.funding_amount, c.employee_count, c.growth_rate
+                FROM unnest($1::text[]) AS q(company_id)
+                JOIN LATERAL (
                     SELECT funding_amount, employee_count, growth_rate
-                    FROM companies 
-                    WHERE name ILIKE $1
+                    FROM companies
+                    WHERE name ILIKE '%' || q.company_id || '%'
                     LIMIT 1
-                """, f"%{company_id}%")
-                
-                if row:
-                    return dict(row)
-                
-                # Return defaults if not found
-                return {
-                    'funding_amount': 0.0,
-                    'employee_count': 10,
-                    'growth_rate': 0.0
+                ) c ON TRUE
+            """, company_ids)
+            
+            for row in rows:
+                company_data[row['company_id']] = {
+                    'funding_amount': row['funding_amount'],
+                    'employee_count': row['employee_count'],
+                    'growth_rate': row['growth_rate']
                 }
-                
-        except Exception as e:
-            logger.error(f"Failed to get company data: {e}")
-            return {'funding_amount': 0.0, 'employee_count': 10, 'growth_rate': 0.0}
-    
-    async def _generate_culture_vector(self, events: List[Dict[str, Any]]) -> List[float]:
-        """Generate culture embedding vector from events"""
-        try:
-            # Mock implementation - in reality, this would use NLP models
-            # to extract cultural indicators from company communications
-            
-            # Combine all event content
-            all_content = " ".join([event.get('content', '') for event in events])
-            
-            # Simple keyword-based culture vector (mock)
-            culture_keywords = {
-                'innovation': ['innovation', 'creative', 'breakthrough', 'cutting-edge'],
-                'collaboration': ['team', 'together', 'partnership', 'collaborate'],
-                'growth': ['growth', 'scale', 'expand', 'ambitious'],
-                'customer_focus': ['customer', 'user', 'client', 'satisfaction'],
-                'quality': ['quality', 'excellence', 'best', 'premium'],
-                'agility': ['agile', 'fast', 'quick', 'responsive'],
-                'transparency': ['transparent', 'open', 'honest', 'clear'],
-                'diversity': ['diverse', 'inclusive', 'equality', 'belonging']
-            }
-            
-            vector = []
-            content_lower = all_content.lower()
             
-            for category, keywords in culture_keywords.items():
-                score = sum(content_lower.count(keyword) for keyword in keywords)
-                vector.extend([score / max(len(all_content), 1)] * 16)  # 16 dims per category
-            
-            # Pad or truncate to exactly 128 dimensions
-            if len(vector) < 128:
-                vector.extend([0.0] * (128 - len(vector)))
-            else:
-                vector = vector[:128]
-            
-            # Normalize vector
-            norm = np.linalg.norm(vector)
-            if norm > 0:
-                vector = (np.array(vector) / norm).tolist()
-            
-            return vector
+            return company_data
             
         except Exception as e:
-            logger.error(f"Failed to generate culture vector: {e}")
-            return [0.0] * 128
+            logger.error(f"Failed to get company data: {e}")
+            return company_data
     
-    async def _get_match_outcome(self, company_id: str) -> Optional[int]:
-        """Get match outcome for training data"""
+    async def _get_match_outcomes(self, company_ids: List[str]) -> Dict[str, Optional[int]]:
+        """
+        Get match outcomes for many companies in one query; companies missing from
+        the result (on error) have no outcome
+        """
         try:
-            async with self.db_pool.acquire() as conn:
-                # Check if company has successful partnerships
-                row = await conn.fetchrow("""
-                    SELECT COUNT(*) as successful_matches
+            if not company_ids:
+                return {}
+            
+            # Active partnerships involving a company whose name contains the company id
+            rows = await self.db_pool.fetch("""
+                SELECT q.company_id, (
+                    SELECT COUNT(*)
                     FROM partnerships p
                     JOIN companies ca ON p.company_a = ca.id
                     JOIN companies cb ON p.company_b = cb.id
-                    WHERE (ca.name ILIKE $1 OR cb.name ILIKE $1)
+                    WHERE (ca.name ILIKE '%' || q.company_id || '%' OR cb.name ILIKE '%' || q.company_id || '%')
                     AND p.status = 'active'
-                """, f"%{company_id}%")
-                
-                if row and row['successful_matches'] > 0:
-                    return 1
-                else:
-                    return 0
-                    
+                ) AS successful_matches
+                FROM unnest($1::text[]) AS q(company_id)
+            """, company_ids)
+            
+            return {
+                row['company_id']: 1 if row['successful_matches'] > 0 else 0
+                for row in rows
+            }
+            
         except Exception as e:
-            logger.error(f"Failed to get match outcome: {e}")
-            return None
+            logger.error(f"Failed to get match outcomes: {e}")
+            return {}
     
-    async def _process_with_merlin(self, features: List[CompanyFeatures]) -> List[CompanyFeatures]:
-        """Process features with NVIDIA Merlin workflow"""
+    async def _generate_culture_vectors(self, company_contents: List[str]) -> List[List[float]]:
+        """
+        Generate culture embedding vectors for many companies at once from their
+        lowercased content, counting keywords with cuDF string kernels
+        """
         try:
-            if not features:
-                return features
+            if not company_contents:
+                return []
             
-            # Convert to DataFrame
-            data = []
-            for feature in features:
-                row = {
-                    'company_id': feature.company_id,
-                    'user_overlap_score': feature.user_overlap_score,
-                    'funding_amount': feature.traction_metrics.funding_amount,
-                    'employee_count': feature.traction_metrics.employee_count,
-                    'growth_rate': feature.traction_metrics.growth_rate,
-                    'market_sentiment': feature.traction_metrics.market_sentiment,
-                    'culture_vector': feature.culture_vector,
-                    'match_outcome': feature.match_outcome or 0
-                }
-                data.append(row)
+            contents_lower = cudf.Series(company_contents)
             
-            df = pd.DataFrame(data)
+            # (companies x categories) keyword counts; each keyword is counted on its own
+            # because keywords may contain one another ('equality' / 'quality')
+            counts = np.column_stack([
+                sum(contents_lower.str.count(re.escape(keyword)) for keyword in keywords).to_numpy()
+                for keywords in _CULTURE_KEYWORDS.values()
+            ]).astype(np.float32)
+            lengths = np.maximum(contents_lower.str.len().to_numpy(), 1).astype(np.float32)
             
-            # Convert to cuDF for GPU processing
-            gdf = cudf.from_pandas(df)
+            # Each category fills consecutive dims; pad or truncate to exactly 128
+            vectors = np.zeros((len(company_contents), _CULTURE_VECTOR_DIM), dtype=np.float32)
+            category_dims = np.repeat(counts / lengths[:, None], _CULTURE_DIMS_PER_CATEGORY, axis=1)[:, :_CULTURE_VECTOR_DIM]
+            vectors[:, :category_dims.shape[1]] = category_dims
             
-            # Apply Merlin workflow if fitted
-            workflow_path = self.model_path / "workflow"
-            if workflow_path.exists():
-                self.workflow = nvt.Workflow.load(str(workflow_path))
-                processed_gdf = self.workflow.transform(nvt.Dataset(gdf)).to_ddf().compute()
-            else:
-                # Fit and save workflow
-                dataset = nvt.Dataset(gdf)
-                self.workflow.fit(dataset)
-                self.workflow.save(str(workflow_path))
-                processed_gdf = self.workflow.transform(dataset).to_ddf().compute()
+            # Normalize each vector
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            np.divide(vectors, norms, out=vectors, where=norms > 0)
             
-            # Convert back to pandas and update features
-            processed_df = processed_gdf.to_pandas()
+            return vectors.tolist()
+            
+        except Exception as e:
+            logger.error(f"Failed to generate culture vectors on GPU, falling back to CPU: {e}")
+            return [_culture_vector(content_lower).tolist() for content_lower in company_contents]
+    
+    async def _process_with_merlin_columnar(self, columns: Dict[str, Any]):
+        """
+        Process feature columns (as built by _features_to_columns) with the NVIDIA
+        Merlin workflow, writing normalized values back into the numeric columns
+        """
+        try:
+            feature_count = len(columns['company_id'])
+            if not feature_count:
+                return
             
-            # Update features with processed values
-            for i, feature in enumerate(features):
-                if i < len(processed_df):
-                    row = processed_df.iloc[i]
-                    # Update with normalized values
-                    feature.user_overlap_score = float(row.get('user_overlap_score', feature.user_overlap_score))
-                    feature.traction_metrics.funding_amount = float(row.get('funding_amount', feature.traction_metrics.funding_amount))
-                    feature.traction_metrics.employee_count = int(row.get('employee_count', feature.traction_metrics.employee_count))
-                    feature.traction_metrics.growth_rate = float(row.get('growth_rate', feature.traction_metrics.growth_rate))
-                    feature.traction_metrics.market_sentiment = float(row.get('market_sentiment', feature.traction_metrics.market_sentiment))
+            # Build the GPU frame straight from the columns: numeric columns are copied to
+            # the device once as CuPy arrays, with no pandas or Arrow intermediate
+            gdf = cudf.DataFrame({
+                'company_id': columns['company_id'],
+                **{name: cupy.asarray(columns[name]) for name in _MERLIN_NORMALIZED_COLUMNS},
+                'culture_vector': _column_values(columns['culture_vector']),
+                'match_outcome': cupy.asarray(np.array(
+                    [outcome or 0 for outcome in _column_values(columns['match_outcome'])], dtype=np.int64
+                ))
+            })
+            
+            # Apply Merlin workflow, fitting it on the first batch, on the persistent
+            # cluster when there is one
+            with Distributed(client=self.dask_client) if self.dask_client else nullcontext():
+                dataset = nvt.Dataset(gdf)
+                if not self.workflow_fitted:
+                    self._fit_workflow(dataset)
+                processed_gdf = self.workflow.transform(dataset).to_ddf().compute()
             
-            return features
+            # Copy back only the normalized columns, viewed on the device through DLPack
+            # and moved to the host once each
+            rows = min(len(processed_gdf), feature_count)
+            for name in _MERLIN_NORMALIZED_COLUMNS:
+                if name in processed_gdf.columns:
+                    columns[name][:rows] = cupy.from_dlpack(processed_gdf[name].to_dlpack())[:rows].get()
             
         except Exception as e:
             logger.error(f"Failed to process with Merlin: {e}")
-            return features
     
-    async def _store_features(self, features: List[CompanyFeatures]):
+    def _fit_workflow(self, dataset):
+        """Fit the Merlin workflow and save it for later runs"""
+        self.workflow.fit(dataset)
+        self.workflow.save(str(self.model_path / "workflow"))
+        self.workflow_fitted = True
+    
+    async def _store_features(self, features: List[CompanyFeatures], precompute_online: bool = False):
         """Store features in parquet format and cache"""
+        if not features:
+            return
+        
+        await self._store_features_columnar(_features_to_columns(features), precompute_online)
+    
+    async def _store_features_columnar(self, columns: Dict[str, Any], precompute_online: bool = False):
+        """
+        Store features given as equal-length columns (lists or numpy arrays keyed by
+        field name; culture_vector may be a 2-D array) in parquet format and cache.
+        With precompute_online, the default feature view's online response of each
+        company is also cached ready to serve; otherwise any cached response of the
+        companies is dropped, as it no longer matches their latest features
+        """
         try:
-            if not features:
+            feature_count = len(columns['company_id'])
+            if not feature_count:
                 return
             
-            # Convert to DataFrame
-            data = []
-            for feature in features:
-                row = {
-                    'company_id': feature.company_id,
-                    'user_overlap_score': feature.user_overlap_score,
-                    'funding_amount': feature.traction_metrics.funding_amount,
-                    'employee_count': feature.traction_metrics.employee_count,
-                    'growth_rate': feature.traction_metrics.growth_rate,
-                    'market_sentiment': feature.traction_metrics.market_sentiment,
-                    'revenue_growth': feature.traction_metrics.revenue_growth,
-                    'user_growth': feature.traction_metrics.user_growth,
-                    'culture_vector': feature.culture_vector,
-                    'match_outcome': feature.match_outcome,
-                    'timestamp': feature.timestamp
-                }
-                data.append(row)
-            
-            df = pd.DataFrame(data)
-            
-            # Store as parquet with date partitioning
-            date_str = datetime.utcnow().strftime("%Y-%m-%d")
-            parquet_path = self.feature_store_path / f"features_{date_str}.parquet"
+            # Each store writes its own part file, so earlier rows are never replaced;
+            # names sort by date, then time. The write runs off the event loop
+            parquet_path = self.feature_store_path / (
+                f"features_{datetime.utcnow():%Y-%m-%d_%H%M%S%f}_{uuid.uuid4().hex[:8]}.parquet"
+            )
             
-            df.to_parquet(parquet_path, index=False)
+            await asyncio.to_thread(self._write_parquet, columns, parquet_path)
+            bisect.insort(self._parquet_files, parquet_path)
+            
+            # Cache latest features in one Redis hash keyed by company, in the
+            # CompanyFeatures JSON layout as compressed msgpack, written in a single round-trip
+            cached_features = {}
+            online_payloads = {}
+            for (company_id, user_overlap_score, funding_amount, employee_count, growth_rate,
+                 market_sentiment, revenue_growth, user_growth, culture_vector, match_outcome,
+                 timestamp) in zip(*(_column_values(columns[name]) for name in _FEATURE_COLUMNS)):
+                feature = {
+                    'company_id': company_id,
+                    'user_overlap_score': user_overlap_score,
+                    'traction_metrics': {
+                        'funding_amount': funding_amount,
+                        'employee_count': employee_count,
+                        'growth_rate': growth_rate,
+                        'market_sentiment': market_sentiment,
+                        'revenue_growth': revenue_growth,
+                        'user_growth': user_growth
+                    },
+                    'culture_vector': culture_vector,
+                    'match_outcome': match_outcome,
+                    'timestamp': timestamp.isoformat()
+                }
+                cached_features[company_id] = _encode_cached_feature(feature)
+                if precompute_online:
+                    online_payloads[company_id] = _online_payload(feature)
+            
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.hset(_FEATURE_CACHE_KEY, mapping=cached_features)
+                pipe.expire(_FEATURE_CACHE_KEY, _FEATURE_CACHE_TTL_SECONDS)
+                pipe.sadd(_COMPANY_INDEX_KEY, *cached_features)
+                if precompute_online:
+                    for company_id, payload in online_payloads.items():
+                        key = _ONLINE_PAYLOAD_KEY.format(company_id=company_id, feature_view=_DEFAULT_FEATURE_VIEW)
+                        pipe.set(key, payload, ex=_FEATURE_CACHE_TTL_SECONDS)
+                else:
+                    pipe.delete(*(
+                        _ONLINE_PAYLOAD_KEY.format(company_id=company_id, feature_view=_DEFAULT_FEATURE_VIEW)
+                        for company_id in cached_features
+                    ))
+                await pipe.execute()
             
-            # Cache latest features in Redis
-            for feature in features:
-                cache_key = f"features:{feature.company_id}"
-                await self.redis_client.setex(
-                    cache_key, 
-                    3600,  # 1 hour TTL
-                    feature.json()
-                )
+            self._known_company_ids.update(cached_features)
             
-            logger.info(f"Stored {len(features)} features to {parquet_path}")
+            logger.info(f"Stored {feature_count} features to {parquet_path}")
             
         except Exception as e:
             logger.error(f"Failed to store features: {e}")
+            raise
+        
+        finally:
+            # Even a failed store may have changed what reads return
+            self.write_version += 1
+    
+    def _write_parquet(self, columns: Dict[str, Any], parquet_path: Path):
+        """
+        Write feature columns to parquet with the cuDF GPU writer (Snappy, dictionary
+        encoded), ordered by company and time so row-group statistics let company
+        filters skip the rest of the file; falls back to the CPU writer
+        """
+        sort_by = ['company_id', 'timestamp']
+        
+        try:
+            # Parquet stores one list per culture vector; scalar columns go in as-is
+            gdf = cudf.DataFrame({
+                name: values.tolist() if isinstance(values, np.ndarray) and values.ndim > 1 else values
+                for name, values in columns.items()
+            })
+            gdf.sort_values(sort_by).to_parquet(
+                parquet_path,
+                index=False,
+                compression='snappy',
+                row_group_size_rows=_PARQUET_ROW_GROUP_ROWS
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to write parquet on GPU, falling back to CPU: {e}")
+            # Culture vectors go in as one FixedSizeList(float32) column over a single
+            # contiguous buffer rather than a list object per row
+            table = pa.table({
+                name: _fixed_size_list_array(values) if isinstance(values, np.ndarray) and values.ndim > 1 else values
+                for name, values in columns.items()
+            })
+            pq.write_table(
+                table.sort_by([(name, 'ascending') for name in sort_by]),
+                parquet_path,
+                compression='snappy',
+                row_group_size=_PARQUET_ROW_GROUP_ROWS
+            )
     
     async def get_online_features(self, company_ids: List[str], feature_names: Optional[List[str]] = None) -> List[CompanyFeatures]:
         """Get features for online serving"""
         try:
             features = []
             
-            for company_id in company_ids:
-                # Try cache first
-                cache_key = f"features:{company_id}"
-                cached_data = await self.redis_client.get(cache_key)
-                
+            if not company_ids:
+                return features
+            
+            # Try cache first, every company in one round-trip
+            cached_features = await self.redis_client.hmget(_FEATURE_CACHE_KEY, company_ids)
+            
+            # Fallback to latest parquet file, every cache miss in one read
+            missed_ids = [
+                company_id for company_id, cached_data in zip(company_ids, cached_features) if not cached_data
+            ]
+            stored_features = await self._get_features_from_storage(missed_ids) if missed_ids else {}
+            
+            for company_id, cached_data in zip(company_ids, cached_features):
                 if cached_data:
-                    feature = CompanyFeatures.parse_raw(cached_data)
+                    feature = _decode_cached_feature(cached_data)
                     features.append(feature)
-                else:
-                    # Fallback to latest parquet file
-                    feature = await self._get_feature_from_storage(company_id)
-                    if feature:
-                        features.append(feature)
+                elif company_id in stored_features:
+                    features.append(stored_features[company_id])
             
             return features
             
@@ -499,52 +891,144 @@ class FeaturePipeline:
             logger.error(f"Failed to get online features: {e}")
             return []
     
-    async def _get_feature_from_storage(self, company_id: str) -> Optional[CompanyFeatures]:
-        """Get feature from parquet storage"""
+    async def has_company(self, company_id: str) -> bool:
+        """
+        Whether features may have been stored for the company, by any replica. False
+        only when the shared company index says not; if it can't be read, True
+        """
+        if company_id in self._known_company_ids:
+            return True
+        
         try:
-            # Find latest parquet file
-            parquet_files = list(self.feature_store_path.glob("features_*.parquet"))
+            known = await self.redis_client.sismember(_COMPANY_INDEX_KEY, company_id)
             
-            if not parquet_files:
-                return None
-            
-            # Sort by date and get latest
-            latest_file = sorted(parquet_files)[-1]
+        except Exception as e:
+            logger.error(f"Failed to check company index: {e}")
+            return True
+        
+        if known:
+            self._known_company_ids.add(company_id)
+        return bool(known)
+    
+    async def get_online_payload(self, company_id: str, feature_view: str) -> Optional[bytes]:
+        """Cached online response body of a company's feature view, if any"""
+        try:
+            return await self.redis_client.get(
+                _ONLINE_PAYLOAD_KEY.format(company_id=company_id, feature_view=feature_view)
+            )
             
-            # Read and filter
-            df = pd.read_parquet(latest_file)
-            company_data = df[df['company_id'] == company_id]
+        except Exception as e:
+            logger.error(f"Failed to get online payload: {e}")
+            return None
+    
+    async def _get_features_from_storage(self, company_ids: List[str]) -> Dict[str, CompanyFeatures]:
+        """
+        Get the latest stored feature of each company, reading part files newest
+        first until every company is found; files are sorted by company, so the
+        company filter prunes row groups
+        """
+        try:
+            remaining = set(company_ids)
+            stored_features = {}
+            
+            for parquet_file in reversed(list(self._parquet_files)):
+                # Read only the companies' rows; the filter is pushed into the parquet
+                # reader, which runs off the event loop so other requests proceed meanwhile
+                company_data = await asyncio.to_thread(
+                    pd.read_parquet,
+                    parquet_file,
+                    columns=list(_FEATURE_COLUMNS),
+                    filters=[('company_id', 'in', list(remaining))]
+                )
+                
+                # Rows are ordered by time within a company, so keep the last of each
+                latest_records = company_data.drop_duplicates('company_id', keep='last')
+                for _, record in latest_records.iterrows():
+                    stored_features[record['company_id']] = self._record_to_feature(record)
+                
+                remaining.difference_update(stored_features)
+                if not remaining:
+                    break
             
-            if company_data.empty:
-                return None
+            return stored_features
             
-            # Get latest record
-            latest_record = company_data.iloc[-1]
+        except Exception as e:
+            logger.error(f"Failed to get features from storage: {e}")
+            return {}
+    
+    async def iter_historical(
+        self,
+        company_ids: List[str],
+        start_time: datetime,
+        end_time: datetime,
+        feature_names: Optional[List[str]] = None
+    ) -> AsyncIterator[CompanyFeatures]:
+        """
+        Stream every stored feature record of the companies stamped within
+        [start_time, end_time], decoding one record batch (at most a row group) at a
+        time off the event loop, so memory stays bounded whatever the range. Every
+        file is opened and its schema checked before the first record is yielded;
+        errors are raised, not swallowed, so a stream is never cut short silently
+        """
+        try:
+            if not company_ids:
+                return
             
-            # Convert to CompanyFeatures
-            traction_metrics = TractionMetrics(
-                funding_amount=latest_record['funding_amount'],
-                employee_count=latest_record['employee_count'],
-                growth_rate=latest_record['growth_rate'],
-                market_sentiment=latest_record['market_sentiment'],
-                revenue_growth=latest_record.get('revenue_growth'),
-                user_growth=latest_record.get('user_growth')
+            # Pushed into the scan, so row groups outside the range are never decoded
+            predicate = (
+                ds.field('company_id').isin(list(company_ids))
+                & (ds.field('timestamp') >= start_time)
+                & (ds.field('timestamp') <= end_time)
             )
             
-            feature = CompanyFeatures(
-                company_id=latest_record['company_id'],
-                user_overlap_score=latest_record['user_overlap_score'],
-                traction_metrics=traction_metrics,
-                culture_vector=latest_record['culture_vector'],
-                match_outcome=latest_record.get('match_outcome'),
-                timestamp=latest_record['timestamp']
-            )
+            datasets = await asyncio.to_thread(self._open_feature_datasets)
             
-            return feature
+            for dataset in datasets:
+                batches = dataset.to_batches(
+                    filter=predicate,
+                    batch_size=_PARQUET_ROW_GROUP_ROWS
+                )
+                while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+                    for record in batch.to_pylist():
+                        yield self._record_to_feature(record)
             
         except Exception as e:
-            logger.error(f"Failed to get feature from storage: {e}")
-            return None
+            logger.error(f"Failed to stream historical features: {e}")
+            raise
+    
+    def _open_feature_datasets(self) -> List[ds.Dataset]:
+        """
+        Open every feature file as a dataset, reading its footer; raises if a file is
+        unreadable or lacks a feature column
+        """
+        datasets = []
+        for parquet_file in list(self._parquet_files):
+            dataset = ds.dataset(parquet_file, format='parquet')
+            missing = set(_FEATURE_COLUMNS).difference(dataset.schema.names)
+            if missing:
+                raise ValueError(f"{parquet_file} is missing columns {sorted(missing)}")
+            datasets.append(dataset)
+        return datasets
+    
+    def _record_to_feature(self, record: pd.Series) -> CompanyFeatures:
+        """Convert a stored feature row to CompanyFeatures"""
+        traction_metrics = TractionMetrics(
+            funding_amount=record['funding_amount'],
+            employee_count=record['employee_count'],
+            growth_rate=record['growth_rate'],
+            market_sentiment=record['market_sentiment'],
+            revenue_growth=record.get('revenue_growth'),
+            user_growth=record.get('user_growth')
+        )
+        
+        return CompanyFeatures(
+            company_id=record['company_id'],
+            user_overlap_score=record['user_overlap_score'],
+            traction_metrics=traction_metrics,
+            culture_vector=record['culture_vector'],
+            match_outcome=record.get('match_outcome'),
+            timestamp=record['timestamp']
+        )
     
     async def _run_pipeline_scheduler(self):
         """Run the pipeline scheduler"""
@@ -579,19 +1063,24 @@ class FeaturePipeline:
             # Count parquet files
             parquet_files = list(self.feature_store_path.glob("features_*.parquet"))
             
-            total_companies = 0
+            # A company's records spread over many part files, so count it once
+            company_ids = set()
             feature_count = 0
             storage_size = 0
             last_updated = None
             
             for file_path in parquet_files:
                 try:
-                    df = pd.read_parquet(file_path)
-                    total_companies += df['company_id'].nunique()
-                    feature_count += len(df)
-                    storage_size += file_path.stat().st_size
+                    # Row counts come from the footer; only company_id is decoded
+                    parquet_file = pq.ParquetFile(file_path)
+                    file_company_ids = parquet_file.read(columns=['company_id'])['company_id']
+                    company_ids.update(pc.unique(file_company_ids).to_pylist())
+                    feature_count += parquet_file.metadata.num_rows
+                    
+                    file_stat = file_path.stat()
+                    storage_size += file_stat.st_size
                     
-                    file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
+                    file_time = datetime.fromtimestamp(file_stat.st_mtime)
                     if not last_updated or file_time > last_updated:
                         last_updated = file_time
                         
@@ -600,7 +1089,7 @@ class FeaturePipeline:
                     continue
             
             return {
-                'total_companies': total_companies,
+                'total_companies': len(company_ids),
                 'feature_count': feature_count,
                 'last_updated': last_updated or datetime.utcnow(),
                 'storage_size_mb': storage_size / (1024 * 1024),
@@ -1,59 +1,357 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 import sentry_sdk
 from sentry_sdk.integrations.fastapi import FastApiIntegration
-from typing import List, Optional
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
+import asyncio
+import hashlib
 import logging
+import time
+import msgpack
+import numpy as np
 
 from .schema import (
-    CompanyFeatures, FeatureRequest, FeatureResponse, 
+    CULTURE_VECTOR_DIM, CompanyFeatures, CompanyFeaturesWire, FeatureRequest, FeatureResponse, 
     BatchFeatureRequest, PipelineStatus, FeatureStats,
     OnlineFeatureRequest, OnlineFeatureResponse
 )
 from .pipeline import FeaturePipeline
+from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Seconds a serialized /features/stats or /pipeline/status response is reused
+_SUMMARY_CACHE_TTL_SECONDS = 30
+
+# Features waiting to be stored at most, and how many are stored together; a
+# partial batch is stored once its first feature has waited _WRITE_FLUSH_SECONDS
+_WRITE_QUEUE_MAXSIZE = 10_000
+_WRITE_BATCH_SIZE = 500
+_WRITE_FLUSH_SECONDS = 0.5
+
+# Attempts at storing a queued batch, the first retry waiting _WRITE_RETRY_SECONDS
+# and each later one twice as long
+_WRITE_STORE_ATTEMPTS = 3
+_WRITE_RETRY_SECONDS = 0.5
+
+async def _store_queued_batch(pipeline: FeaturePipeline, batch: List[CompanyFeatures], write_failures: Dict[str, int]):
+    """
+    Store a batch of queued features, retrying with backoff; a batch that still
+    fails is counted in write_failures, as its writers were already answered
+    """
+    for attempt in range(1, _WRITE_STORE_ATTEMPTS + 1):
+        try:
+            await pipeline._store_features(batch, precompute_online=True)
+            return
+        except Exception as e:
+            logger.error(f"Failed to store {len(batch)} queued features (attempt {attempt}/{_WRITE_STORE_ATTEMPTS}): {e}")
+            if attempt < _WRITE_STORE_ATTEMPTS:
+                await asyncio.sleep(_WRITE_RETRY_SECONDS * 2 ** (attempt - 1))
+    
+    write_failures["batches"] += 1
+    write_failures["features"] += len(batch)
+
+async def _flush_writes(pipeline: FeaturePipeline, queue: asyncio.Queue, write_failures: Dict[str, int]):
+    """
+    Store features from the write queue in batches until a None sentinel is
+    dequeued, storing whatever was batched before it
+    """
+    loop = asyncio.get_running_loop()
+    stopping = False
+    
+    while not stopping:
+        feature = await queue.get()
+        if feature is None:
+            return
+        
+        batch = [feature]
+        deadline = loop.time() + _WRITE_FLUSH_SECONDS
+        while len(batch) < _WRITE_BATCH_SIZE:
+            try:
+                feature = await asyncio.wait_for(queue.get(), timeout=max(deadline - loop.time(), 0))
+            except asyncio.TimeoutError:
+                break
+            if feature is None:
+                stopping = True
+                break
+            batch.append(feature)
+        
+        await _store_queued_batch(pipeline, batch, write_failures)
+
+# Methods advertised to CORS preflights, and seconds browsers may cache the answer
+_CORS_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+_CORS_MAX_AGE_SECONDS = b"600"
+
+class _WildcardCORSMiddleware:
+    """
+    ASGI middleware allowing every origin, method and header with credentials, as
+    CORSMiddleware does when configured with wildcards, but with no per-request
+    matching: the request's origin and headers are echoed back as they are
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+        
+        # Not a cross-origin request
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+        
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin")
+        ]
+        
+        # Answer preflights here without reaching the app
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            cors_headers.append((b"access-control-allow-methods", _CORS_ALLOW_METHODS))
+            cors_headers.append((b"access-control-max-age", _CORS_MAX_AGE_SECONDS))
+            if request_headers is not None:
+                cors_headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": cors_headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        async def send_with_cors_headers(message: Message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + cors_headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors_headers)
+
+_MSGPACK_MEDIA_TYPE = "application/msgpack"
+_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+def _negotiated_response(request: Request, model: BaseModel):
+    """
+    A model as MessagePack when the client accepts it, otherwise the model itself
+    for the route's JSON response
+    """
+    if _MSGPACK_MEDIA_TYPE in request.headers.get("accept", ""):
+        return Response(content=msgpack.packb(model.model_dump(mode='json')), media_type=_MSGPACK_MEDIA_TYPE)
+    return model
+
+class _LatencyMiddleware:
+    """
+    ASGI middleware stamping each request's start (time.perf_counter_ns) into
+    request.state.start_ns and reporting the time until its response starts in
+    an X-Latency-Us header
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_ns = time.perf_counter_ns()
+        scope.setdefault("state", {})["start_ns"] = start_ns
+        
+        async def send_with_latency(message: Message):
+            if message["type"] == "http.response.start":
+                latency_us = (time.perf_counter_ns() - start_ns) // 1000
+                message["headers"] = list(message.get("headers", ())) + [(b"x-latency-us", str(latency_us).encode())]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_latency)
+
+def _elapsed_ms(request: Request) -> float:
+    """Milliseconds since the request was stamped by _LatencyMiddleware"""
+    return (time.perf_counter_ns() - request.state.start_ns) / 1_000_000
+
+# Validators for request bodies parsed straight from their raw JSON bytes
+_FEATURES_ADAPTER = TypeAdapter(List[CompanyFeatures])
+_BATCH_REQUEST_ADAPTER = TypeAdapter(BatchFeatureRequest)
+
+async def _validate_body(request: Request, adapter: TypeAdapter) -> Any:
+    """
+    Validate a request's JSON body in one pass from its bytes, rejecting it with
+    the 422 response FastAPI gives for invalid bodies
+    """
+    try:
+        return adapter.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**error, 'loc': ('body', *error['loc'])} for error in e.errors(include_url=False)
+        ])
+
+def _request_body_schema(adapter: TypeAdapter) -> Dict[str, Any]:
+    """
+    OpenAPI requestBody of a route validating its own body; referenced models are
+    the ones registered by the response models
+    """
+    schema = adapter.json_schema(ref_template="#/components/schemas/{model}")
+    schema.pop("$defs", None)
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": schema}}}}
+
+def _now() -> datetime:
+    """Current UTC time, read once per request and shared by everything it stamps"""
+    return datetime.utcnow()
+
+# Share of requests traced by Sentry; health checks are never traced
+_SENTRY_TRACES_SAMPLE_RATE = 0.01
+_SENTRY_UNTRACED_PATHS = frozenset({"/health"})
+
+def _sentry_traces_sampler(sampling_context: Dict[str, Any]) -> float:
+    """Sample rate of a transaction, skipping health checks entirely"""
+    scope = sampling_context.get("asgi_scope") or {}
+    if scope.get("path") in _SENTRY_UNTRACED_PATHS:
+        return 0.0
+    return _SENTRY_TRACES_SAMPLE_RATE
+
+def init_sentry(config: Config):
+    """
+    Initialize Sentry once for the process (not per app) when a DSN is configured,
+    tracing a small sample of requests and sending no personal data
+    """
+    if not config.sentry_dsn:
+        return
+    
+    sentry_sdk.init(
+        dsn=config.sentry_dsn,
+        integrations=[FastApiIntegration(transaction_style="endpoint")],
+        environment=config.environment,
+        traces_sampler=_sentry_traces_sampler,
+        profiles_sample_rate=0.0,
+        send_default_pii=False,
+        max_breadcrumbs=25
+    )
+
+def _etag(body: bytes) -> str:
+    """Strong entity tag of a response body"""
+    return f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header lists etag (weak comparison, as for GET)"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or etag in tags or f'W/{etag}' in tags
+
+def _wire_features_to_columns(features: List[CompanyFeaturesWire]) -> Dict[str, Any]:
+    """
+    Wire feature records as pipeline columns, the packed culture vectors decoded
+    together into one 2-D float32 array
+    """
+    count = len(features)
+    traction = [feature.traction_metrics for feature in features]
+    culture_vectors = np.frombuffer(
+        b''.join(feature.culture_vector_b64 for feature in features), dtype='<f4'
+    ).reshape(count, CULTURE_VECTOR_DIM)
+    return {
+        'company_id': [feature.company_id for feature in features],
+        'user_overlap_score': np.fromiter((feature.user_overlap_score for feature in features), dtype=np.float64, count=count),
+        'funding_amount': np.fromiter((metrics.funding_amount for metrics in traction), dtype=np.float64, count=count),
+        'employee_count': np.fromiter((metrics.employee_count for metrics in traction), dtype=np.int64, count=count),
+        'growth_rate': np.fromiter((metrics.growth_rate for metrics in traction), dtype=np.float64, count=count),
+        'market_sentiment': np.fromiter((metrics.market_sentiment for metrics in traction), dtype=np.float64, count=count),
+        'revenue_growth': [metrics.revenue_growth for metrics in traction],
+        'user_growth': [metrics.user_growth for metrics in traction],
+        'culture_vector': culture_vectors,
+        'match_outcome': [feature.match_outcome for feature in features],
+        'timestamp': [feature.timestamp for feature in features]
+    }
+
 def create_rest_app(pipeline: FeaturePipeline) -> FastAPI:
     """Create FastAPI application for feature store"""
     
-    # Initialize Sentry
-    if pipeline.config.sentry_dsn:
-        sentry_sdk.init(
-            dsn=pipeline.config.sentry_dsn,
-            integrations=[FastApiIntegration()],
-            environment=pipeline.config.environment,
-        )
+    # Features accepted by /features/write, stored in the background
+    write_queue: asyncio.Queue = asyncio.Queue(maxsize=_WRITE_QUEUE_MAXSIZE)
+    
+    # Queued batches (and their features) that could not be stored
+    write_failures: Dict[str, int] = {"batches": 0, "features": 0}
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """Run the write flusher while serving, storing queued features on shutdown"""
+        flush_task = asyncio.create_task(_flush_writes(pipeline, write_queue, write_failures))
+        try:
+            yield
+        finally:
+            await write_queue.put(None)
+            await flush_task
     
     app = FastAPI(
         title="Synapse LaunchPad - Feature Store",
         description="NVIDIA Merlin-powered feature store with FEAST-like API",
-        version="1.0.0"
+        version="1.0.0",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
     )
     
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # Serialized summary responses by endpoint, as (expires_at, etag, body)
+    summary_cache: Dict[str, Tuple[float, str, bytes]] = {}
+    
+    async def summary_response(
+        request: Request,
+        name: str,
+        build: Callable[[], Awaitable[BaseModel]]
+    ) -> Response:
+        """
+        Respond with an endpoint's cached body, rebuilding it once expired, or
+        with 304 when the client already holds it
+        """
+        entry = summary_cache.get(name)
+        if entry is None or entry[0] <= time.monotonic():
+            body = (await build()).model_dump_json().encode()
+            entry = (time.monotonic() + _SUMMARY_CACHE_TTL_SECONDS, _etag(body), body)
+            summary_cache[name] = entry
+        
+        _, etag, body = entry
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
+    
+    app.add_middleware(_WildcardCORSMiddleware)
+    app.add_middleware(_LatencyMiddleware)
     
     @app.get("/health")
-    async def health_check():
+    async def health_check(now: datetime = Depends(_now)):
         """Health check endpoint"""
         return {
             "status": "healthy",
             "service": "feature-store",
-            "timestamp": datetime.utcnow(),
-            "pipeline_active": True
+            "timestamp": now,
+            "pipeline_active": True,
+            "write_queue_size": write_queue.qsize(),
+            "write_failures": write_failures
         }
     
-    @app.post("/features/online", response_model=FeatureResponse)
-    async def get_online_features(request: FeatureRequest):
+    @app.post(
+        "/features/online",
+        response_model=FeatureResponse,
+        responses={200: {"content": {_MSGPACK_MEDIA_TYPE: {}}}}
+    )
+    async def get_online_features(
+        request: FeatureRequest,
+        http_request: Request,
+        now: datetime = Depends(_now)
+    ):
         """
-        Get features for online serving (low latency)
+        Get features for online serving (low latency), as MessagePack when the
+        Accept header asks for application/msgpack
         """
         try:
             features = await pipeline.get_online_features(
@@ -61,69 +359,84 @@ def create_rest_app(pipeline: FeaturePipeline) -> FastAPI:
                 feature_names=request.feature_names
             )
             
-            return FeatureResponse(
+            return _negotiated_response(http_request, FeatureResponse(
                 features=features,
                 metadata={
-                    "request_id": f"online_{int(datetime.utcnow().timestamp())}",
+                    "request_id": f"online_{int(now.timestamp())}",
                     "feature_count": len(features),
-                    "latency_ms": 0,  # Would measure actual latency
+                    "latency_ms": _elapsed_ms(http_request),
                     "cache_hit_rate": 1.0  # Would calculate actual cache hit rate
                 }
-            )
+            ))
             
         except Exception as e:
             logger.error(f"Failed to get online features: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to get features: {str(e)}")
     
-    @app.post("/features/historical", response_model=FeatureResponse)
+    @app.post(
+        "/features/historical",
+        response_class=StreamingResponse,
+        responses={200: {"content": {_NDJSON_MEDIA_TYPE: {}}}}
+    )
     async def get_historical_features(
         company_ids: List[str],
         start_time: datetime,
         end_time: datetime,
-        feature_names: Optional[List[str]] = None
+        feature_names: Optional[List[str]] = None,
+        now: datetime = Depends(_now)
     ):
         """
-        Get historical features for training/analysis
+        Get historical features for training/analysis, streamed as newline-delimited
+        JSON (one CompanyFeatures per line) as they are read from storage
         """
+        features = pipeline.iter_historical(
+            company_ids=company_ids,
+            start_time=start_time,
+            end_time=end_time,
+            feature_names=feature_names
+        )
+        
+        # Storage is opened while the first record is read, so failures to read it are
+        # still answered with a 500; later failures abort the stream
         try:
-            # For historical features, we'd read from parquet files
-            # This is a simplified implementation
-            features = await pipeline.get_online_features(company_ids, feature_names)
-            
-            # Filter by time range (simplified)
-            filtered_features = [
-                f for f in features 
-                if start_time <= f.timestamp <= end_time
-            ]
-            
-            return FeatureResponse(
-                features=filtered_features,
-                metadata={
-                    "request_id": f"historical_{int(datetime.utcnow().timestamp())}",
-                    "feature_count": len(filtered_features),
-                    "time_range": f"{start_time} to {end_time}",
-                    "total_available": len(features)
-                }
-            )
-            
+            first_feature = await features.__anext__()
+        except StopAsyncIteration:
+            first_feature = None
         except Exception as e:
             logger.error(f"Failed to get historical features: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to get historical features: {str(e)}")
+        
+        async def feature_lines() -> AsyncIterator[bytes]:
+            if first_feature is None:
+                return
+            yield first_feature.model_dump_json().encode() + b"\n"
+            async for feature in features:
+                yield feature.model_dump_json().encode() + b"\n"
+        
+        return StreamingResponse(
+            feature_lines(),
+            media_type=_NDJSON_MEDIA_TYPE,
+            headers={"X-Request-Id": f"historical_{int(now.timestamp())}"}
+        )
     
-    @app.post("/features/batch")
+    @app.post("/features/batch", openapi_extra=_request_body_schema(_BATCH_REQUEST_ADAPTER))
     async def trigger_batch_processing(
         background_tasks: BackgroundTasks,
-        request: BatchFeatureRequest
+        http_request: Request,
+        now: datetime = Depends(_now)
     ):
         """
         Trigger batch feature processing
         """
+        request: BatchFeatureRequest = await _validate_body(http_request, _BATCH_REQUEST_ADAPTER)
+        
         try:
             # Add batch processing task to background
             background_tasks.add_task(
                 pipeline.process_pulse_events,
                 request.start_time,
-                request.end_time
+                request.end_time,
+                request.precompute_online
             )
             
             return {
@@ -131,7 +444,7 @@ def create_rest_app(pipeline: FeaturePipeline) -> FastAPI:
                 "message": "Batch processing started",
                 "start_time": request.start_time,
                 "end_time": request.end_time,
-                "estimated_completion": datetime.utcnow() + timedelta(minutes=30)
+                "estimated_completion": now + timedelta(minutes=30)
             }
             
         except Exception as e:
@@ -139,11 +452,11 @@ def create_rest_app(pipeline: FeaturePipeline) -> FastAPI:
             raise HTTPException(status_code=500, detail=f"Failed to start batch processing: {str(e)}")
     
     @app.get("/features/stats", response_model=FeatureStats)
-    async def get_feature_stats():
+    async def get_feature_stats(request: Request):
         """
         Get feature store statistics
         """
-        try:
+        async def build_stats() -> FeatureStats:
             stats_data = await pipeline.get_feature_stats()
             
             return FeatureStats(
@@ -153,25 +466,31 @@ def create_rest_app(pipeline: FeaturePipeline) -> FastAPI:
                 storage_size_mb=stats_data['storage_size_mb'],
                 avg_culture_vector_norm=1.0  # Would calculate actual norm
             )
+        
+        try:
+            return await summary_response(request, "feature_stats", build_stats)
             
         except Exception as e:
             logger.error(f"Failed to get feature stats: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to get stats: {str(e)}")
     
     @app.get("/pipeline/status", response_model=PipelineStatus)
-    async def get_pipeline_status():
+    async def get_pipeline_status(request: Request, now: datetime = Depends(_now)):
         """
         Get pipeline status
         """
-        try:
+        async def build_status() -> PipelineStatus:
             # This would track actual pipeline runs
             return PipelineStatus(
                 status="running",
-                last_run=datetime.utcnow() - timedelta(hours=1),
-                next_run=datetime.utcnow() + timedelta(hours=23),
+                last_run=now - timedelta(hours=1),
+                next_run=now + timedelta(hours=23),
                 processed_events=1500,
                 error_message=None
             )
+        
+        try:
+            return await summary_response(request, "pipeline_status", build_status)
             
         except Exception as e:
             logger.error(f"Failed to get pipeline status: {e}")
@@ -186,6 +505,15 @@ def create_rest_app(pipeline: FeaturePipeline) -> FastAPI:
         Get features for a specific company (FEAST-like interface)
         """
         try:
+            # Companies never stored by any replica have no features anywhere
+            if not await pipeline.has_company(company_id):
+                raise HTTPException(status_code=404, detail="Company features not found")
+            
+            # Serve the serialized response cached at write time as-is
+            payload = await pipeline.get_online_payload(company_id, feature_view)
+            if payload:
+                return Response(content=payload, media_type="application/json")
+            
             features = await pipeline.get_online_features([company_id])
             
             if not features:
@@ -193,7 +521,7 @@ def create_rest_app(pipeline: FeaturePipeline) -> FastAPI:
             
             feature = features[0]
             
-            return OnlineFeatureResponse(
+            response = OnlineFeatureResponse(
                 company_id=company_id,
                 features={
                     "user_overlap_score": feature.user_overlap_score,
@@ -208,19 +536,50 @@ def create_rest_app(pipeline: FeaturePipeline) -> FastAPI:
                 ttl_seconds=3600
             )
             
+            return response
+            
         except HTTPException:
             raise
         except Exception as e:
             logger.error(f"Failed to get company features: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to get company features: {str(e)}")
     
-    @app.post("/features/write")
-    async def write_features(features: List[CompanyFeatures]):
+    @app.post("/features/write", openapi_extra=_request_body_schema(_FEATURES_ADAPTER))
+    async def write_features(request: Request):
+        """
+        Queue features to be written to the store in the background
+        """
+        features: List[CompanyFeatures] = await _validate_body(request, _FEATURES_ADAPTER)
+        
+        try:
+            # All or nothing, so a rejected request can simply be retried
+            if write_queue.maxsize - write_queue.qsize() < len(features):
+                raise HTTPException(status_code=503, detail="Write queue is full, retry later")
+            
+            for feature in features:
+                write_queue.put_nowait(feature)
+            
+            return {
+                "status": "queued",
+                "message": f"Queued {len(features)} feature records",
+                "features_queued": len(features)
+            }
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to write features: {e}")
+            raise HTTPException(status_code=500, detail=f"Failed to write features: {str(e)}")
+    
+    @app.post("/features/write/wire")
+    async def write_wire_features(features: List[CompanyFeaturesWire]):
         """
-        Write features to the store
+        Write features whose culture vectors are packed as base64 float32, stored
+        straight from columns without a per-value list
         """
         try:
-            await pipeline._store_features(features)
+            if features:
+                await pipeline._store_features_columnar(_wire_features_to_columns(features), precompute_online=True)
             
             return {
                 "status": "success",
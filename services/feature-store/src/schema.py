@@ -1,8 +1,13 @@
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from typing import List, Dict, Any, Optional, Tuple
+import base64
+import annotated_types
+from pydantic import Base64Bytes, BaseModel, Field, field_serializer, field_validator
 from datetime import datetime
 import numpy as np
 
+# Length of CompanyFeatures.culture_vector
+CULTURE_VECTOR_DIM = 128
+
 class TractionMetrics(BaseModel):
     """Traction metrics for a company"""
     funding_amount: float = Field(ge=0, description="Total funding amount in USD")
@@ -17,14 +22,74 @@ class CompanyFeatures(BaseModel):
     company_id: str = Field(description="Unique company identifier")
     user_overlap_score: float = Field(ge=0.0, le=1.0, description="User overlap score with other companies")
     traction_metrics: TractionMetrics = Field(description="Company traction metrics")
-    culture_vector: List[float] = Field(description="Culture embedding vector", min_items=128, max_items=128)
+    culture_vector: List[float] = Field(description="Culture embedding vector", min_length=CULTURE_VECTOR_DIM, max_length=CULTURE_VECTOR_DIM)
+    match_outcome: Optional[int] = Field(None, description="Match outcome label (0/1)")
+    timestamp: datetime = Field(description="Feature timestamp")
+
+class CompanyFeaturesWire(BaseModel):
+    """Company feature set with the culture vector packed for transfer"""
+    company_id: str = Field(description="Unique company identifier")
+    user_overlap_score: float = Field(ge=0.0, le=1.0, description="User overlap score with other companies")
+    traction_metrics: TractionMetrics = Field(description="Company traction metrics")
+    culture_vector_b64: Base64Bytes = Field(description="Culture embedding vector as base64 of 128 little-endian float32 values")
     match_outcome: Optional[int] = Field(None, description="Match outcome label (0/1)")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Feature timestamp")
+    timestamp: datetime = Field(description="Feature timestamp")
+    
+    @field_validator('culture_vector_b64')
+    @classmethod
+    def _check_culture_vector_size(cls, value: bytes) -> bytes:
+        if len(value) != CULTURE_VECTOR_DIM * np.dtype('<f4').itemsize:
+            raise ValueError(f"culture_vector_b64 must hold {CULTURE_VECTOR_DIM} float32 values")
+        return value
+    
+    @field_serializer('culture_vector_b64')
+    def _encode_culture_vector(self, value: bytes) -> str:
+        # Single-line base64, unlike the MIME encoding Base64Bytes serializes to
+        return base64.b64encode(value).decode('ascii')
+    
+    @property
+    def culture_vector(self) -> np.ndarray:
+        """Culture vector as a read-only float32 view of the decoded bytes"""
+        return np.frombuffer(self.culture_vector_b64, dtype='<f4')
+
+def _field_bounds(field) -> Tuple[Optional[float], Optional[float]]:
+    """(ge, le) constraints of a model field, None where unconstrained"""
+    ge = le = None
+    for constraint in field.metadata:
+        if isinstance(constraint, annotated_types.Ge):
+            ge = constraint.ge
+        elif isinstance(constraint, annotated_types.Le):
+            le = constraint.le
+    return ge, le
+
+# Bounds of the numeric feature fields, read from the models so columnar writes
+# enforce exactly what per-record validation does
+_COLUMN_BOUNDS = {
+    name: bounds
+    for model in (CompanyFeatures, TractionMetrics)
+    for name, field in model.model_fields.items()
+    if (bounds := _field_bounds(field)) != (None, None)
+}
+
+def validate_feature_columns(columns: Dict[str, Any]):
+    """
+    Check feature columns (as stored by the pipeline) against the constraints
+    CompanyFeatures and TractionMetrics enforce on each record, raising ValueError;
+    as in the models, NaN fails every bounded field
+    """
+    culture_vectors = np.asarray(columns['culture_vector'])
+    if culture_vectors.ndim != 2 or culture_vectors.shape[1] != CULTURE_VECTOR_DIM:
+        raise ValueError(f"culture_vector must have exactly {CULTURE_VECTOR_DIM} dimensions")
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    for name, (ge, le) in _COLUMN_BOUNDS.items():
+        values = np.asarray(columns[name], dtype=np.float64)
+        valid = ~np.isnan(values)
+        if ge is not None:
+            valid &= values >= ge
+        if le is not None:
+            valid &= values <= le
+        if not valid.all():
+            raise ValueError(f"{name} must be within [{ge}, {le}]")
 
 class FeatureRequest(BaseModel):
     """Request for feature retrieval"""
@@ -42,6 +107,7 @@ class BatchFeatureRequest(BaseModel):
     start_time: datetime = Field(description="Start time for batch processing")
     end_time: datetime = Field(description="End time for batch processing")
     company_filter: Optional[List[str]] = Field(None, description="Filter by specific companies")
+    precompute_online: bool = Field(False, description="Also cache serialized online responses per company")
 
 class PipelineStatus(BaseModel):
     """Status of the feature pipeline"""
@@ -1,11 +1,13 @@
 import pytest
 import asyncio
+import json
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 import pandas as pd
+import pyarrow as pa
 import numpy as np
 
-from src.pipeline import FeaturePipeline
+from src.pipeline import FeaturePipeline, _aggregate_events, _decode_cached_feature, _encode_cached_feature
 from src.config import Config
 from src.schema import CompanyFeatures, TractionMetrics
 
@@ -18,7 +20,8 @@ def config():
         feature_store_path="/tmp/test_feature_store",
         model_path="/tmp/test_models",
         pipeline_interval_hours=1,
-        batch_size=100
+        batch_size=100,
+        dask_cuda_enabled=False
     )
 
 @pytest.fixture
@@ -28,10 +31,95 @@ async def pipeline(config):
     
     # Mock external dependencies
     pipeline.redis_client = AsyncMock()
+    pipeline.redis_client.pipeline = MagicMock()
+    pipeline.redis_client.pipeline.return_value.__aenter__.return_value = MagicMock(execute=AsyncMock())
     pipeline.db_pool = AsyncMock()
     
     return pipeline
 
+class InMemoryRedis:
+    """The few Redis commands the store and online paths use, backed by dicts"""
+    
+    def __init__(self):
+        self.values = {}
+        self.hashes = {}
+        self.sets = {}
+    
+    async def get(self, key):
+        return self.values.get(key)
+    
+    async def hmget(self, key, fields):
+        fields_by_name = self.hashes.get(key, {})
+        return [fields_by_name.get(field) for field in fields]
+    
+    async def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+    
+    async def sismember(self, key, member):
+        return member in self.sets.get(key, set())
+    
+    def pipeline(self, transaction=True):
+        return InMemoryRedisPipeline(self)
+
+class InMemoryRedisPipeline:
+    """Commands queued on an InMemoryRedis and applied on execute"""
+    
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.commands = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    def hset(self, key, mapping):
+        self.commands.append(lambda: self.redis_client.hashes.setdefault(key, {}).update(mapping))
+    
+    def expire(self, key, seconds):
+        pass
+    
+    def sadd(self, key, *members):
+        self.commands.append(lambda: self.redis_client.sets.setdefault(key, set()).update(members))
+    
+    def set(self, key, value, ex=None):
+        self.commands.append(lambda: self.redis_client.values.__setitem__(key, value))
+    
+    def delete(self, *keys):
+        self.commands.append(lambda: [self.redis_client.values.pop(key, None) for key in keys])
+    
+    async def execute(self):
+        for command in self.commands:
+            command()
+        self.commands = []
+
+@pytest.fixture
+def cpu_writer():
+    """Parquet written with the CPU writer, so tests run without a GPU"""
+    with patch('src.pipeline.cudf') as mock_cudf:
+        mock_cudf.DataFrame.side_effect = RuntimeError("no GPU")
+        yield mock_cudf
+
+def make_columns(company_ids, timestamps, **values):
+    """Feature columns for the given companies and timestamps, overridden by values"""
+    count = len(company_ids)
+    columns = {
+        'company_id': list(company_ids),
+        'user_overlap_score': np.full(count, 0.5),
+        'funding_amount': np.full(count, 1000.0),
+        'employee_count': np.full(count, 10),
+        'growth_rate': np.zeros(count),
+        'market_sentiment': np.zeros(count),
+        'revenue_growth': np.zeros(count),
+        'user_growth': np.zeros(count),
+        'culture_vector': np.full((count, 128), 0.1),
+        'match_outcome': np.zeros(count, dtype=np.int64),
+        'timestamp': list(timestamps)
+    }
+    columns.update({name: np.asarray(value) for name, value in values.items()})
+    return columns
+
 @pytest.mark.asyncio
 async def test_pipeline_initialization(pipeline):
     """Test pipeline initialization"""
@@ -47,34 +135,43 @@ async def test_pipeline_initialization(pipeline):
         assert pipeline.db_pool is not None
 
 @pytest.mark.asyncio
-async def test_fetch_pulse_events(pipeline):
-    """Test fetching pulse events from database"""
-    # Mock database response
-    mock_rows = [
+async def test_stream_pulse_events(pipeline):
+    """Test pulse events are streamed from a server-side cursor in chunks"""
+    rows = [
         {
-            'company': 'TestCorp',
+            'company': company,
             'entities': '{"companies": [{"text": "TestCorp"}]}',
             'sentiment': '{"compound": 0.5}',
             'source': 'news',
             'timestamp': datetime.utcnow(),
-            'content': 'TestCorp raises $10M in Series A funding'
+            'content': f'{company} raises $10M in Series A funding'
         }
+        for company in ('TestCorp', 'OtherCorp', 'ThirdCorp')
     ]
     
-    pipeline.db_pool.acquire.return_value.__aenter__.return_value.fetch.return_value = mock_rows
+    async def cursor(*args, **kwargs):
+        for row in rows:
+            yield row
+    
+    conn = MagicMock()
+    conn.cursor = MagicMock(side_effect=cursor)
+    pipeline.db_pool.acquire = MagicMock()
+    pipeline.db_pool.acquire.return_value.__aenter__.return_value = conn
     
     start_time = datetime.utcnow() - timedelta(hours=24)
     end_time = datetime.utcnow()
     
-    events = await pipeline._fetch_pulse_events(start_time, end_time)
+    with patch('src.pipeline._EVENT_CHUNK_SIZE', 2):
+        chunks = [chunk async for chunk in pipeline._stream_pulse_events(start_time, end_time)]
     
-    assert len(events) == 1
-    assert events[0]['company'] == 'TestCorp'
-    assert events[0]['source'] == 'news'
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert chunks[0][0]['company'] == 'TestCorp'
+    assert chunks[1][0]['source'] == 'news'
+    conn.transaction.assert_called_once()
 
 @pytest.mark.asyncio
-async def test_transform_events_to_features(pipeline):
-    """Test transforming events to features"""
+async def test_features_from_aggregates(pipeline):
+    """Test building features from aggregated events"""
     # Mock events
     events = [
         {
@@ -96,16 +193,18 @@ async def test_transform_events_to_features(pipeline):
     ]
     
     # Mock helper methods
-    pipeline._calculate_user_overlap = AsyncMock(return_value=0.75)
-    pipeline._get_company_data = AsyncMock(return_value={
-        'funding_amount': 10000000.0,
-        'employee_count': 150,
-        'growth_rate': 25.5
+    pipeline._calculate_user_overlaps = AsyncMock(return_value=[0.75])
+    pipeline._get_company_data_bulk = AsyncMock(return_value={
+        'TestCorp': {
+            'funding_amount': 10000000.0,
+            'employee_count': 150,
+            'growth_rate': 25.5
+        }
     })
-    pipeline._generate_culture_vector = AsyncMock(return_value=[0.1] * 128)
-    pipeline._get_match_outcome = AsyncMock(return_value=1)
+    pipeline._generate_culture_vectors = AsyncMock(return_value=[[0.1] * 128])
+    pipeline._get_match_outcomes = AsyncMock(return_value={'TestCorp': 1})
     
-    features = await pipeline._transform_events_to_features(events)
+    features = await pipeline._features_from_aggregates(_aggregate_events(events))
     
     assert len(features) == 1
     assert features[0].company_id == 'TestCorp'
@@ -117,105 +216,83 @@ async def test_transform_events_to_features(pipeline):
     assert features[0].match_outcome == 1
 
 @pytest.mark.asyncio
-async def test_calculate_user_overlap(pipeline):
-    """Test user overlap calculation"""
-    # Mock Redis cache miss
-    pipeline.redis_client.get.return_value = None
-    pipeline.redis_client.setex = AsyncMock()
-    
-    with patch('numpy.random.beta') as mock_beta:
-        mock_beta.return_value = 0.65
-        
-        overlap_score = await pipeline._calculate_user_overlap('TestCorp')
-        
-        assert overlap_score == 0.65
-        pipeline.redis_client.setex.assert_called_once()
-
-@pytest.mark.asyncio
-async def test_calculate_user_overlap_cached(pipeline):
-    """Test user overlap calculation with cache hit"""
-    # Mock Redis cache hit
-    pipeline.redis_client.get.return_value = "0.85"
+async def test_calculate_user_overlaps_cached(pipeline):
+    """Test batched user overlap calculation when every score is cached"""
+    pipeline.redis_client.mget.return_value = ["0.85", "0.15"]
     
-    overlap_score = await pipeline._calculate_user_overlap('TestCorp')
+    overlap_scores = await pipeline._calculate_user_overlaps(['TestCorp', 'OtherCorp'])
     
-    assert overlap_score == 0.85
+    assert overlap_scores == [0.85, 0.15]
+    pipeline.redis_client.pipeline.assert_not_called()
 
 @pytest.mark.asyncio
-async def test_generate_culture_vector(pipeline):
-    """Test culture vector generation"""
-    events = [
-        {
-            'content': 'We are an innovative company focused on collaboration and growth. Our team values quality and transparency.'
-        },
-        {
-            'content': 'Customer satisfaction is our priority. We believe in agile development and diverse teams.'
-        }
-    ]
-    
-    culture_vector = await pipeline._generate_culture_vector(events)
-    
-    assert len(culture_vector) == 128
-    assert all(isinstance(x, float) for x in culture_vector)
+async def test_calculate_user_overlaps(pipeline):
+    """Test batched user overlap calculation with a mix of cache hits and misses"""
+    pipeline.redis_client.mget.return_value = ["0.85", None, None]
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipeline.redis_client.pipeline = MagicMock()
+    pipeline.redis_client.pipeline.return_value.__aenter__.return_value = pipe
+    
+    with patch('src.pipeline._RNG') as mock_rng:
+        mock_rng.beta.return_value = np.array([0.65, 0.25])
+        
+        overlap_scores = await pipeline._calculate_user_overlaps(['TestCorp', 'OtherCorp', 'ThirdCorp'])
     
-    # Check that vector is normalized
-    norm = np.linalg.norm(culture_vector)
-    assert abs(norm - 1.0) < 0.01 or norm == 0.0
+    assert overlap_scores == [0.85, 0.65, 0.25]
+    pipeline.redis_client.mget.assert_called_once()
+    assert pipe.setex.call_count == 2
+    pipe.execute.assert_awaited_once()
 
 @pytest.mark.asyncio
-async def test_get_company_data(pipeline):
-    """Test getting company data from database"""
-    # Mock database response
-    mock_row = {
-        'funding_amount': 5000000.0,
-        'employee_count': 75,
-        'growth_rate': 15.2
-    }
-    
-    pipeline.db_pool.acquire.return_value.__aenter__.return_value.fetchrow.return_value = mock_row
-    
-    company_data = await pipeline._get_company_data('TestCorp')
+async def test_generate_culture_vectors(pipeline):
+    """Test culture vector generation, falling back to the CPU without a GPU"""
+    contents = [
+        'we are an innovative company focused on collaboration and growth. our team values quality and transparency.',
+        'customer satisfaction is our priority. we believe in agile development and diverse teams.',
+        ''
+    ]
     
-    assert company_data['funding_amount'] == 5000000.0
-    assert company_data['employee_count'] == 75
-    assert company_data['growth_rate'] == 15.2
-
-@pytest.mark.asyncio
-async def test_get_company_data_not_found(pipeline):
-    """Test getting company data when not found"""
-    # Mock database response - no data found
-    pipeline.db_pool.acquire.return_value.__aenter__.return_value.fetchrow.return_value = None
+    with patch('src.pipeline.cudf') as mock_cudf:
+        mock_cudf.Series.side_effect = RuntimeError("no GPU")
+        
+        culture_vectors = await pipeline._generate_culture_vectors(contents)
     
-    company_data = await pipeline._get_company_data('UnknownCorp')
+    assert len(culture_vectors) == 3
+    assert all(len(culture_vector) == 128 for culture_vector in culture_vectors)
+    assert all(isinstance(x, float) for x in culture_vectors[0])
     
-    # Should return defaults
-    assert company_data['funding_amount'] == 0.0
-    assert company_data['employee_count'] == 10
-    assert company_data['growth_rate'] == 0.0
+    # Vectors are normalized, and content without keywords gives a zero vector
+    norms = np.linalg.norm(culture_vectors, axis=1)
+    np.testing.assert_allclose(norms, [1.0, 1.0, 0.0], atol=0.01)
 
 @pytest.mark.asyncio
-async def test_get_match_outcome(pipeline):
-    """Test getting match outcome"""
-    # Mock database response - successful matches found
-    mock_row = {'successful_matches': 3}
-    
-    pipeline.db_pool.acquire.return_value.__aenter__.return_value.fetchrow.return_value = mock_row
+async def test_get_company_data_bulk(pipeline):
+    """Test getting company data for several companies in one query"""
+    pipeline.db_pool.fetch.return_value = [
+        {'company_id': 'TestCorp', 'funding_amount': 5000000.0, 'employee_count': 75, 'growth_rate': 15.2}
+    ]
     
-    outcome = await pipeline._get_match_outcome('TestCorp')
+    company_data = await pipeline._get_company_data_bulk(['TestCorp', 'UnknownCorp'])
     
-    assert outcome == 1
+    pipeline.db_pool.fetch.assert_called_once()
+    assert company_data['TestCorp']['funding_amount'] == 5000000.0
+    assert company_data['TestCorp']['employee_count'] == 75
+    # Companies not found get defaults
+    assert company_data['UnknownCorp']['employee_count'] == 10
 
 @pytest.mark.asyncio
-async def test_get_match_outcome_no_matches(pipeline):
-    """Test getting match outcome with no matches"""
-    # Mock database response - no matches found
-    mock_row = {'successful_matches': 0}
-    
-    pipeline.db_pool.acquire.return_value.__aenter__.return_value.fetchrow.return_value = mock_row
+async def test_get_match_outcomes(pipeline):
+    """Test getting match outcomes for several companies in one query"""
+    pipeline.db_pool.fetch.return_value = [
+        {'company_id': 'TestCorp', 'successful_matches': 3},
+        {'company_id': 'OtherCorp', 'successful_matches': 0}
+    ]
     
-    outcome = await pipeline._get_match_outcome('TestCorp')
+    outcomes = await pipeline._get_match_outcomes(['TestCorp', 'OtherCorp'])
     
-    assert outcome == 0
+    pipeline.db_pool.fetch.assert_called_once()
+    assert outcomes == {'TestCorp': 1, 'OtherCorp': 0}
 
 @pytest.mark.asyncio
 async def test_store_features(pipeline):
@@ -236,14 +313,48 @@ async def test_store_features(pipeline):
         )
     ]
     
-    with patch('pandas.DataFrame.to_parquet') as mock_to_parquet:
+    with patch('src.pipeline.cudf') as mock_cudf:
         await pipeline._store_features(features)
         
-        # Verify parquet file was written
-        mock_to_parquet.assert_called_once()
+        # Verify parquet file was written by the GPU writer, ordered by company
+        gdf = mock_cudf.DataFrame.return_value
+        gdf.sort_values.assert_called_once_with(['company_id', 'timestamp'])
+        gdf.sort_values.return_value.to_parquet.assert_called_once()
         
         # Verify Redis cache was updated
-        pipeline.redis_client.setex.assert_called()
+        pipe = pipeline.redis_client.pipeline.return_value.__aenter__.return_value
+        pipe.hset.assert_called_once()
+        pipe.execute.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_store_features_columnar(pipeline, cpu_writer):
+    """Test storing features given as numpy columns"""
+    timestamp = datetime.utcnow()
+    columns = make_columns(['TestCorp', 'OtherCorp'], [timestamp, timestamp], employee_count=[150, 10])
+    
+    with patch('src.pipeline.pq.write_table') as mock_write_table:
+        await pipeline._store_features_columnar(columns)
+        
+        mock_write_table.assert_called_once()
+        assert mock_write_table.call_args.kwargs['compression'] == 'snappy'
+        
+        # Culture vectors are stored as one fixed-size float32 list column
+        table = mock_write_table.call_args.args[0]
+        assert table.schema.field('culture_vector').type == pa.list_(pa.float32(), 128)
+        
+        # Cached payloads must round-trip through the schema
+        pipe = pipeline.redis_client.pipeline.return_value.__aenter__.return_value
+        cache_key, = pipe.hset.call_args.args
+        cached_features = pipe.hset.call_args.kwargs['mapping']
+        assert cache_key == "features:latest"
+        assert set(cached_features) == {'TestCorp', 'OtherCorp'}
+        cached = _decode_cached_feature(cached_features['TestCorp'])
+        assert cached.traction_metrics.employee_count == 150
+        assert cached.culture_vector == [0.1] * 128
+        assert cached.timestamp == timestamp
+    
+    # Caches of read results see the store changed
+    assert pipeline.write_version == 1
 
 @pytest.mark.asyncio
 async def test_get_online_features(pipeline):
@@ -263,46 +374,176 @@ async def test_get_online_features(pipeline):
         timestamp=datetime.utcnow()
     )
     
-    pipeline.redis_client.get.return_value = cached_feature.json()
+    pipeline.redis_client.hmget.return_value = [_encode_cached_feature(json.loads(cached_feature.model_dump_json()))]
     
     features = await pipeline.get_online_features(['TestCorp'])
     
+    pipeline.redis_client.hmget.assert_called_once_with("features:latest", ['TestCorp'])
     assert len(features) == 1
     assert features[0].company_id == 'TestCorp'
     assert features[0].user_overlap_score == 0.75
 
 @pytest.mark.asyncio
-async def test_get_feature_stats(pipeline):
+async def test_get_online_features_storage_fallback(pipeline, tmp_path, cpu_writer):
+    """Test cache misses are served with the latest stored record of each company"""
+    pipeline.feature_store_path = tmp_path
+    start = datetime(2024, 1, 1)
+    
+    await pipeline._store_features_columnar(make_columns(
+        ['TestCorp', 'OtherCorp', 'TestCorp'],
+        [start + timedelta(days=1), start, start],
+        employee_count=[10, 20, 30]
+    ))
+    
+    pipeline.redis_client.hmget.return_value = [None, None, None]
+    pipeline.redis_client.sismember.return_value = False
+    
+    features = await pipeline.get_online_features(['TestCorp', 'MissingCorp', 'OtherCorp'])
+    
+    assert await pipeline.has_company('TestCorp')
+    assert not await pipeline.has_company('MissingCorp')
+    
+    assert [feature.company_id for feature in features] == ['TestCorp', 'OtherCorp']
+    assert features[0].traction_metrics.employee_count == 10
+    assert features[1].traction_metrics.employee_count == 20
+
+@pytest.mark.asyncio
+async def test_online_payload_follows_writes(pipeline, tmp_path, cpu_writer):
+    """Test a company's served online payload never outlives a newer write"""
+    pipeline.feature_store_path = tmp_path
+    pipeline.redis_client = InMemoryRedis()
+    start = datetime(2024, 1, 1)
+    
+    # Precomputed payloads are served as written
+    await pipeline._store_features_columnar(
+        make_columns(['TestCorp'], [start], employee_count=[10]), precompute_online=True
+    )
+    payload = await pipeline.get_online_payload('TestCorp', 'default')
+    assert json.loads(payload)['features']['employee_count'] == 10
+    
+    # A write that does not precompute drops the old payload, leaving the latest features
+    await pipeline._store_features_columnar(
+        make_columns(['TestCorp'], [start + timedelta(days=1)], employee_count=[20])
+    )
+    assert await pipeline.get_online_payload('TestCorp', 'default') is None
+    features = await pipeline.get_online_features(['TestCorp'])
+    assert features[0].traction_metrics.employee_count == 20
+    
+    # A precomputing write replaces it
+    await pipeline._store_features_columnar(
+        make_columns(['TestCorp'], [start + timedelta(days=2)], employee_count=[30]), precompute_online=True
+    )
+    payload = await pipeline.get_online_payload('TestCorp', 'default')
+    assert json.loads(payload)['features']['employee_count'] == 30
+
+@pytest.mark.asyncio
+async def test_has_company_across_replicas(pipeline, config, tmp_path, cpu_writer):
+    """Test companies stored by one replica are known to every replica sharing Redis"""
+    pipeline.feature_store_path = tmp_path
+    pipeline.redis_client = InMemoryRedis()
+    other_replica = FeaturePipeline(config)
+    other_replica.redis_client = pipeline.redis_client
+    
+    assert not await other_replica.has_company('TestCorp')
+    
+    await pipeline._store_features_columnar(make_columns(['TestCorp'], [datetime(2024, 1, 1)]))
+    
+    assert await other_replica.has_company('TestCorp')
+    assert not await other_replica.has_company('MissingCorp')
+
+@pytest.mark.asyncio
+async def test_get_historical_features(pipeline, tmp_path, cpu_writer):
+    """Test historical features are filtered by company and time range in storage"""
+    pipeline.feature_store_path = tmp_path
+    start = datetime(2024, 1, 1)
+    
+    await pipeline._store_features_columnar(make_columns(
+        ['TestCorp', 'TestCorp', 'OtherCorp'],
+        [start, start + timedelta(days=10), start + timedelta(days=1)],
+        employee_count=[10, 20, 30]
+    ))
+    
+    features = [
+        feature async for feature in pipeline.iter_historical(
+            company_ids=['TestCorp'],
+            start_time=start,
+            end_time=start + timedelta(days=5)
+        )
+    ]
+    
+    assert len(features) == 1
+    assert features[0].company_id == 'TestCorp'
+    assert features[0].timestamp == start
+    assert features[0].traction_metrics.employee_count == 10
+
+@pytest.mark.asyncio
+async def test_store_features_keeps_earlier_batches(pipeline, tmp_path, cpu_writer):
+    """Test every store writes its own part file rather than replacing the day's rows"""
+    pipeline.feature_store_path = tmp_path
+    pipeline._parquet_files = []
+    start = datetime(2024, 1, 1)
+    
+    await pipeline._store_features_columnar(make_columns(['TestCorp'], [start]))
+    await pipeline._store_features_columnar(make_columns(['TestCorp', 'OtherCorp'], [start + timedelta(hours=1)] * 2))
+    
+    assert len(list(tmp_path.glob("features_*.parquet"))) == 2
+    
+    features = [
+        feature async for feature in pipeline.iter_historical(
+            company_ids=['TestCorp', 'OtherCorp'],
+            start_time=start,
+            end_time=start + timedelta(days=1)
+        )
+    ]
+    assert sorted((feature.company_id, feature.timestamp) for feature in features) == [
+        ('OtherCorp', start + timedelta(hours=1)),
+        ('TestCorp', start),
+        ('TestCorp', start + timedelta(hours=1))
+    ]
+    
+    # Companies are counted once however many files hold them
+    stats = await pipeline.get_feature_stats()
+    assert stats['total_companies'] == 2
+    assert stats['feature_count'] == 3
+
+@pytest.mark.asyncio
+async def test_iter_historical_unreadable_file(pipeline, tmp_path):
+    """Test an unreadable feature file fails the stream before any record is yielded"""
+    parquet_path = tmp_path / "features_2024-01-01.parquet"
+    parquet_path.write_bytes(b"not parquet")
+    pipeline._parquet_files = [parquet_path]
+    
+    stream = pipeline.iter_historical(
+        company_ids=['TestCorp'],
+        start_time=datetime(2024, 1, 1),
+        end_time=datetime(2024, 1, 2)
+    )
+    
+    with pytest.raises(pa.ArrowInvalid):
+        await stream.__anext__()
+
+@pytest.mark.asyncio
+async def test_get_feature_stats(pipeline, tmp_path):
     """Test getting feature statistics"""
-    with patch('pathlib.Path.glob') as mock_glob, \
-         patch('pandas.read_parquet') as mock_read_parquet, \
-         patch('pathlib.Path.stat') as mock_stat:
-        
-        # Mock parquet files
-        mock_file = MagicMock()
-        mock_file.stat.return_value.st_size = 1024 * 1024  # 1MB
-        mock_file.stat.return_value.st_mtime = datetime.utcnow().timestamp()
-        mock_glob.return_value = [mock_file]
-        
-        # Mock DataFrame
-        mock_df = pd.DataFrame({
-            'company_id': ['TestCorp', 'TestCorp', 'AnotherCorp'],
-            'user_overlap_score': [0.75, 0.80, 0.65]
-        })
-        mock_read_parquet.return_value = mock_df
-        
-        stats = await pipeline.get_feature_stats()
-        
-        assert stats['total_companies'] == 2  # Unique companies
-        assert stats['feature_count'] == 3
-        assert stats['storage_size_mb'] == 1.0
-        assert stats['parquet_files'] == 1
+    pipeline.feature_store_path = tmp_path
+    parquet_path = tmp_path / "features_2024-01-01.parquet"
+    pd.DataFrame({
+        'company_id': ['TestCorp', 'TestCorp', 'AnotherCorp'],
+        'user_overlap_score': [0.75, 0.80, 0.65]
+    }).to_parquet(parquet_path, index=False)
+    
+    stats = await pipeline.get_feature_stats()
+    
+    assert stats['total_companies'] == 2  # Unique companies
+    assert stats['feature_count'] == 3
+    assert stats['storage_size_mb'] == parquet_path.stat().st_size / (1024 * 1024)
+    assert stats['parquet_files'] == 1
 
 @pytest.mark.asyncio
 async def test_process_pulse_events_integration(pipeline):
     """Test full pulse events processing pipeline"""
     # Mock all dependencies
-    pipeline._fetch_pulse_events = AsyncMock(return_value=[
+    events = [
         {
             'company': 'TestCorp',
             'entities': '{"companies": [{"text": "TestCorp"}]}',
@@ -311,9 +552,14 @@ async def test_process_pulse_events_integration(pipeline):
             'timestamp': datetime.utcnow(),
             'content': 'TestCorp raises funding'
         }
-    ])
+    ]
+    
+    async def stream_pulse_events(start_time, end_time):
+        yield events
+    
+    pipeline._stream_pulse_events = MagicMock(side_effect=stream_pulse_events)
     
-    pipeline._transform_events_to_features = AsyncMock(return_value=[
+    pipeline._features_from_aggregates = AsyncMock(return_value=[
         CompanyFeatures(
             company_id='TestCorp',
             user_overlap_score=0.75,
@@ -329,8 +575,8 @@ async def test_process_pulse_events_integration(pipeline):
         )
     ])
     
-    pipeline._process_with_merlin = AsyncMock(side_effect=lambda x: x)
-    pipeline._store_features = AsyncMock()
+    pipeline._process_with_merlin_columnar = AsyncMock()
+    pipeline._store_features_columnar = AsyncMock()
     
     start_time = datetime.utcnow() - timedelta(hours=24)
     end_time = datetime.utcnow()
@@ -338,10 +584,21 @@ async def test_process_pulse_events_integration(pipeline):
     processed_count = await pipeline.process_pulse_events(start_time, end_time)
     
     assert processed_count == 1
-    pipeline._fetch_pulse_events.assert_called_once_with(start_time, end_time)
-    pipeline._transform_events_to_features.assert_called_once()
-    pipeline._process_with_merlin.assert_called_once()
-    pipeline._store_features.assert_called_once()
+    pipeline._stream_pulse_events.assert_called_once_with(start_time, end_time)
+    pipeline._features_from_aggregates.assert_called_once()
+    
+    # Events are aggregated per company before features are built
+    company_aggregates = pipeline._features_from_aggregates.call_args.args[0]
+    assert company_aggregates.index.tolist() == ['TestCorp']
+    assert company_aggregates.loc['TestCorp', 'funding_mentions'] == 1
+    pipeline._process_with_merlin_columnar.assert_called_once()
+    pipeline._store_features_columnar.assert_called_once()
+    
+    # Merlin and storage share one columnar copy of the features
+    columns = pipeline._store_features_columnar.call_args.args[0]
+    assert columns is pipeline._process_with_merlin_columnar.call_args.args[0]
+    assert columns['company_id'] == ['TestCorp']
+    assert columns['culture_vector'].shape == (1, 128)
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
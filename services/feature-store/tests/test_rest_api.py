@@ -1,9 +1,14 @@
 import pytest
+import base64
+import json
+import time
+import msgpack
+import numpy as np
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime, timedelta
 
-from src.rest_api import create_rest_app
+from src.rest_api import create_rest_app, _sentry_traces_sampler
 from src.pipeline import FeaturePipeline
 from src.config import Config
 from src.schema import CompanyFeatures, TractionMetrics
@@ -19,6 +24,9 @@ def mock_pipeline():
     pipeline.process_pulse_events = AsyncMock()
     pipeline.get_feature_stats = AsyncMock()
     pipeline._store_features = AsyncMock()
+    pipeline._store_features_columnar = AsyncMock()
+    pipeline.has_company = AsyncMock(return_value=True)
+    pipeline.get_online_payload = AsyncMock(return_value=None)
     
     return pipeline
 
@@ -55,6 +63,31 @@ def test_health_check(client):
     assert data["service"] == "feature-store"
     assert "timestamp" in data
 
+def test_cors(client):
+    """Test cross-origin requests and preflights are allowed from any origin"""
+    response = client.options("/features/online", headers={
+        "Origin": "https://app.example.com",
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "content-type"
+    })
+    
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "https://app.example.com"
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert "POST" in response.headers["access-control-allow-methods"]
+    assert response.headers["access-control-allow-headers"] == "content-type"
+    
+    response = client.get("/health", headers={"Origin": "https://app.example.com"})
+    
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "https://app.example.com"
+    assert "access-control-allow-origin" not in client.get("/health").headers
+
+def test_sentry_traces_sampler():
+    """Test health checks are never traced and other requests are sampled"""
+    assert _sentry_traces_sampler({"asgi_scope": {"path": "/health"}}) == 0.0
+    assert 0.0 < _sentry_traces_sampler({"asgi_scope": {"path": "/features/online"}}) < 1.0
+
 def test_get_online_features(client, mock_pipeline, sample_feature):
     """Test getting online features"""
     mock_pipeline.get_online_features.return_value = [sample_feature]
@@ -72,6 +105,25 @@ def test_get_online_features(client, mock_pipeline, sample_feature):
     assert data["features"][0]["company_id"] == "TestCorp"
     assert data["features"][0]["user_overlap_score"] == 0.75
     assert "metadata" in data
+    assert data["metadata"]["latency_ms"] > 0
+    assert int(response.headers["x-latency-us"]) >= 0
+
+def test_get_online_features_msgpack(client, mock_pipeline, sample_feature):
+    """Test online features are sent as MessagePack when accepted"""
+    mock_pipeline.get_online_features.return_value = [sample_feature]
+    
+    response = client.post(
+        "/features/online",
+        json={"company_ids": ["TestCorp"]},
+        headers={"Accept": "application/msgpack"}
+    )
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/msgpack"
+    data = msgpack.unpackb(response.content)
+    assert data["features"][0]["company_id"] == "TestCorp"
+    assert data["features"][0]["culture_vector"] == [0.1] * 128
+    assert data["metadata"]["feature_count"] == 1
 
 def test_get_online_features_empty(client, mock_pipeline):
     """Test getting online features with no results"""
@@ -89,24 +141,47 @@ def test_get_online_features_empty(client, mock_pipeline):
     assert data["metadata"]["feature_count"] == 0
 
 def test_get_historical_features(client, mock_pipeline, sample_feature):
-    """Test getting historical features"""
-    mock_pipeline.get_online_features.return_value = [sample_feature]
+    """Test historical features are streamed as NDJSON"""
+    async def iter_historical(**kwargs):
+        yield sample_feature
+        yield sample_feature
+    
+    mock_pipeline.iter_historical = MagicMock(side_effect=iter_historical)
     
     start_time = datetime.utcnow() - timedelta(days=7)
     end_time = datetime.utcnow()
     
     params = {
-        "company_ids": ["TestCorp"],
         "start_time": start_time.isoformat(),
         "end_time": end_time.isoformat()
     }
     
-    response = client.post("/features/historical", params=params)
+    response = client.post("/features/historical", params=params, json={"company_ids": ["TestCorp"]})
     
     assert response.status_code == 200
-    data = response.json()
-    assert len(data["features"]) == 1
-    assert "time_range" in data["metadata"]
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.content.splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["company_id"] == "TestCorp"
+    assert mock_pipeline.iter_historical.call_args.kwargs["company_ids"] == ["TestCorp"]
+
+def test_get_historical_features_storage_error(client, mock_pipeline):
+    """Test storage that cannot be read fails the request instead of streaming nothing"""
+    async def iter_historical(**kwargs):
+        raise OSError("unreadable parquet file")
+        yield
+    
+    mock_pipeline.iter_historical = MagicMock(side_effect=iter_historical)
+    
+    params = {
+        "start_time": (datetime.utcnow() - timedelta(days=7)).isoformat(),
+        "end_time": datetime.utcnow().isoformat()
+    }
+    
+    response = client.post("/features/historical", params=params, json={"company_ids": ["TestCorp"]})
+    
+    assert response.status_code == 500
+    assert "unreadable parquet file" in response.json()["detail"]
 
 def test_trigger_batch_processing(client, mock_pipeline):
     """Test triggering batch processing"""
@@ -142,6 +217,27 @@ def test_get_feature_stats(client, mock_pipeline):
     assert data["feature_count"] == 1000
     assert data["storage_size_mb"] == 25.5
 
+def test_get_feature_stats_cached(client, mock_pipeline):
+    """Test feature statistics are reused and revalidated by ETag"""
+    mock_pipeline.get_feature_stats.return_value = {
+        'total_companies': 50,
+        'feature_count': 1000,
+        'last_updated': datetime.utcnow(),
+        'storage_size_mb': 25.5,
+        'parquet_files': 5
+    }
+    
+    response = client.get("/features/stats")
+    etag = response.headers["etag"]
+    
+    assert client.get("/features/stats").json() == response.json()
+    
+    response = client.get("/features/stats", headers={"If-None-Match": etag})
+    
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    mock_pipeline.get_feature_stats.assert_called_once()
+
 def test_get_pipeline_status(client, mock_pipeline):
     """Test getting pipeline status"""
     response = client.get("/pipeline/status")
@@ -165,6 +261,17 @@ def test_get_company_features(client, mock_pipeline, sample_feature):
     assert data["features"]["user_overlap_score"] == 0.75
     assert data["ttl_seconds"] == 3600
 
+def test_get_company_features_precomputed(client, mock_pipeline):
+    """Test serving a company's precomputed online payload"""
+    mock_pipeline.get_online_payload.return_value = b'{"company_id":"TestCorp","ttl_seconds":3600}'
+    
+    response = client.post("/features/company/TestCorp")
+    
+    assert response.status_code == 200
+    assert response.json()["company_id"] == "TestCorp"
+    mock_pipeline.get_online_payload.assert_called_once_with("TestCorp", "default")
+    mock_pipeline.get_online_features.assert_not_called()
+
 def test_get_company_features_not_found(client, mock_pipeline):
     """Test getting features for non-existent company"""
     mock_pipeline.get_online_features.return_value = []
@@ -175,18 +282,109 @@ def test_get_company_features_not_found(client, mock_pipeline):
     data = response.json()
     assert "not found" in data["detail"].lower()
 
-def test_write_features(client, mock_pipeline, sample_feature):
+def test_get_company_features_unknown(client, mock_pipeline):
+    """Test companies never stored are rejected without reading the stores"""
+    mock_pipeline.has_company.return_value = False
+    
+    response = client.post("/features/company/UnknownCorp")
+    
+    assert response.status_code == 404
+    mock_pipeline.get_online_payload.assert_not_called()
+    mock_pipeline.get_online_features.assert_not_called()
+
+def test_write_features(mock_pipeline, sample_feature):
     """Test writing features"""
-    features_data = [sample_feature.dict()]
+    features_data = [sample_feature.model_dump(mode='json')]
+    
+    # Queued features are stored by the background flusher, at the latest on shutdown
+    with TestClient(create_rest_app(mock_pipeline)) as client:
+        response = client.post("/features/write", json=features_data)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "queued"
+        assert data["features_queued"] == 1
+    
+    mock_pipeline._store_features.assert_called_once()
+    stored_features, = mock_pipeline._store_features.call_args.args
+    assert [feature.company_id for feature in stored_features] == ['TestCorp']
+
+def test_write_features_store_retried(mock_pipeline, sample_feature, monkeypatch):
+    """Test a queued batch that fails to store is retried, and counted once it gives up"""
+    monkeypatch.setattr('src.rest_api._WRITE_RETRY_SECONDS', 0)
+    features_data = [sample_feature.model_dump(mode='json')]
+    
+    # Stored on the second attempt
+    mock_pipeline._store_features.side_effect = [Exception("Redis down"), None]
+    with TestClient(create_rest_app(mock_pipeline)) as client:
+        assert client.post("/features/write", json=features_data).status_code == 200
+    
+    assert mock_pipeline._store_features.call_count == 2
+    
+    # Never stored
+    mock_pipeline._store_features.reset_mock()
+    mock_pipeline._store_features.side_effect = Exception("Redis down")
+    with TestClient(create_rest_app(mock_pipeline)) as client:
+        assert client.post("/features/write", json=features_data).status_code == 200
+        
+        # Wait for the flusher to give up on the batch
+        for _ in range(100):
+            write_failures = client.get("/health").json()["write_failures"]
+            if write_failures["batches"]:
+                break
+            time.sleep(0.05)
+    
+    assert mock_pipeline._store_features.call_count == 3
+    assert write_failures == {"batches": 1, "features": 1}
+
+def test_write_features_queue_full(mock_pipeline, sample_feature, monkeypatch):
+    """Test writes are rejected when the queue cannot take the whole batch"""
+    monkeypatch.setattr('src.rest_api._WRITE_QUEUE_MAXSIZE', 1)
+    client = TestClient(create_rest_app(mock_pipeline))
+    features_data = [sample_feature.model_dump(mode='json')] * 2
     
     response = client.post("/features/write", json=features_data)
     
+    assert response.status_code == 503
+    mock_pipeline._store_features.assert_not_called()
+
+def test_write_features_invalid(client, mock_pipeline, sample_feature):
+    """Test invalid feature bodies are rejected like other request bodies"""
+    features_data = [sample_feature.model_dump(mode='json')]
+    features_data[0]['culture_vector'] = [0.1] * 3
+    
+    response = client.post("/features/write", json=features_data)
+    
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", 0, "culture_vector"]
+    mock_pipeline._store_features.assert_not_called()
+
+def test_write_wire_features(client, mock_pipeline):
+    """Test writing features with packed culture vectors"""
+    culture_vector = np.arange(128, dtype='<f4')
+    features_data = [{
+        "company_id": "TestCorp",
+        "user_overlap_score": 0.75,
+        "traction_metrics": {
+            "funding_amount": 10000000.0,
+            "employee_count": 150,
+            "growth_rate": 25.5,
+            "market_sentiment": 0.4
+        },
+        "culture_vector_b64": base64.b64encode(culture_vector.tobytes()).decode(),
+        "match_outcome": 1,
+        "timestamp": datetime.utcnow().isoformat()
+    }]
+    
+    response = client.post("/features/write/wire", json=features_data)
+    
     assert response.status_code == 200
-    data = response.json()
-    assert data["status"] == "success"
-    assert data["features_written"] == 1
+    assert response.json()["features_written"] == 1
     
-    mock_pipeline._store_features.assert_called_once()
+    columns = mock_pipeline._store_features_columnar.call_args.args[0]
+    assert columns['company_id'] == ["TestCorp"]
+    assert columns['culture_vector'].dtype == np.float32
+    np.testing.assert_array_equal(columns['culture_vector'][0], culture_vector)
 
 def test_api_error_handling(client, mock_pipeline):
     """Test API error handling"""
@@ -1,10 +1,12 @@
 import pytest
+import numpy as np
 from datetime import datetime
 from pydantic import ValidationError
 
 from src.schema import (
     TractionMetrics, CompanyFeatures, FeatureRequest, 
-    FeatureResponse, OnlineFeatureRequest, OnlineFeatureResponse
+    FeatureResponse, OnlineFeatureRequest, OnlineFeatureResponse,
+    validate_feature_columns
 )
 
 def test_traction_metrics_valid():
@@ -64,7 +66,8 @@ def test_company_features_valid():
         user_overlap_score=0.75,
         traction_metrics=traction_metrics,
         culture_vector=[0.1] * 128,
-        match_outcome=1
+        match_outcome=1,
+        timestamp=datetime.utcnow()
     )
     
     assert features.company_id == "TestCorp"
@@ -88,7 +91,8 @@ def test_company_features_validation():
             company_id="TestCorp",
             user_overlap_score=1.5,  # Should be between 0 and 1
             traction_metrics=traction_metrics,
-            culture_vector=[0.1] * 128
+            culture_vector=[0.1] * 128,
+            timestamp=datetime.utcnow()
         )
     
     # Test culture vector wrong length
@@ -97,7 +101,17 @@ def test_company_features_validation():
             company_id="TestCorp",
             user_overlap_score=0.75,
             traction_metrics=traction_metrics,
-            culture_vector=[0.1] * 64  # Should be 128 elements
+            culture_vector=[0.1] * 64,  # Should be 128 elements
+            timestamp=datetime.utcnow()
+        )
+    
+    # Test timestamp missing (callers stamp features themselves)
+    with pytest.raises(ValidationError):
+        CompanyFeatures(
+            company_id="TestCorp",
+            user_overlap_score=0.75,
+            traction_metrics=traction_metrics,
+            culture_vector=[0.1] * 128
         )
 
 def test_feature_request_valid():
@@ -136,7 +150,8 @@ def test_feature_response():
             company_id="TestCorp",
             user_overlap_score=0.75,
             traction_metrics=traction_metrics,
-            culture_vector=[0.1] * 128
+            culture_vector=[0.1] * 128,
+            timestamp=datetime.utcnow()
         )
     ]
     
@@ -191,7 +206,8 @@ def test_json_serialization():
         user_overlap_score=0.75,
         traction_metrics=traction_metrics,
         culture_vector=[0.1] * 128,
-        match_outcome=1
+        match_outcome=1,
+        timestamp=datetime.utcnow()
     )
     
     # Test JSON serialization
@@ -204,5 +220,33 @@ def test_json_serialization():
     assert features_copy.company_id == features.company_id
     assert features_copy.user_overlap_score == features.user_overlap_score
 
+def test_validate_feature_columns():
+    """Test columnar validation enforces the same constraints as the models"""
+    def columns(**values):
+        return {
+            'user_overlap_score': np.array([0.75, 0.25]),
+            'funding_amount': np.array([10000000.0, 0.0]),
+            'employee_count': np.array([150, 10]),
+            'market_sentiment': np.array([0.4, -0.2]),
+            'culture_vector': np.full((2, 128), 0.1, dtype=np.float32),
+            **values
+        }
+    
+    validate_feature_columns(columns())
+    
+    # Out of bounds, as rejected by TractionMetrics and CompanyFeatures
+    with pytest.raises(ValueError, match="employee_count"):
+        validate_feature_columns(columns(employee_count=np.array([150, -10])))
+    with pytest.raises(ValueError, match="market_sentiment"):
+        validate_feature_columns(columns(market_sentiment=np.array([0.4, 1.5])))
+    
+    # NaN fails bounded fields
+    with pytest.raises(ValueError, match="user_overlap_score"):
+        validate_feature_columns(columns(user_overlap_score=np.array([0.75, np.nan])))
+    
+    # Culture vectors must have exactly 128 dimensions
+    with pytest.raises(ValueError, match="culture_vector"):
+        validate_feature_columns(columns(culture_vector=np.full((2, 1), 0.1)))
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,5 @@
+-- Trigram index so the feature pipeline's substring company lookups
+-- (name ILIKE '%' || id || '%') can use an index instead of scanning companies
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_companies_name_trgm ON companies USING gin (name gin_trgm_ops);